@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the priority queues in `ssds`.
+
+Runs realistic workloads against every priority queue, and against a
+`heapq` baseline, and reports the results as JSON. Run it with::
+
+    python -m benchmarks --sizes 10000 100000 --output results.json
+
+and pass `--baseline results.json` on a later run to fail if any result
+has regressed. See `python -m benchmarks --help` for every option.
+"""
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""The priority queues that the benchmarks are run against.
+
+Each implementation is given as a pair of functions: `make(capacity)`,
+which creates an empty minimum priority queue for integer items below
+`capacity`, and `build(pairs, capacity)`, which creates one holding the
+given `(item, priority)` pairs. The `heapq` baseline has no entry here, as
+every scenario drives `heapq` directly.
+"""
+
+from collections import namedtuple
+
+from ssds import (ArrayHeapPQ, CompactHeapPQ, DaryHeapPQ, MinMaxHeapPQ, NumericHeapPQ,
+                  PairingHeapPQ, RadixHeapPQ)
+
+BASELINE = 'heapq'
+"""str: The name of the `heapq` baseline."""
+
+Implementation = namedtuple('Implementation', ['make', 'build'])
+"""A way of creating an empty or filled priority queue."""
+
+IMPLEMENTATIONS = {
+    'ArrayHeapPQ': Implementation(
+        lambda capacity: ArrayHeapPQ(),
+        lambda pairs, capacity: ArrayHeapPQ.from_iterable(pairs)),
+    'CompactHeapPQ': Implementation(
+        lambda capacity: CompactHeapPQ(),
+        lambda pairs, capacity: CompactHeapPQ.from_iterable(pairs)),
+    'DaryHeapPQ(4)': Implementation(
+        lambda capacity: DaryHeapPQ(arity=4),
+        lambda pairs, capacity: DaryHeapPQ.from_iterable(pairs, arity=4)),
+    'MinMaxHeapPQ': Implementation(
+        lambda capacity: MinMaxHeapPQ(),
+        lambda pairs, capacity: MinMaxHeapPQ.from_iterable(pairs)),
+    'NumericHeapPQ': Implementation(
+        lambda capacity: NumericHeapPQ(capacity),
+        lambda pairs, capacity: NumericHeapPQ.from_iterable(pairs, capacity=capacity)),
+    'PairingHeapPQ': Implementation(
+        lambda capacity: PairingHeapPQ(),
+        lambda pairs, capacity: PairingHeapPQ.from_iterable(pairs)),
+    'RadixHeapPQ': Implementation(
+        lambda capacity: RadixHeapPQ(),
+        lambda pairs, capacity: RadixHeapPQ.from_iterable(pairs)),
+}
+"""dict: Maps the name of each implementation to how to create it."""
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Runs the benchmarks and checks them against a baseline.
+
+Every case (a scenario, an implementation and a size) runs in a fresh
+process, so that the peak memory of one case does not hide that of the
+next.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+
+from benchmarks.implementations import BASELINE, IMPLEMENTATIONS
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.timing import Histogram
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+METRICS = ['ops_per_sec', 'relative_to_heapq']
+"""list: The results that can be checked for regressions."""
+
+
+def run_case(scenario: str, implementation: str, size: int, seed: int) -> dict:
+    """Runs one case and returns its results.
+
+    Args:
+        scenario (str): The name of the scenario.
+        implementation (str): The name of the implementation, or
+            `BASELINE` for `heapq`.
+        size (int): The size of the scenario.
+        seed (int): The seed of the scenario's random input.
+
+    Returns:
+        dict: The results of the case. Its operations are the steps of the
+        scenario, and its peak memory is how far the peak resident set size
+        of the process grew while running, or None where that cannot be
+        measured.
+    """
+    functions = SCENARIOS[scenario]
+    data = functions.prepare(size, seed)
+    histogram = Histogram()
+
+    before = _peak_memory()
+    if implementation == BASELINE:
+        result = functions.run_heapq(data, histogram)
+    else:
+        result = functions.run_pq(IMPLEMENTATIONS[implementation], data, histogram)
+    after = _peak_memory()
+
+    seconds = result.pop('elapsed_ns') / 1e9
+    return {
+        'scenario': scenario,
+        'implementation': implementation,
+        'size': size,
+        'ops': result['steps'],
+        'seconds': seconds,
+        'ops_per_sec': result.pop('steps') / seconds,
+        'latency_ns': histogram.summary(),
+        'peak_memory_bytes': None if before is None else after - before,
+        **result,
+    }
+
+
+def run_all(scenarios: list, implementations: list, sizes: list, seed=0,
+            repeat=1, log=None) -> list:
+    """Runs every combination of scenario, implementation and size.
+
+    The `heapq` baseline is always run, and each result gets the ratio of
+    its throughput to that of the baseline.
+
+    Args:
+        scenarios (list): The names of the scenarios to run.
+        implementations (list): The names of the implementations to run.
+        sizes (list): The sizes to run each scenario at.
+        seed (:obj:`int`, optional): The seed of the random inputs.
+        repeat (:obj:`int`, optional): The number of times to run each
+            case. The fastest run is kept.
+        log (:obj:`file`, optional): Where to report progress to.
+
+    Returns:
+        list: The results of every case.
+
+    Raises:
+        RuntimeError: If an implementation gets a different checksum than
+            the baseline.
+    """
+    names = [BASELINE] + [name for name in implementations if name != BASELINE]
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for scenario in scenarios:
+        for size in sizes:
+            baseline = None
+            for name in names:
+                best = None
+                for _ in range(repeat):
+                    with context.Pool(1) as pool:
+                        result = pool.apply(run_case, (scenario, name, size, seed))
+                    if best is None or result['ops_per_sec'] > best['ops_per_sec']:
+                        best = result
+                if baseline is None:
+                    baseline = best
+                elif best['checksum'] != baseline['checksum']:
+                    raise RuntimeError('%s gave a different result than %s on %s'
+                                       % (name, BASELINE, scenario))
+                best['relative_to_heapq'] = best['ops_per_sec'] / baseline['ops_per_sec']
+                results.append(best)
+                if log is not None:
+                    print('%-10s %-14s %10d %14.0f ops/s %6.2fx heapq'
+                          % (scenario, name, size, best['ops_per_sec'],
+                             best['relative_to_heapq']), file=log)
+    return results
+
+
+def find_regressions(results: list, baseline: list, metric='relative_to_heapq',
+                     tolerance=0.1) -> list:
+    """Compares results against a baseline from an earlier run.
+
+    Cases that are missing from the baseline are skipped.
+
+    Args:
+        results (list): The results to check.
+        baseline (list): The results to check against.
+        metric (:obj:`str`, optional): The result to compare, out of
+            `METRICS`. Higher is better.
+        tolerance (:obj:`float`, optional): The fraction by which a result
+            may fall below the baseline.
+
+    Returns:
+        list: A message describing each regression.
+    """
+    expected = {(r['scenario'], r['implementation'], r['size']): r[metric]
+                for r in baseline}
+    regressions = []
+    for result in results:
+        key = (result['scenario'], result['implementation'], result['size'])
+        if key in expected and result[metric] < expected[key] * (1 - tolerance):
+            regressions.append('%s/%s/%d: %s fell from %.3g to %.3g'
+                               % (key + (metric, expected[key], result[metric])))
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Runs the benchmarks from the command line.
+
+    Args:
+        argv (:obj:`list`, optional): The arguments. Defaults to
+            `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status; 1 if any result regressed, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks the ssds priority queues against heapq.')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS),
+                        default=list(SCENARIOS))
+    parser.add_argument('--implementations', nargs='+', choices=list(IMPLEMENTATIONS),
+                        default=list(IMPLEMENTATIONS),
+                        help='the heapq baseline is always run as well')
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)),
+                        default=[10_000, 100_000],
+                        help='scenario sizes, e.g. 1e5 1e6 1e7')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per case; the fastest is kept')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--baseline', help='a JSON report to check for regressions against')
+    parser.add_argument('--metric', choices=METRICS, default='relative_to_heapq',
+                        help='the result compared against the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='the fraction a result may fall below the baseline')
+    args = parser.parse_args(argv)
+
+    results = run_all(args.scenarios, args.implementations, args.sizes, args.seed,
+                      args.repeat, log=sys.stderr)
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'seed': args.seed,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)['results']
+        regressions = find_regressions(results, baseline, args.metric, args.tolerance)
+        for message in regressions:
+            print('REGRESSION', message, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def _peak_memory():
+    """Returns the peak resident set size of this process, in bytes.
+
+    Returns:
+        int: The peak resident set size, or None where it is unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, while macOS reports bytes
+    return peak if sys.platform == 'darwin' else 1024 * peak
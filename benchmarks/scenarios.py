@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""Contains the workloads that the priority queues are benchmarked on.
+
+Every scenario has a `prepare` function, which generates its input from a
+size and a seed, and two runners, one driving an `ssds` priority queue
+and one driving `heapq`. Both runners do the same work on the same input,
+one step at a time, and return a dictionary holding the number of steps,
+the time they took, and a checksum that every implementation must agree
+on.
+
+All priorities are unique non-negative integers that never move in front
+of the last removed priority, so that the monotone `RadixHeapPQ` can run
+every scenario and ties cannot make the implementations diverge. They are
+kept below :math:`2^{53}` so that they survive being stored as floats.
+"""
+
+from array import array
+from collections import namedtuple
+from heapq import heapify, heappop, heappush, heapreplace
+from random import Random
+from time import perf_counter_ns
+
+from benchmarks.timing import drive
+
+Scenario = namedtuple('Scenario', ['prepare', 'run_pq', 'run_heapq'])
+"""A workload, and the functions that run it."""
+
+_MAX_WEIGHT = 100
+"""int: The largest edge weight in the Dijkstra graphs."""
+
+_MAX_DELAY = 1000
+"""int: The largest delay before a simulated event fires."""
+
+_TOP_K = 1000
+"""int: The number of items kept by the top-k stream."""
+
+
+# = = = = = = = = = = = = =
+# DIJKSTRA
+# = = = = = = = = = = = = =
+
+def prepare_dijkstra(size: int, seed: int) -> dict:
+    """Generates a random graph with `size` vertices and `3 * size` edges.
+
+    Every vertex has an edge to the next one, so that every vertex can be
+    reached from vertex 0, and two edges to random vertices. The graph is
+    stored as compressed adjacency arrays to keep large sizes in memory.
+    """
+    rng = Random(seed)
+    offsets = array('q', range(0, 3 * size + 1, 3))
+    targets = array('i', bytes(4 * 3 * size))
+    weights = array('i', bytes(4 * 3 * size))
+    for u in range(size):
+        targets[3 * u] = (u + 1) % size
+        targets[3 * u + 1] = rng.randrange(size)
+        targets[3 * u + 2] = rng.randrange(size)
+    for e in range(3 * size):
+        weights[e] = rng.randint(1, _MAX_WEIGHT)
+    return {'size': size, 'offsets': offsets, 'targets': targets, 'weights': weights}
+
+
+def run_dijkstra_pq(implementation, data: dict, histogram) -> dict:
+    """Finds the shortest paths from vertex 0 using decrease-key.
+
+    One step settles one vertex and relaxes its edges.
+    """
+    size = data['size']
+    offsets = data['offsets']
+    targets = data['targets']
+    weights = data['weights']
+    dist = [-1] * size
+    settled = bytearray(size)
+    pq = implementation.make(size)
+    add = pq.add
+    remove = pq.remove
+    change_priority = pq.change_priority
+
+    def step():
+        u = remove()
+        settled[u] = 1
+        du = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if settled[v]:
+                continue
+            # Priorities are made unique by breaking ties on the vertex
+            nd = du + weights[e]
+            old = dist[v]
+            if old < 0:
+                dist[v] = nd
+                add(v, nd * size + v)
+            elif nd < old:
+                dist[v] = nd
+                change_priority(v, nd * size + v)
+
+    dist[0] = 0
+    pq.add(0, 0)
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'checksum': sum(dist)}
+
+
+def run_dijkstra_heapq(data: dict, histogram) -> dict:
+    """Finds the shortest paths from vertex 0, skipping stale entries.
+
+    One step settles one vertex and relaxes its edges.
+    """
+    size = data['size']
+    offsets = data['offsets']
+    targets = data['targets']
+    weights = data['weights']
+    dist = [-1] * size
+    settled = bytearray(size)
+    heap = [(0, 0)]
+
+    def step():
+        while True:
+            du, u = heappop(heap)
+            if not settled[u]:
+                break
+        settled[u] = 1
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if settled[v]:
+                continue
+            nd = du + weights[e]
+            old = dist[v]
+            if old < 0 or nd < old:
+                dist[v] = nd
+                heappush(heap, (nd, v))
+
+    dist[0] = 0
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'checksum': sum(dist)}
+
+
+# = = = = = = = = = = = = =
+# DISCRETE-EVENT SIMULATION
+# = = = = = = = = = = = = =
+
+def prepare_simulation(size: int, seed: int) -> dict:
+    """Generates the random draws for a simulation of `size` events.
+
+    A tenth as many events as will be processed are pending at the start.
+    Every processed event schedules a new one, and every fourth one
+    brings a random earlier event forward, if it is still pending and
+    due later than its new time.
+    """
+    rng = Random(seed)
+    initial = max(1, size // 10)
+    return {
+        'size': size,
+        'initial': array('q', (rng.randrange(_MAX_DELAY) for _ in range(initial))),
+        'delays': array('q', (rng.randint(1, _MAX_DELAY) for _ in range(size))),
+        'reschedules': array('d', (rng.random() if i % 4 == 0 else -1.0 for i in range(size))),
+        'reschedule_delays': array('q', (rng.randint(1, _MAX_DELAY) for _ in range(size))),
+    }
+
+
+def run_simulation_pq(implementation, data: dict, histogram) -> dict:
+    """Runs the simulation, bringing events forward with `change_priority`.
+
+    One step processes one event.
+    """
+    size = data['size']
+    initial = data['initial']
+    delays = data['delays']
+    reschedules = data['reschedules']
+    rescheduleDelays = data['reschedule_delays']
+    capacity = len(initial) + size
+    # The key of every pending event, or -1, with ties broken on the event
+    keys = array('q', [-1]) * capacity
+    state = [len(initial), 0, 0]  # the next event, the next step, the checksum
+    pq = implementation.build([(event, time * capacity + event)
+                               for event, time in enumerate(initial)], capacity)
+    for event, time in enumerate(initial):
+        keys[event] = time * capacity + event
+    add = pq.add
+    remove = pq.remove
+    change_priority = pq.change_priority
+
+    def step():
+        event = remove()
+        key = keys[event]
+        keys[event] = -1
+        now = key // capacity
+        new, s, checksum = state
+        state[0] = new + 1
+        state[1] = s + 1
+        state[2] = checksum + key
+        keys[new] = (now + delays[s]) * capacity + new
+        add(new, keys[new])
+        r = reschedules[s]
+        if r >= 0:
+            target = int(r * new)
+            key = (now + rescheduleDelays[s]) * capacity + target
+            if key < keys[target]:
+                keys[target] = key
+                change_priority(target, key)
+
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'checksum': state[2]}
+
+
+def run_simulation_heapq(data: dict, histogram) -> dict:
+    """Runs the simulation, skipping the stale entries of rescheduled events.
+
+    One step processes one event.
+    """
+    size = data['size']
+    initial = data['initial']
+    delays = data['delays']
+    reschedules = data['reschedules']
+    rescheduleDelays = data['reschedule_delays']
+    capacity = len(initial) + size
+    keys = array('q', [-1]) * capacity
+    state = [len(initial), 0, 0]
+    heap = [(time * capacity + event, event) for event, time in enumerate(initial)]
+    heapify(heap)
+    for event, time in enumerate(initial):
+        keys[event] = time * capacity + event
+
+    def step():
+        while True:
+            key, event = heappop(heap)
+            if keys[event] == key:
+                break
+        keys[event] = -1
+        now = key // capacity
+        new, s, checksum = state
+        state[0] = new + 1
+        state[1] = s + 1
+        state[2] = checksum + key
+        keys[new] = (now + delays[s]) * capacity + new
+        heappush(heap, (keys[new], new))
+        r = reschedules[s]
+        if r >= 0:
+            target = int(r * new)
+            key = (now + rescheduleDelays[s]) * capacity + target
+            if key < keys[target]:
+                keys[target] = key
+                heappush(heap, (key, target))
+
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'checksum': state[2]}
+
+
+# = = = = = = = = = = = = =
+# TOP-K STREAMING
+# = = = = = = = = = = = = =
+
+def prepare_top_k(size: int, seed: int) -> dict:
+    """Generates a stream of `size` items with random scores."""
+    rng = Random(seed)
+    # Scores stay below 2 ** 53 up to 10 ** 7 items, so that queues storing
+    # them as floats keep them exact
+    scores = array('q', (rng.randrange(2 ** 29) * size + i for i in range(size)))
+    return {'size': size, 'scores': scores}
+
+
+def run_top_k_pq(implementation, data: dict, histogram) -> dict:
+    """Keeps the best `_TOP_K` items of the stream in a minimum queue.
+
+    One step offers one item of the stream.
+    """
+    size = data['size']
+    scores = data['scores']
+    k = min(_TOP_K, size)
+    pq = implementation.make(size)
+    add = pq.add
+    remove = pq.remove
+    get = pq.get
+    state = [0, 0]  # the next item, and the number of items kept
+
+    def step():
+        item, kept = state
+        state[0] = item + 1
+        score = scores[item]
+        if kept < k:
+            add(item, score)
+            state[1] = kept + 1
+        elif score > scores[get()]:
+            remove()
+            add(item, score)
+
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'checksum': sum(pq.remove_many(k))}
+
+
+def run_top_k_heapq(data: dict, histogram) -> dict:
+    """Keeps the best `_TOP_K` items of the stream with `heapreplace`.
+
+    One step offers one item of the stream.
+    """
+    size = data['size']
+    scores = data['scores']
+    k = min(_TOP_K, size)
+    heap = []
+    state = [0]
+
+    def step():
+        item = state[0]
+        state[0] = item + 1
+        score = scores[item]
+        if len(heap) < k:
+            heappush(heap, (score, item))
+        elif score > heap[0][0]:
+            heapreplace(heap, (score, item))
+
+    elapsed = drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed,
+            'checksum': sum(item for _, item in heap)}
+
+
+# = = = = = = = = = = = = =
+# BULK LOAD
+# = = = = = = = = = = = = =
+
+def prepare_bulk_load(size: int, seed: int) -> dict:
+    """Generates `size` items with shuffled, unique priorities."""
+    priorities = array('q', range(size))
+    Random(seed).shuffle(priorities)
+    return {'size': size, 'priorities': priorities}
+
+
+def run_bulk_load_pq(implementation, data: dict, histogram) -> dict:
+    """Builds the queue with `from_iterable`, then removes every item.
+
+    One step removes one item. The time taken includes the build.
+    """
+    size = data['size']
+    pairs = list(enumerate(data['priorities']))
+    state = [0, 0]  # the number of items removed, and the checksum
+
+    start = perf_counter_ns()
+    pq = implementation.build(pairs, size)
+    build = perf_counter_ns() - start
+    del pairs
+    remove = pq.remove
+
+    def step():
+        removed, checksum = state
+        state[0] = removed + 1
+        state[1] = checksum + removed * remove()
+
+    elapsed = build + drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'build_ns': build, 'checksum': state[1]}
+
+
+def run_bulk_load_heapq(data: dict, histogram) -> dict:
+    """Builds the heap with `heapify`, then pops every item.
+
+    One step pops one item. The time taken includes the build.
+    """
+    size = data['size']
+    heap = [(priority, item) for item, priority in enumerate(data['priorities'])]
+    state = [0, 0]
+
+    start = perf_counter_ns()
+    heapify(heap)
+    build = perf_counter_ns() - start
+
+    def step():
+        removed, checksum = state
+        state[0] = removed + 1
+        state[1] = checksum + removed * heappop(heap)[1]
+
+    elapsed = build + drive(step, size, histogram)
+    return {'steps': size, 'elapsed_ns': elapsed, 'build_ns': build, 'checksum': state[1]}
+
+
+SCENARIOS = {
+    'dijkstra': Scenario(prepare_dijkstra, run_dijkstra_pq, run_dijkstra_heapq),
+    'simulation': Scenario(prepare_simulation, run_simulation_pq, run_simulation_heapq),
+    'top_k': Scenario(prepare_top_k, run_top_k_pq, run_top_k_heapq),
+    'bulk_load': Scenario(prepare_bulk_load, run_bulk_load_pq, run_bulk_load_heapq),
+}
+"""dict: Maps the name of each scenario to its functions."""
@@ -1,12 +1,24 @@
 # -*- coding: utf-8 -*-
-from enum import Enum
+import pickle
+import struct
+import sys
+from array import array
+from heapq import heappop, heappush
+from operator import itemgetter
+
 from ssds.abc.PriorityQueue import PriorityQueue
 
+_REBUILD_RATIO = 2
+"""int: Batches at least `1 / _REBUILD_RATIO` of the heap size re-heapify."""
+
+_DUPLICATES = ('error', 'keep_best', 'keep_first')
+"""tuple: The ways `merge` and `union` can handle an item in both queues."""
+
+_MAGIC = b'SSPQ'
+"""bytes: The first bytes of every serialized queue."""
 
-class _Relation(Enum):
-    PARENT = 'PARENT'
-    CHILD_LEFT = 'CHILD_LEFT'
-    CHILD_RIGHT = 'CHILD_RIGHT'
+_HEADER = struct.Struct('<4sBBIcQ')
+"""struct.Struct: Magic, version, is_max, arity, item format, and size."""
 
 
 class ArrayHeapPQ(PriorityQueue):
@@ -32,6 +44,9 @@ class ArrayHeapPQ(PriorityQueue):
     'b'
     """
 
+    _arity = 2
+    """int: The number of children of each node in the heap."""
+
     # = = = = = = = = = = = = =
     # CONSTRUCTOR
     # = = = = = = = = = = = = =
@@ -44,6 +59,212 @@ class ArrayHeapPQ(PriorityQueue):
         self._locations = {}
         self._max = is_max
 
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False):
+        """Builds a priority queue from a collection of items.
+
+        Runs in :math:`\\mathcal{O}(n)` time by heapifying the items
+        bottom-up, rather than adding them one at a time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        is_max : bool, default=False
+            Selects whether the priority queue should dequeue the item with
+            the maximum priority (instead of the minimum priority).
+
+        Returns
+        -------
+        ArrayHeapPQ
+            A new priority queue containing the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once, or if `items` and
+            `priorities` differ in length.
+
+        Examples
+        --------
+        >>> from ssds import ArrayHeapPQ
+        >>> pq = ArrayHeapPQ.from_iterable(['a', 'b', 'c'], [3, 1, 2])
+        >>> pq.remove()
+        'b'
+        """
+        pq = cls(is_max)
+        pq._build(cls._pairs(items, priorities))
+        return pq
+
+    @classmethod
+    def union(cls, *queues, duplicates='error'):
+        """Builds a priority queue holding the items of several queues.
+
+        The first queue is copied as-is, along with its arity if the class
+        takes one, and the others are merged into the copy as by `merge`.
+        The given queues are left unchanged.
+
+        Parameters
+        ----------
+        *queues : ArrayHeapPQ
+            The priority queues to combine. Must all have the same value of
+            `is_max`.
+
+        duplicates : {'error', 'keep_best', 'keep_first'}, default='error'
+            What to do with an item that is in more than one queue; see
+            `merge`.
+
+        Returns
+        -------
+        ArrayHeapPQ
+            A new priority queue containing the items of every queue.
+
+        Raises
+        ------
+        ValueError
+            If the queues differ in `is_max`, or if an item is in more than
+            one queue and `duplicates` is 'error'.
+
+        Examples
+        --------
+        >>> from ssds import ArrayHeapPQ
+        >>> a = ArrayHeapPQ.from_iterable(['a', 'b'], [3, 1])
+        >>> b = ArrayHeapPQ.from_iterable(['a', 'c'], [0, 2])
+        >>> pq = ArrayHeapPQ.union(a, b, duplicates='keep_best')
+        >>> pq.remove_many(3)
+        ['a', 'b', 'c']
+        """
+        if not queues:
+            return cls()
+        first = queues[0]
+        pq = cls._empty(first._max, first._arity)
+        pq._nodes = list(first._nodes)
+        pq._locations = dict(first._locations)
+        if first._arity != pq._arity:
+            pq._heapify()
+        for queue in queues[1:]:
+            pq.merge(queue, duplicates)
+        return pq
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Restores a priority queue written by `to_bytes`.
+
+        The heap is restored as it was stored, without any sifting. A class
+        that takes an arity is given the stored one; otherwise, a heap
+        stored with a different arity is re-heapified in linear time.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized priority queue.
+
+        Returns
+        -------
+        ArrayHeapPQ
+            The restored priority queue.
+
+        Raises
+        ------
+        ValueError
+            If `data` is not a serialized priority queue, or is truncated.
+
+        Notes
+        -----
+        Items other than integers are unpickled, so `data` must only come
+        from a trusted source.
+        """
+        data = memoryview(data)
+        if len(data) < _HEADER.size:
+            raise ValueError('data is not a serialized priority queue')
+        magic, version, is_max, arity, item_format, size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != 1 or item_format not in (b'q', b'p'):
+            raise ValueError('data is not a serialized priority queue')
+
+        start = _HEADER.size
+        end = start + 16 * size if item_format == b'q' else start + 8 * size
+        if len(data) < end:
+            raise ValueError('data is not a serialized priority queue')
+        priorities = array('d')
+        priorities.frombytes(data[start:start + 8 * size])
+        start += 8 * size
+        if item_format == b'q':
+            items = array('q')
+            items.frombytes(data[start:start + 8 * size])
+            if sys.byteorder == 'big':
+                items.byteswap()
+        else:
+            try:
+                items = pickle.loads(data[start:])
+            except Exception:
+                items = None
+            if not isinstance(items, list) or len(items) != size:
+                raise ValueError('data is not a serialized priority queue')
+        if sys.byteorder == 'big':
+            priorities.byteswap()
+
+        pq = cls._empty(bool(is_max), arity)
+        nodes = pq._nodes
+        nodes.extend(zip(items, priorities))
+        try:
+            pq._locations = {nodes[i][0]: i for i in range(1, len(nodes))}
+        except TypeError:
+            raise ValueError('data is not a serialized priority queue') from None
+        if len(pq._locations) != size:
+            raise ValueError('data is not a serialized priority queue')
+        if arity != pq._arity:
+            pq._heapify()
+        return pq
+
+    @classmethod
+    def load(cls, path):
+        """Restores a priority queue saved by `save`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to read.
+
+        Returns
+        -------
+        ArrayHeapPQ
+            The restored priority queue.
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a serialized priority queue.
+
+        Notes
+        -----
+        Items other than integers are unpickled, so the file must only come
+        from a trusted source.
+        """
+        with open(path, 'rb') as fh:
+            return cls.from_bytes(fh.read())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_nodes']
+        del state['_locations']
+        nodes = self._nodes[1:]
+        state['items'] = list(map(itemgetter(0), nodes))
+        state['priorities'] = list(map(itemgetter(1), nodes))
+        return state
+
+    def __setstate__(self, state):
+        items = state.pop('items')
+        priorities = state.pop('priorities')
+        self.__dict__.update(state)
+        self._nodes = [None]
+        self._nodes.extend(zip(items, priorities))
+        self._locations = dict(zip(items, range(1, len(items) + 1)))
+
     # = = = = = = = = = = = = =
     # PUBLIC METHODS
     # = = = = = = = = = = = = =
@@ -67,14 +288,13 @@ class ArrayHeapPQ(PriorityQueue):
         """
         # TODO: Assess whether an infinitely positive/negative priority
         #   would cause the code to malfunction
-        if self.contains(item):
+        if item in self._locations:
             # TODO: Maybe change this to simply update the priority?
             raise ValueError('item already present')
         if self._max:
             priority *= -1
-        self._nodes.append((item, priority))
-        self._locations[item] = len(self._nodes) - 1
-        self._swim(len(self._nodes) - 1)
+        self._nodes.append(None)
+        self._sift_up(len(self._nodes) - 1, (item, priority))
 
     def contains(self, item) -> bool:
         """Returns whether the item is in the priority queue or not.
@@ -111,6 +331,43 @@ class ArrayHeapPQ(PriorityQueue):
         self._validateSize()
         return self._nodes[1][0]
 
+    def peek_k(self, k: int, with_priorities=False) -> list:
+        """Returns the first `k` items without removing them.
+
+        Walks the heap from the root with a small auxiliary heap of
+        candidate nodes, taking :math:`\\mathcal{O}(k\\log(k))` time.
+
+        Parameters
+        ----------
+        k : int
+            The number of items to return. If the queue holds fewer items,
+            all of them are returned.
+
+        with_priorities : bool, default=False
+            Selects whether to return `(item, priority)` pairs instead of
+            just the items.
+
+        Returns
+        -------
+        list
+            The first `k` items (or pairs), in the order `remove` would
+            return them.
+        """
+        nodes = self._nodes
+        found = []
+        frontier = [(nodes[1][1], 1)] if k > 0 and len(nodes) > 1 else []
+        while frontier and len(found) < k:
+            index = heappop(frontier)[1]
+            found.append(nodes[index])
+            for child in self._child_range(index):
+                heappush(frontier, (nodes[child][1], child))
+
+        if not with_priorities:
+            return [node[0] for node in found]
+        if self._max:
+            return [(item, -priority) for item, priority in found]
+        return found
+
     def remove(self):
         """Removes and returns the first item in the priority queue.
 
@@ -127,16 +384,7 @@ class ArrayHeapPQ(PriorityQueue):
             The foremost item in the priority queue.
         """
         self._validateSize()
-        smallest = None
-        if self.size() == 1:
-            smallest = self._nodes.pop(1)
-        else:
-            self._swap(1, len(self._nodes) - 1)
-            smallest = self._nodes.pop(len(self._nodes) - 1)
-            self._swim(1)
-
-        self._locations.pop(smallest[0])
-        return smallest[0]
+        return self._pop()
 
     def size(self) -> int:
         """Returns the number of items in the priority queue.
@@ -173,209 +421,700 @@ class ArrayHeapPQ(PriorityQueue):
             raise ValueError('item %s does not exist' % str(item))
         if self._max:
             priority *= -1
-        self._nodes[index] = (self._nodes[index][0], priority)
-        self._swim(index)
+        self._sift(index, (item, priority))
 
-    # = = = = = = = = = = = = =
-    # PRIVATE METHODS
-    # = = = = = = = = = = = = =
+    def push_or_update(self, item, priority: float) -> None:
+        """Adds an item, or changes its priority if it is already present.
 
-    # - - - - - - - - - - - - -
-    # Parent/Child Utility Methods
-    # - - - - - - - - - - - - -
+        Looks the item up once, instead of once in `contains` and again in
+        `add` or `change_priority`.
+
+        Parameters
+        ----------
+        item
+            The item to add or modify the priority of.
+
+        priority : float
+            The priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if self._max:
+            priority *= -1
+        index = self._locations.get(item, None)
+        if index is None:
+            self._nodes.append(None)
+            self._sift_up(len(self._nodes) - 1, (item, priority))
+        else:
+            self._sift(index, (item, priority))
 
-    def _has_relation(self, index: int, relation: _Relation) -> bool:
-        """Checks to see whether a node has a certain relation.
+    def push_or_improve(self, item, priority: float) -> bool:
+        """Adds an item, or moves it towards the front of the queue.
 
-        Determines whether the node at the given index has a given relation
-        or not. If the provided Relation is invalid, will return `False` by
-        default.
+        An item that is already present only has its priority changed if
+        the new priority would place it further forwards (e.g. a smaller
+        priority in a minimum priority queue). This is the relaxation step
+        of Dijkstra's algorithm.
 
         Parameters
         ----------
-        index : int
-            The index whose relation is to be queried.
+        item
+            The item to add or modify the priority of.
 
-        relation : ssds.ArrayHeapPQ._Relation
-            The relation to be queried about.
+        priority : float
+            The priority to offer the item.
 
         Returns
         -------
         bool
-            True if the relation node exists, False otherwise.
-        """
-        if relation is _Relation.PARENT:
-            return self._get_relation_index(index, relation) != 0
-        elif relation is _Relation.CHILD_LEFT:
-            return self._is_valid_index(self._get_relation_index(index, relation))
-        elif relation is _Relation.CHILD_RIGHT:
-            return self._is_valid_index(self._get_relation_index(index, relation))
+            True if the item was added or its priority changed;
+            False otherwise.
+        """
+        if self._max:
+            priority *= -1
+        index = self._locations.get(item, None)
+        if index is None:
+            self._nodes.append(None)
+            index = len(self._nodes) - 1
+        elif priority >= self._nodes[index][1]:
+            return False
+        self._sift_up(index, (item, priority))
+        return True
+
+    def decrease_key(self, item, priority: float) -> None:
+        """Lowers the priority of the given item.
+
+        Only sifts in the direction implied by the change: up for a minimum
+        priority queue, and down for a maximum priority queue.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : float
+            The new priority, which must not exceed the current one.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item isn't in the queue, or if `priority` is greater than
+            its current priority.
+        """
+        index = self._locations.get(item, None)
+        if index is None:
+            raise ValueError('item %s does not exist' % str(item))
+        current = self._nodes[index][1]
+        if self._max:
+            if -priority < current:
+                raise ValueError('priority is greater than the current priority')
+            self._sift_down(index, (item, -priority))
         else:
+            if priority > current:
+                raise ValueError('priority is greater than the current priority')
+            self._sift_up(index, (item, priority))
+
+    def increase_key(self, item, priority: float) -> None:
+        """Raises the priority of the given item.
+
+        Only sifts in the direction implied by the change: down for a
+        minimum priority queue, and up for a maximum priority queue.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : float
+            The new priority, which must not be less than the current one.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item isn't in the queue, or if `priority` is less than its
+            current priority.
+        """
+        index = self._locations.get(item, None)
+        if index is None:
+            raise ValueError('item %s does not exist' % str(item))
+        current = self._nodes[index][1]
+        if self._max:
+            if -priority > current:
+                raise ValueError('priority is less than the current priority')
+            self._sift_up(index, (item, -priority))
+        else:
+            if priority < current:
+                raise ValueError('priority is less than the current priority')
+            self._sift_down(index, (item, priority))
+
+    def discard(self, item) -> bool:
+        """Removes the given item from the priority queue, if present.
+
+        The last node is moved into the item's slot and sifted in whichever
+        direction it needs to go.
+
+        Parameters
+        ----------
+        item
+            The item to remove.
+
+        Returns
+        -------
+        bool
+            True if `item` was in the priority queue; False otherwise.
+        """
+        index = self._locations.pop(item, None)
+        if index is None:
             return False
+        nodes = self._nodes
+        last = nodes.pop()
+        if index < len(nodes):
+            self._sift(index, last)
+        return True
 
-    def _get_relation_index(self, index: int, relation: _Relation) -> int:
-        """Gets the index of the specified relation.
+    # - - - - - - - - - - - - -
+    # Batch Methods
+    # - - - - - - - - - - - - -
 
-        If the given Relation is invalid, returns 0.
+    def add_many(self, items, priorities=None) -> None:
+        """Adds a collection of items to the priority queue.
 
-        Notes
-        -----
-        Might return an out-of-bounds index.
+        Sifts each item into place when the batch is small compared to the
+        queue, and re-heapifies the whole queue otherwise. Either nothing
+        or everything is added.
 
         Parameters
         ----------
-        index : int
-            The index whose relation's index is to be queried.
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
 
-        relation : ssds.ArrayHeapPQ._Relation
-            The relation to be queried about.
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
 
         Returns
         -------
-        int
-            The index of the specified relation of the given index.
-        """
-        if relation is _Relation.PARENT:
-            return index // 2
-        elif relation is _Relation.CHILD_LEFT:
-            return index * 2 + 1
-        elif relation is _Relation.CHILD_RIGHT:
-            return index * 2
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If an item is already present or appears more than once, or if
+            `items` and `priorities` differ in length.
+        """
+        pairs = self._pairs(items, priorities)
+        locations = self._locations
+        if self._max:
+            pairs = [(item, -priority) for item, priority in pairs]
+        batch = {item for item, _ in pairs}
+        if len(batch) != len(pairs) or not batch.isdisjoint(locations):
+            raise ValueError('item already present')
+
+        nodes = self._nodes
+        if self._should_rebuild(len(pairs)):
+            for node in pairs:
+                locations[node[0]] = len(nodes)
+                nodes.append(node)
+            self._heapify()
         else:
-            return 0
+            sift_up = self._sift_up
+            for node in pairs:
+                nodes.append(None)
+                sift_up(len(nodes) - 1, node)
 
-    def _get_relation_priority(self, index: int, relation: _Relation) -> float:
-        """Gets the priority value of the specified relation.
+    def change_priority_many(self, items, priorities=None) -> None:
+        """Changes the priorities of a collection of items.
 
-        Notes
-        -----
-        If the relation is invalid (e.g. does not exist), will return
-        positive infinity for the priority.
+        Sifts each item into place when the batch is small compared to the
+        queue, and re-heapifies the whole queue otherwise. Either nothing
+        or everything is changed.
 
         Parameters
         ----------
-        index : int
-            The index whose relation's priority is to be queried.
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
 
-        relation : ssds.ArrayHeapPQ._Relation
-            The relation to be queried about.
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
 
         Returns
         -------
-        float
-            The priority value of the specified relation to the given index.
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If an item isn't in the queue, or if `items` and `priorities`
+            differ in length.
         """
-        if not self._has_relation(index, relation):
-            return float('inf')
+        pairs = self._pairs(items, priorities)
+        locations = self._locations
+        for item, _ in pairs:
+            if item not in locations:
+                raise ValueError('item %s does not exist' % str(item))
+        if self._max:
+            pairs = [(item, -priority) for item, priority in pairs]
+
+        if self._should_rebuild(len(pairs)):
+            nodes = self._nodes
+            for node in pairs:
+                nodes[locations[node[0]]] = node
+            self._heapify()
         else:
-            return self._nodes[self._get_relation_index(index, relation)][1]
+            sift = self._sift
+            for node in pairs:
+                sift(locations[node[0]], node)
 
-    def _should_swap(self, index: int, relation: _Relation) -> bool:
-        """Determines if the node should be swapped with its relation.
+    def discard_many(self, items) -> int:
+        """Removes the given items from the priority queue, if present.
 
-        The method will return 'true' if the relation exists and comparison
-        of the priorities shows that the two should be swapped.
+        Discards each item separately when there are few compared to the
+        queue, and filters the nodes and re-heapifies otherwise.
 
         Parameters
         ----------
-        index : int
-            The index whose relation's "swappiness" is to be queried.
+        items : iterable
+            The items to remove.
+
+        Returns
+        -------
+        int
+            The number of items that were in the priority queue.
+        """
+        locations = self._locations
+        present = {item for item in items if item in locations}
+        if not self._should_rebuild(len(present)):
+            discard = self.discard
+            for item in present:
+                discard(item)
+            return len(present)
+
+        nodes = [None]
+        nodes.extend(node for node in self._nodes[1:] if node[0] not in present)
+        self._nodes = nodes
+        self._locations = {nodes[i][0]: i for i in range(1, len(nodes))}
+        self._heapify()
+        return len(present)
+
+    def merge(self, other: 'ArrayHeapPQ', duplicates='error') -> None:
+        """Adds every item of another priority queue to this one.
+
+        Appends the other queue's nodes and re-heapifies in linear time
+        when they are many compared to this queue, and sifts each of them
+        into place otherwise. `other` is left unchanged.
+
+        Merging a queue into itself shares every item, so it raises a
+        ValueError if `duplicates` is 'error' and the queue is not empty,
+        and changes nothing otherwise.
 
-        relation : ssds.ArrayHeapPQ._Relation
-            The relation to be queried about.
+        Parameters
+        ----------
+        other : ArrayHeapPQ
+            The priority queue to take the items of. Must have the same
+            value of `is_max`.
+
+        duplicates : {'error', 'keep_best', 'keep_first'}, default='error'
+            What to do with an item that is in both queues: raise a
+            ValueError, keep whichever priority comes first in the queue,
+            or keep the priority in this queue.
 
         Returns
         -------
-        bool
-            True if the node should be swapped with its relation;
-            False otherwise.
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the queues differ in `is_max`, or if they share an item and
+            `duplicates` is 'error'. Nothing is merged in either case.
         """
-        nodePriority = self._nodes[index][1]
-        relationPriority = self._get_relation_priority(index, relation)
-        if self._has_relation(index, relation):
-            if relation is _Relation.PARENT:
-                return nodePriority < relationPriority
-            else:
-                return nodePriority > relationPriority
+        if duplicates not in _DUPLICATES:
+            raise ValueError('duplicates must be one of %s' % ', '.join(_DUPLICATES))
+        if other is self:
+            if duplicates == 'error' and len(self._nodes) > 1:
+                raise ValueError('item already present')
+            return
+        if other._max != self._max:
+            raise ValueError('cannot merge a minimum and a maximum priority queue')
+
+        locations = self._locations
+        nodes = self._nodes
+        incoming = other._nodes[1:]
+        updates = []
+        if not locations.keys().isdisjoint(other._locations):
+            if duplicates == 'error':
+                raise ValueError('item already present')
+            added = [node for node in incoming if node[0] not in locations]
+            if duplicates == 'keep_best':
+                updates = [node for node in incoming if node[0] in locations
+                           and node[1] < nodes[locations[node[0]]][1]]
+            incoming = added
+
+        if self._should_rebuild(len(incoming) + len(updates)):
+            for node in updates:
+                nodes[locations[node[0]]] = node
+            for node in incoming:
+                locations[node[0]] = len(nodes)
+                nodes.append(node)
+            self._heapify()
         else:
-            return False
+            # Kept priorities only ever move towards the front
+            sift_up = self._sift_up
+            for node in updates:
+                sift_up(locations[node[0]], node)
+            for node in incoming:
+                nodes.append(None)
+                sift_up(len(nodes) - 1, node)
+
+    def drain(self):
+        """Removes the items one by one, yielding them in priority order.
+
+        Items are only removed as the generator is advanced, so stopping
+        early leaves the rest of the items in the queue.
+
+        Yields
+        ------
+        tuple
+            The next `(item, priority)` pair in the priority queue.
+        """
+        sign = -1 if self._max else 1
+        locations = self._locations
+        while len(self._nodes) > 1:
+            nodes = self._nodes
+            smallest = nodes[1]
+            last = nodes.pop()
+            del locations[smallest[0]]
+            if len(nodes) > 1:
+                self._sift_down(1, last)
+            yield smallest[0], sign * smallest[1]
+            locations = self._locations
+
+    def sorted_items(self) -> list:
+        """Returns the contents of the priority queue in priority order.
+
+        Sorts a copy of the heap, leaving the queue untouched.
+
+        Returns
+        -------
+        list
+            The `(item, priority)` pairs in the priority queue, in the order
+            `remove` would return them.
+        """
+        nodes = sorted(self._nodes[1:], key=itemgetter(1))
+        if self._max:
+            return [(item, -priority) for item, priority in nodes]
+        return nodes
+
+    def remove_many(self, k: int) -> list:
+        """Removes and returns the first `k` items in the priority queue.
+
+        Parameters
+        ----------
+        k : int
+            The number of items to remove. If the queue holds fewer items,
+            all of them are removed.
+
+        Returns
+        -------
+        list
+            The removed items, in the order `remove` would return them.
+        """
+        if k >= self.size():
+            nodes = sorted(self._nodes[1:], key=itemgetter(1))
+            self._nodes = [None]
+            self._locations = {}
+            return [node[0] for node in nodes]
+        pop = self._pop
+        return [pop() for _ in range(k)]
+
+    def pop_until(self, priority: float) -> list:
+        """Removes and returns the items up to the given priority.
+
+        Items are removed for as long as the priority of the first item is
+        at most `priority` (or at least `priority` for a maximum priority
+        queue).
+
+        Parameters
+        ----------
+        priority : float
+            The priority to stop at, inclusive.
+
+        Returns
+        -------
+        list
+            The removed items, in the order `remove` would return them.
+        """
+        if self._max:
+            priority *= -1
+        nodes = self._nodes
+        pop = self._pop
+        removed = []
+        while len(nodes) > 1 and nodes[1][1] <= priority:
+            removed.append(pop())
+        return removed
 
     # - - - - - - - - - - - - -
-    # Heap Manipulation Methods
+    # Serialization Methods
     # - - - - - - - - - - - - -
 
-    def _swap(self, i: int, j: int) -> None:
-        """Swaps the items at the specified indices of the list.
+    def to_bytes(self) -> bytes:
+        """Serializes the priority queue into a compact binary format.
+
+        Priorities are stored as 64-bit floats. Integer items are stored
+        as 64-bit integers; any other items are pickled. The heap is stored
+        as-is, so `from_bytes` does not need to sift it.
 
-        Also updates the locations dictionary with the new indices.
+        Returns
+        -------
+        bytes
+            The serialized priority queue.
+        """
+        nodes = self._nodes
+        size = len(nodes) - 1
+        priorities = array('d', [nodes[i][1] for i in range(1, size + 1)])
+        items = [nodes[i][0] for i in range(1, size + 1)]
+        item_format = b'p'
+        if all(type(item) is int for item in items):
+            try:
+                items = array('q', items)
+                item_format = b'q'
+            except OverflowError:
+                pass
+        if sys.byteorder == 'big':
+            priorities.byteswap()
+            if item_format == b'q':
+                items.byteswap()
+
+        header = _HEADER.pack(_MAGIC, 1, self._max, self._arity, item_format, size)
+        if item_format == b'q':
+            return b''.join([header, priorities.tobytes(), items.tobytes()])
+        return b''.join([header, priorities.tobytes(), pickle.dumps(items)])
+
+    def save(self, path) -> None:
+        """Writes the priority queue to a file in the format of `to_bytes`.
 
         Parameters
         ----------
-        i : int
-            The index of one of the items to swap.
+        path : str or os.PathLike
+            The file to write.
 
-        j : int
-            The index of the other item to swap.
+        Returns
+        -------
+        None
+            Nothing.
         """
+        with open(path, 'wb') as fh:
+            fh.write(self.to_bytes())
 
-        self._nodes[i], self._nodes[j] = self._nodes[j], self._nodes[i]
-        iKey = self._nodes[i][0]
-        jKey = self._nodes[j][0]
-        tempIndex_i = self._locations[iKey]
-        tempIndex_j = self._locations[jKey]
-        self._locations[iKey] = tempIndex_j
-        self._locations[jKey] = tempIndex_i
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
 
-    def _swim(self, index: int) -> None:
-        """Attempts to swim a node to its correct position.
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _sift(self, index: int, node: tuple) -> None:
+        """Places a node into a hole, sifting in whichever direction is needed.
 
         Parameters
         ----------
         index : int
-            The index of the node to swim.
-        """
-        if self._should_swap(index, _Relation.PARENT):
-            swapIndex = self._get_relation_index(index, _Relation.PARENT)
-            self._swap(index, swapIndex)
-            self._swim(swapIndex)
-        elif self._should_swap(index,
-                               _Relation.CHILD_LEFT) or self._should_swap(
-            index, _Relation.CHILD_RIGHT):
-            leftPriority = self._get_relation_priority(index,
-                                                       _Relation.CHILD_LEFT)
-            rightPriority = self._get_relation_priority(index,
-                                                        _Relation.CHILD_RIGHT)
-            if rightPriority < leftPriority:
-                swapIndex = self._get_relation_index(index,
-                                                     _Relation.CHILD_RIGHT)
-                self._swap(index, swapIndex)
-                self._swim(swapIndex)
-            else:
-                swapIndex = self._get_relation_index(index, _Relation.CHILD_LEFT)
-                self._swap(index, swapIndex)
-                self._swim(swapIndex)
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        if index > 1 and node[1] < self._nodes[index >> 1][1]:
+            self._sift_up(index, node)
+        else:
+            self._sift_down(index, node)
+
+    def _sift_up(self, index: int, node: tuple) -> None:
+        """Moves a hole up the heap until the node fits, then fills it.
+
+        Parents with a larger priority are moved down into the hole instead
+        of being swapped, so each moved node is written (along with its
+        location) exactly once.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        priority = node[1]
+        while index > 1:
+            parent = index >> 1
+            parentNode = nodes[parent]
+            if priority >= parentNode[1]:
+                break
+            nodes[index] = parentNode
+            locations[parentNode[0]] = index
+            index = parent
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _sift_down(self, index: int, node: tuple) -> None:
+        """Moves a hole down the heap until the node fits, then fills it.
+
+        The smaller child is moved up into the hole at each level, so each
+        moved node is written (along with its location) exactly once.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        end = len(nodes)
+        priority = node[1]
+        child = index << 1
+        while child < end:
+            childNode = nodes[child]
+            if child + 1 < end:
+                rightNode = nodes[child + 1]
+                if rightNode[1] < childNode[1]:
+                    child += 1
+                    childNode = rightNode
+            if priority <= childNode[1]:
+                break
+            nodes[index] = childNode
+            locations[childNode[0]] = index
+            index = child
+            child = index << 1
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _pop(self):
+        """Removes and returns the first item, assuming there is one.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        nodes = self._nodes
+        smallest = nodes[1]
+        last = nodes.pop()
+        del self._locations[smallest[0]]
+        if len(nodes) > 1:
+            self._sift_down(1, last)
+        return smallest[0]
+
+    def _build(self, pairs: list) -> None:
+        """Fills an empty heap with the given pairs in linear time.
+
+        Parameters
+        ----------
+        pairs : list
+            The `(item, priority)` pairs to fill the heap with.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once.
+        """
+        if self._max:
+            pairs = [(item, -priority) for item, priority in pairs]
+        self._nodes.extend(pairs)
+        nodes = self._nodes
+        self._locations = {nodes[i][0]: i for i in range(1, len(nodes))}
+        if len(self._locations) != len(nodes) - 1:
+            raise ValueError('item already present')
+        self._heapify()
+
+    def _heapify(self) -> None:
+        """Restores the heap property over the whole node list.
+
+        Sinks every internal node, starting from the last one. Expects the
+        locations dictionary to already hold an entry for every item.
+        """
+        nodes = self._nodes
+        for index in range(len(nodes) // 2, 0, -1):
+            self._sift_down(index, nodes[index])
 
     # - - - - - - - - - - - - -
     # Miscellaneous Utility Methods
     # - - - - - - - - - - - - -
 
-    def _is_valid_index(self, index: int) -> bool:
-        """Checks whether an index is acceptable or not.
-
-        Checks to verify that (a) the index is within the bounds of the 
-        list, and (b) the reference at the index is not null.
+    def _child_range(self, index: int) -> range:
+        """Returns the indices of the children of a node.
 
         Parameters
         ----------
         index : int
-            The index to check acceptability of.
+            The index of the node.
+
+        Returns
+        -------
+        range
+            The indices of the node's children that are in the heap.
+        """
+        return range(2 * index, min(2 * index + 2, len(self._nodes)))
+
+    @classmethod
+    def _empty(cls, is_max: bool, arity: int) -> 'ArrayHeapPQ':
+        """Creates an empty queue for restoring or copying a heap into.
+
+        Subclasses that take an arity override this to use the given one,
+        so that the heap's layout can be kept.
+
+        Parameters
+        ----------
+        is_max : bool
+            Whether to make a maximum priority queue or not.
+
+        arity : int
+            The arity of the heap being restored or copied.
+
+        Returns
+        -------
+        ArrayHeapPQ
+            A new, empty priority queue.
+        """
+        return cls(is_max)
+
+    def _should_rebuild(self, k: int) -> bool:
+        """Decides whether a batch of `k` updates should re-heapify.
+
+        Parameters
+        ----------
+        k : int
+            The number of items being added or changed.
 
         Returns
         -------
         bool
-            True if `index` is acceptable; False otherwise.
+            True if re-heapifying the whole queue is expected to be cheaper
+            than sifting each item separately; False otherwise.
         """
-        return 0 <= index < len(self._nodes) and self._nodes[index] is not None
+        return k * _REBUILD_RATIO >= len(self._nodes)
 
     def _validateSize(self) -> None:
         """Checks to see if the size of the queue is greater than zero.
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+from asyncio import get_running_loop
+from collections import deque
+
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+
+class AsyncPQ:
+    """Asynchronous Priority Queue.
+
+    An `ArrayHeapPQ` for use from asyncio tasks. Removing from an empty
+    queue waits until another task adds an item, and with a `maxsize`,
+    adding to a full queue waits until an item is removed or discarded.
+    Priorities can be changed at any time, including while tasks are
+    waiting.
+
+    Not thread-safe; all calls must come from the event loop's thread.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    maxsize : int, default=0
+        The most items the queue can hold before `add` waits. Zero means
+        the queue is unbounded.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from ssds import AsyncPQ
+    >>> async def main():
+    ...     pq = AsyncPQ()
+    ...     waiter = asyncio.ensure_future(pq.remove())
+    ...     await pq.add('a', 1)
+    ...     return await waiter
+    >>> asyncio.run(main())
+    'a'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, maxsize=0):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        self._pq = ArrayHeapPQ(is_max)
+        self._maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    async def add(self, item, priority: float) -> None:
+        """Adds an item, waiting for space if the queue is full.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        while self.full():
+            await self._wait(self._putters, self.full)
+        self.add_nowait(item, priority)
+
+    def add_nowait(self, item, priority: float) -> None:
+        """Adds an item without waiting.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        RuntimeError
+            If the queue is full.
+        """
+        if self.full():
+            raise RuntimeError('queue is full')
+        self._pq.add(item, priority)
+        self._wakeup_next(self._getters)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return self._pq.contains(item)
+
+    async def get(self):
+        """Returns the first item, waiting for one if the queue is empty.
+
+        Does not remove the item from the queue.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        while self.size() == 0:
+            await self._wait(self._getters, self._is_empty)
+        # This call consumes nothing, so pass the wakeup on
+        self._wakeup_next(self._getters)
+        return self._pq.get()
+
+    async def remove(self):
+        """Removes and returns the first item, waiting for one if needed.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        while self.size() == 0:
+            await self._wait(self._getters, self._is_empty)
+        return self.remove_nowait()
+
+    def remove_nowait(self):
+        """Removes and returns the first item without waiting.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+
+        Raises
+        ------
+        RuntimeError
+            If the queue is empty.
+        """
+        item = self._pq.remove()
+        self._wakeup_next(self._putters)
+        if self.size() > 0:
+            self._wakeup_next(self._getters)
+        return item
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return self._pq.size()
+
+    def full(self) -> bool:
+        """Returns whether `add` would have to wait.
+
+        Returns
+        -------
+        bool
+            True if the queue holds `maxsize` items; False otherwise.
+        """
+        return 0 < self._maxsize <= self._pq.size()
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Waiting tasks are not tied to particular items, so whichever task
+        removes next will see the new order.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        self._pq.change_priority(item, priority)
+
+    def discard(self, item) -> bool:
+        """Removes the given item, if present, waking a task waiting to add.
+
+        Parameters
+        ----------
+        item
+            The item to remove.
+
+        Returns
+        -------
+        bool
+            True if `item` was in the priority queue; False otherwise.
+        """
+        if not self._pq.discard(item):
+            return False
+        self._wakeup_next(self._putters)
+        return True
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    async def _wait(self, waiters: deque, blocked) -> None:
+        """Waits to be woken by another task.
+
+        If the waiting task is cancelled after it was woken, the wakeup is
+        passed on to the next waiter so that it is not lost.
+
+        Parameters
+        ----------
+        waiters : collections.deque
+            The waiters to queue up behind.
+
+        blocked : callable
+            Returns whether waiters in `waiters` would still be blocked.
+        """
+        waiter = get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not blocked() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        """Wakes the longest-waiting task that is still waiting.
+
+        Parameters
+        ----------
+        waiters : collections.deque
+            The waiters to wake one of.
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _is_empty(self) -> bool:
+        """Returns whether the queue is empty.
+
+        Returns
+        -------
+        bool
+            True if the queue holds no items; False otherwise.
+        """
+        return self._pq.size() == 0
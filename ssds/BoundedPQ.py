@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+from heapq import nlargest, nsmallest
+from operator import itemgetter
+
+from ssds.abc.PriorityQueue import PriorityQueue
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+_KEEP = ('max', 'min')
+"""tuple: The accepted values of `keep`."""
+
+
+class BoundedPQ(PriorityQueue):
+    """Bounded Priority Queue.
+
+    Keeps the best `capacity` items offered to it, e.g. the top N of a
+    stream, in an `ArrayHeapPQ` ordered so that the worst item kept is at
+    the root. An item offered to a full queue is compared against the root
+    before anything else, so an item that is not good enough is turned away
+    in :math:`\\mathcal{O}(1)` time. An item that is good enough takes the
+    root's place in a single sift down, instead of an add followed by a
+    remove.
+
+    `get` and `remove` act on the worst item kept, which is the next to be
+    evicted. Ties are settled in favour of the items already kept.
+
+    `add` returns nothing, as for every priority queue; `offer` does the
+    same work and also returns the item that no longer fits.
+
+    Parameters
+    ----------
+    capacity : int
+        The most items the queue can hold.
+
+    keep : {'max', 'min'}, default='max'
+        Selects whether to keep the items with the largest priorities or
+        the items with the smallest priorities.
+
+    Examples
+    --------
+    >>> from ssds import BoundedPQ
+    >>> pq = BoundedPQ(2)
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 3)
+    >>> pq.offer('c', 2)
+    'a'
+    >>> pq.offer('d', 0)
+    'd'
+    >>> pq.ranked()
+    ['b', 'c']
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, capacity: int, keep='max'):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        if keep not in _KEEP:
+            raise ValueError('keep must be one of %s' % ', '.join(_KEEP))
+        super().__init__(keep == 'min')
+        # The worst item kept is the first out of the heap
+        self._pq = ArrayHeapPQ(keep == 'min')
+        self._capacity = capacity
+        self._keep = keep
+
+    @classmethod
+    def from_iterable(cls, items, priorities=None, *, capacity=None, keep='max'):
+        """Builds a priority queue from the best of a collection of items.
+
+        Selects the items to keep in :math:`\\mathcal{O}(n\\log(k))` time,
+        then heapifies them in linear time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        capacity : int, optional
+            The most items the queue can hold. Defaults to the number of
+            items given, or 1 if there are none.
+
+        keep : {'max', 'min'}, default='max'
+            Selects whether to keep the items with the largest priorities
+            or the items with the smallest priorities.
+
+        Returns
+        -------
+        BoundedPQ
+            A new priority queue containing the best of the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once, or if `items` and
+            `priorities` differ in length.
+        """
+        pairs = cls._pairs(items, priorities)
+        if capacity is None:
+            capacity = max(len(pairs), 1)
+        pq = cls(capacity, keep)
+        if len(dict(pairs)) != len(pairs):
+            raise ValueError('item already present')
+        select = nlargest if keep == 'max' else nsmallest
+        pq._pq = ArrayHeapPQ.from_iterable(
+            select(capacity, pairs, key=itemgetter(1)), is_max=keep == 'min')
+        return pq
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Offers an item to the priority queue, as by `offer`.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item is already present.
+        """
+        self.offer(item, priority)
+
+    def offer(self, item, priority: float):
+        """Offers an item, and returns the item that no longer fits.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        object
+            The item that no longer fits: `item` itself if it was turned
+            away, or the item it evicted. None if the queue had room.
+
+        Raises
+        ------
+        ValueError
+            If the item is already present.
+        """
+        pq = self._pq
+        if item in pq._locations:
+            raise ValueError('item already present')
+        if pq._max:
+            priority *= -1
+        nodes = pq._nodes
+        if len(nodes) <= self._capacity:
+            nodes.append(None)
+            pq._sift_up(len(nodes) - 1, (item, priority))
+            return None
+
+        worst = nodes[1]
+        if priority <= worst[1]:
+            return item
+        del pq._locations[worst[0]]
+        pq._sift_down(1, (item, priority))
+        return worst[0]
+
+    def add_many(self, items, priorities=None) -> list:
+        """Offers a collection of items to the priority queue.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        Returns
+        -------
+        list
+            The items that no longer fit, in the order they were turned
+            away or evicted.
+
+        Raises
+        ------
+        ValueError
+            If an item is already present, or if `items` and `priorities`
+            differ in length.
+        """
+        offer = self.offer
+        evicted = []
+        for item, priority in self._pairs(items, priorities):
+            out = offer(item, priority)
+            if out is not None:
+                evicted.append(out)
+        return evicted
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return self._pq.contains(item)
+
+    def get(self):
+        """Returns the worst item kept, which is the next to be evicted.
+
+        Does not remove the item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The item with the smallest priority if the queue keeps the
+            largest priorities, or vice versa.
+        """
+        return self._pq.get()
+
+    def remove(self):
+        """Removes and returns the worst item kept.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The item with the smallest priority if the queue keeps the
+            largest priorities, or vice versa.
+        """
+        return self._pq.remove()
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return self._pq.size()
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of an item that has been kept.
+
+        The item stays in the queue even if its new priority is worse than
+        that of an item turned away earlier.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        self._pq.change_priority(item, priority)
+
+    def discard(self, item) -> bool:
+        """Removes the given item from the priority queue, if present.
+
+        Parameters
+        ----------
+        item
+            The item to remove.
+
+        Returns
+        -------
+        bool
+            True if `item` was in the priority queue; False otherwise.
+        """
+        return self._pq.discard(item)
+
+    def ranked(self, with_priorities=False) -> list:
+        """Returns the items kept, best first, without removing them.
+
+        Parameters
+        ----------
+        with_priorities : bool, default=False
+            Selects whether to return `(item, priority)` pairs instead of
+            just the items.
+
+        Returns
+        -------
+        list
+            The items (or pairs), from the best to the worst.
+        """
+        ranked = sorted(self._pq._nodes[1:], key=itemgetter(1), reverse=True)
+        if not with_priorities:
+            return [node[0] for node in ranked]
+        if self._pq._max:
+            return [(item, -priority) for item, priority in ranked]
+        return ranked
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class BucketPQ(PriorityQueue):
+    """Bucket Priority Queue.
+
+    Keeps one bucket per priority in a small range of integers, along with
+    a cursor at the first bucket that might be non-empty. Adds and updates
+    are :math:`\\mathcal{O}(1)`, and removes are :math:`\\mathcal{O}(1)` plus
+    the number of empty buckets the cursor moves past.
+
+    Parameters
+    ----------
+    min_priority : int
+        The smallest priority an item may have.
+
+    max_priority : int
+        The largest priority an item may have.
+
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import BucketPQ
+    >>> pq = BucketPQ(0, 10)
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.remove()
+    'b'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, min_priority: int, max_priority: int, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if min_priority > max_priority:
+            raise ValueError('min_priority exceeds max_priority')
+        super().__init__(is_max)
+        self._buckets = [set() for _ in range(max_priority - min_priority + 1)]
+        self._indices = {}
+        self._cursor = len(self._buckets)
+        self._min_priority = min_priority
+        self._max_priority = max_priority
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: int) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : int
+            The extrinsic priority of the object. Must be an integer in
+            the range given at construction.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if item in self._indices:
+            raise ValueError('item already present')
+        index = self._index(priority)
+        self._buckets[index].add(item)
+        self._indices[item] = index
+        if index < self._cursor:
+            self._cursor = index
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return item in self._indices
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        return next(iter(self._first_bucket()))
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        item = self._first_bucket().pop()
+        del self._indices[item]
+        return item
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return len(self._indices)
+
+    def change_priority(self, item, priority: int) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : int
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        old = self._indices.get(item, None)
+        if old is None:
+            raise ValueError('item %s does not exist' % str(item))
+        index = self._index(priority)
+        self._buckets[old].remove(item)
+        self._buckets[index].add(item)
+        self._indices[item] = index
+        if index < self._cursor:
+            self._cursor = index
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    def _first_bucket(self) -> set:
+        """Moves the cursor to the first non-empty bucket and returns it.
+
+        Assumes the queue is not empty.
+
+        Returns
+        -------
+        set
+            The set of items in the first non-empty bucket.
+        """
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+        return buckets[cursor]
+
+    def _index(self, priority: int) -> int:
+        """Converts a priority into the index of its bucket.
+
+        Buckets are ordered front to back, so a maximum priority queue
+        stores the largest priority in bucket zero.
+
+        Parameters
+        ----------
+        priority : int
+            The priority to convert.
+
+        Returns
+        -------
+        int
+            The index of the bucket for `priority`.
+        """
+        if (not isinstance(priority, int)
+                or not self._min_priority <= priority <= self._max_priority):
+            raise ValueError('priority %s is not an integer in [%d, %d]' % (
+                str(priority), self._min_priority, self._max_priority))
+        if self._max:
+            return self._max_priority - priority
+        return priority - self._min_priority
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if len(self._indices) == 0:
+            raise RuntimeError('queue has size zero')
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class CompactHeapPQ(PriorityQueue):
+    """Compact Heap Priority Queue.
+
+    A binary heap like `ArrayHeapPQ`, but with the items and priorities
+    kept in parallel containers: a list of items and an `array('d')` of
+    priorities. No `(item, priority)` tuple is created per node, so
+    changing a priority writes a float in place, the garbage collector has
+    far fewer objects to track, and each item takes less memory. Has
+    :math:`\\mathcal{O}(\\log(n))` adds, removes, and updates.
+
+    Priorities are stored as 64-bit floats, so they must be numbers, and
+    integers beyond :math:`2^{53}` lose precision.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import CompactHeapPQ
+    >>> pq = CompactHeapPQ()
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.remove()
+    'b'
+    """
+
+    __slots__ = ('_items', '_priorities', '_locations', '_max')
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        super().__init__(is_max)
+        self._items = [None]
+        self._priorities = array('d', [0.0])
+        self._locations = {}
+        self._max = is_max
+
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False):
+        """Builds a priority queue from a collection of items.
+
+        Runs in :math:`\\mathcal{O}(n)` time by heapifying the items
+        bottom-up, rather than adding them one at a time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        is_max : bool, default=False
+            Selects whether the priority queue should dequeue the item with
+            the maximum priority (instead of the minimum priority).
+
+        Returns
+        -------
+        CompactHeapPQ
+            A new priority queue containing the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once, or if `items` and
+            `priorities` differ in length.
+        """
+        pairs = cls._pairs(items, priorities)
+        pq = cls(is_max)
+        pq._items.extend(item for item, _ in pairs)
+        sign = -1 if is_max else 1
+        pq._priorities.extend(sign * priority for _, priority in pairs)
+        items = pq._items
+        pq._locations = {items[i]: i for i in range(1, len(items))}
+        if len(pq._locations) != len(items) - 1:
+            raise ValueError('item already present')
+        prio = pq._priorities
+        for index in range(len(items) // 2, 0, -1):
+            pq._sift_down(index, items[index], prio[index])
+        return pq
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if item in self._locations:
+            raise ValueError('item already present')
+        if self._max:
+            priority *= -1
+        self._items.append(None)
+        self._priorities.append(0.0)
+        self._sift_up(len(self._items) - 1, item, priority)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return item in self._locations
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        return self._items[1]
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        items = self._items
+        smallest = items[1]
+        lastItem = items.pop()
+        lastPriority = self._priorities.pop()
+        del self._locations[smallest]
+        if len(items) > 1:
+            self._sift_down(1, lastItem, lastPriority)
+        return smallest
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return len(self._locations)
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        index = self._locations.get(item, None)
+        if index is None:
+            raise ValueError('item %s does not exist' % str(item))
+        if self._max:
+            priority *= -1
+        if index > 1 and priority < self._priorities[index >> 1]:
+            self._sift_up(index, item, priority)
+        else:
+            self._sift_down(index, item, priority)
+
+    def discard(self, item) -> bool:
+        """Removes the given item from the priority queue, if present.
+
+        Parameters
+        ----------
+        item
+            The item to remove.
+
+        Returns
+        -------
+        bool
+            True if `item` was in the priority queue; False otherwise.
+        """
+        index = self._locations.pop(item, None)
+        if index is None:
+            return False
+        items = self._items
+        lastItem = items.pop()
+        lastPriority = self._priorities.pop()
+        if index < len(items):
+            if index > 1 and lastPriority < self._priorities[index >> 1]:
+                self._sift_up(index, lastItem, lastPriority)
+            else:
+                self._sift_down(index, lastItem, lastPriority)
+        return True
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _sift_up(self, index: int, item, priority: float) -> None:
+        """Moves a hole up the heap until the item fits, then fills it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        item
+            The item to place into the heap.
+
+        priority : float
+            The item's priority, as stored.
+        """
+        items = self._items
+        prio = self._priorities
+        locations = self._locations
+        while index > 1:
+            parent = index >> 1
+            parentPriority = prio[parent]
+            if priority >= parentPriority:
+                break
+            parentItem = items[parent]
+            items[index] = parentItem
+            prio[index] = parentPriority
+            locations[parentItem] = index
+            index = parent
+        items[index] = item
+        prio[index] = priority
+        locations[item] = index
+
+    def _sift_down(self, index: int, item, priority: float) -> None:
+        """Moves a hole down the heap until the item fits, then fills it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        item
+            The item to place into the heap.
+
+        priority : float
+            The item's priority, as stored.
+        """
+        items = self._items
+        prio = self._priorities
+        locations = self._locations
+        end = len(items)
+        child = index << 1
+        while child < end:
+            childPriority = prio[child]
+            if child + 1 < end:
+                rightPriority = prio[child + 1]
+                if rightPriority < childPriority:
+                    child += 1
+                    childPriority = rightPriority
+            if priority <= childPriority:
+                break
+            childItem = items[child]
+            items[index] = childItem
+            prio[index] = childPriority
+            locations[childItem] = index
+            index = child
+            child = index << 1
+        items[index] = item
+        prio[index] = priority
+        locations[item] = index
+
+    # - - - - - - - - - - - - -
+    # Miscellaneous Utility Methods
+    # - - - - - - - - - - - - -
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if len(self._items) == 1:
+            raise RuntimeError('queue has size zero')
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+from threading import Condition
+
+from ssds.abc.PriorityQueue import PriorityQueue
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+
+class ConcurrentPQ(PriorityQueue):
+    """Thread-Safe Priority Queue.
+
+    Wraps another priority queue behind a lock. Removing from an empty
+    queue can block until another thread adds an item, instead of raising
+    straight away.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    backend : callable, default=ArrayHeapPQ
+        Called with `is_max` to create the wrapped priority queue.
+
+    Examples
+    --------
+    >>> from threading import Thread
+    >>> from ssds import ConcurrentPQ
+    >>> pq = ConcurrentPQ()
+    >>> Thread(target=pq.add, args=('a', 1)).start()
+    >>> pq.remove(timeout=5)
+    'a'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, backend=ArrayHeapPQ):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        super().__init__(is_max)
+        self._pq = backend(is_max)
+        self._condition = Condition()
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item to the priority queue, waking one waiting thread.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        with self._condition:
+            self._pq.add(item, priority)
+            self._condition.notify()
+
+    def add_many(self, items, priorities=None) -> None:
+        """Adds a collection of items under a single acquisition of the lock.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        pairs = self._pairs(items, priorities)
+        with self._condition:
+            self._pq.add_many(pairs)
+            self._condition.notify(len(pairs))
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        with self._condition:
+            return self._pq.contains(item)
+
+    def get(self, block=False, timeout=None):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        block : bool, default=False
+            Selects whether to wait for an item if the queue is empty.
+
+        timeout : float, optional
+            The longest time to wait for, in seconds. Waits indefinitely if
+            not given.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+
+        Raises
+        ------
+        RuntimeError
+            If the queue is (still) empty.
+        """
+        with self._condition:
+            self._wait(block, timeout)
+            return self._pq.get()
+
+    def remove(self, block=True, timeout=None):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        block : bool, default=True
+            Selects whether to wait for an item if the queue is empty.
+
+        timeout : float, optional
+            The longest time to wait for, in seconds. Waits indefinitely if
+            not given.
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+
+        Raises
+        ------
+        RuntimeError
+            If the queue is (still) empty.
+        """
+        with self._condition:
+            self._wait(block, timeout)
+            return self._pq.remove()
+
+    def remove_many(self, k: int, block=True, timeout=None) -> list:
+        """Removes up to `k` items under a single acquisition of the lock.
+
+        Only waits for the first item; the rest are whatever is in the
+        queue at that point.
+
+        Parameters
+        ----------
+        k : int
+            The most items to remove.
+
+        block : bool, default=True
+            Selects whether to wait for an item if the queue is empty.
+
+        timeout : float, optional
+            The longest time to wait for, in seconds. Waits indefinitely if
+            not given.
+
+        Returns
+        -------
+        list
+            The removed items, in the order `remove` would return them.
+
+        Raises
+        ------
+        RuntimeError
+            If the queue is (still) empty.
+        """
+        with self._condition:
+            self._wait(block, timeout)
+            return self._pq.remove_many(k)
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        with self._condition:
+            return self._pq.size()
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        with self._condition:
+            self._pq.change_priority(item, priority)
+
+    def change_priority_many(self, items, priorities=None) -> None:
+        """Changes several priorities under a single acquisition of the lock.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        pairs = self._pairs(items, priorities)
+        with self._condition:
+            self._pq.change_priority_many(pairs)
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    def _wait(self, block: bool, timeout: float) -> None:
+        """Waits, if allowed, until the queue is non-empty.
+
+        Must be called with the lock held.
+
+        Parameters
+        ----------
+        block : bool
+            Selects whether to wait for an item if the queue is empty.
+
+        timeout : float
+            The longest time to wait for, in seconds, or None to wait
+            indefinitely.
+
+        Notes
+        -----
+        Raises a RuntimeError if the queue is still empty.
+        """
+        if block and not self._condition.wait_for(self._pq.size, timeout):
+            raise RuntimeError('queue has size zero')
+        if not block and self._pq.size() == 0:
+            raise RuntimeError('queue has size zero')
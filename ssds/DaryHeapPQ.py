@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+
+class DaryHeapPQ(ArrayHeapPQ):
+    """D-ary Heap Priority Queue.
+
+    Like `ArrayHeapPQ`, but each node has `arity` children instead of two.
+    The shallower tree makes adds and priority decreases cheaper at the
+    cost of more comparisons per level on removes, which suits workloads
+    with many more `change_priority` calls than `remove` calls.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    arity : int, default=4
+        The number of children of each node in the heap.
+
+    Examples
+    --------
+    >>> from ssds import DaryHeapPQ
+    >>> pq = DaryHeapPQ(arity=8)
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.remove()
+    'b'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, arity=4):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+        super().__init__(is_max)
+        self._arity = arity
+
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False, arity=4):
+        """Builds a priority queue from a collection of items.
+
+        Runs in :math:`\\mathcal{O}(n)` time by heapifying the items
+        bottom-up, rather than adding them one at a time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        is_max : bool, default=False
+            Selects whether the priority queue should dequeue the item with
+            the maximum priority (instead of the minimum priority).
+
+        arity : int, default=4
+            The number of children of each node in the heap.
+
+        Returns
+        -------
+        DaryHeapPQ
+            A new priority queue containing the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once, or if `items` and
+            `priorities` differ in length.
+        """
+        pq = cls(is_max, arity)
+        pq._build(cls._pairs(items, priorities))
+        return pq
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _sift(self, index: int, node: tuple) -> None:
+        """Places a node into a hole, sifting in whichever direction is needed.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        if index > 1 and node[1] < self._nodes[(index - 2) // self._arity + 1][1]:
+            self._sift_up(index, node)
+        else:
+            self._sift_down(index, node)
+
+    def _sift_up(self, index: int, node: tuple) -> None:
+        """Moves a hole up the heap until the node fits, then fills it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        arity = self._arity
+        priority = node[1]
+        while index > 1:
+            parent = (index - 2) // arity + 1
+            parentNode = nodes[parent]
+            if priority >= parentNode[1]:
+                break
+            nodes[index] = parentNode
+            locations[parentNode[0]] = index
+            index = parent
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _sift_down(self, index: int, node: tuple) -> None:
+        """Moves a hole down the heap until the node fits, then fills it.
+
+        The smallest of the (up to `arity`) children is moved up into the
+        hole at each level.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        arity = self._arity
+        end = len(nodes)
+        priority = node[1]
+        first = arity * (index - 1) + 2
+        while first < end:
+            child = first
+            childNode = nodes[first]
+            for sibling in range(first + 1, min(first + arity, end)):
+                siblingNode = nodes[sibling]
+                if siblingNode[1] < childNode[1]:
+                    child = sibling
+                    childNode = siblingNode
+            if priority <= childNode[1]:
+                break
+            nodes[index] = childNode
+            locations[childNode[0]] = index
+            index = child
+            first = arity * (index - 1) + 2
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _child_range(self, index: int) -> range:
+        """Returns the indices of the children of a node.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node.
+
+        Returns
+        -------
+        range
+            The indices of the node's children that are in the heap.
+        """
+        first = self._arity * (index - 1) + 2
+        return range(first, min(first + self._arity, len(self._nodes)))
+
+    def _heapify(self) -> None:
+        """Restores the heap property over the whole node list.
+
+        Sinks every internal node, starting from the last one. Expects the
+        locations dictionary to already hold an entry for every item.
+        """
+        nodes = self._nodes
+        if len(nodes) <= 2:
+            return
+        for index in range((len(nodes) - 3) // self._arity + 1, 0, -1):
+            self._sift_down(index, nodes[index])
+
+    @classmethod
+    def _empty(cls, is_max: bool, arity: int) -> 'DaryHeapPQ':
+        """Creates an empty queue of the given arity.
+
+        Parameters
+        ----------
+        is_max : bool
+            Whether to make a maximum priority queue or not.
+
+        arity : int
+            The arity of the heap being restored or copied.
+
+        Returns
+        -------
+        DaryHeapPQ
+            A new, empty priority queue.
+        """
+        return cls(is_max, arity)
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+import mmap
+import pickle
+import struct
+import tempfile
+from heapq import heapify, heappop, heappush, merge
+from itertools import count, islice
+from operator import itemgetter
+
+from ssds.abc.PriorityQueue import PriorityQueue
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+_MAX_RUNS = 64
+"""int: The number of runs on disk at which the smallest are merged."""
+
+_FAN_IN = 16
+"""int: The number of runs merged into one at a time."""
+
+_NUMERIC = struct.Struct('<dq')
+"""struct.Struct: A record holding a priority and an integer item."""
+
+_PICKLED = struct.Struct('<dI')
+"""struct.Struct: A priority and the length of the pickled item after it."""
+
+_CHUNK = 4096
+"""int: The number of records written to a run at a time."""
+
+
+class ExternalPQ(PriorityQueue):
+    """External-Memory Priority Queue.
+
+    Holds at most `buffer_size` items in an in-memory `ArrayHeapPQ`. When
+    the buffer overflows, its contents are written to a temporary file as
+    a sorted run, and the buffer starts over. `remove` then merges the
+    buffer and the runs lazily, reading each run through a memory map one
+    record at a time, so memory use stays flat no matter how many items
+    are queued. Once `_MAX_RUNS` runs have built up, the `_FAN_IN`
+    smallest of them are merged into one, so that runs are merged with
+    others of a similar size and each item is only rewritten
+    :math:`\\mathcal{O}(\\log(n))` times.
+
+    Integer items are written as 64-bit integers; any other items are
+    pickled. Priorities are written as 64-bit floats.
+
+    Unlike the other queues, duplicates are not detected once an item has
+    been spilled: items are only checked against the buffer, since keeping
+    a record of every spilled item would use memory in proportion to the
+    queue. Adding an item that is already in a run succeeds, and the item
+    is then removed twice, so the caller must not add an item that is
+    already queued.
+    `change_priority` is not supported, and `contains` has to scan every
+    run.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    buffer_size : int, default=1000000
+        The most items to hold in memory before spilling them to disk.
+
+    directory : str, optional
+        The directory to create the runs in. Defaults to the system's
+        temporary directory.
+
+    Examples
+    --------
+    >>> from ssds import ExternalPQ
+    >>> pq = ExternalPQ(buffer_size=2)
+    >>> for item, priority in [('a', 3), ('b', 1), ('c', 2)]:
+    ...     pq.add(item, priority)
+    >>> [pq.remove() for _ in range(3)]
+    ['b', 'c', 'a']
+    >>> pq.close()
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, buffer_size=1_000_000, directory=None):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be at least 1')
+        super().__init__(is_max)
+        self._buffer = ArrayHeapPQ(is_max)
+        self._buffer_size = buffer_size
+        self._directory = directory
+        self._fronts = []
+        self._counter = count()
+        self._size = 0
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item, spilling the buffer to disk if it is full.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be picklable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item is already in the buffer. An item that has been
+            spilled to disk is not detected.
+        """
+        if self._buffer.size() >= self._buffer_size:
+            self._spill()
+        self._buffer.add(item, priority)
+        self._size += 1
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Scans every run on disk, so takes :math:`\\mathcal{O}(n)` time.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        if self._buffer.contains(item):
+            return True
+        return any(stored == item
+                   for _, _, run in self._fronts
+                   for _, stored in run.records(False))
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        if self._buffer_first():
+            return self._buffer.get()
+        return self._fronts[0][2].item
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        self._size -= 1
+        if self._buffer_first():
+            return self._buffer.remove()
+        _, _, run = heappop(self._fronts)
+        item = run.item
+        if run.advance():
+            heappush(self._fronts, (run.priority, next(self._counter), run))
+        else:
+            run.close()
+        return item
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return self._size
+
+    def change_priority(self, item, priority: float) -> None:
+        """Not supported, as spilled items cannot be found or updated.
+
+        Raises
+        ------
+        NotImplementedError
+            Always.
+        """
+        raise NotImplementedError('ExternalPQ does not support change_priority')
+
+    def close(self) -> None:
+        """Deletes the runs on disk and empties the priority queue.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        for _, _, run in self._fronts:
+            run.close()
+        self._fronts = []
+        self._buffer = ArrayHeapPQ(self._max)
+        self._size = 0
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    def _buffer_first(self) -> bool:
+        """Returns whether the front of the queue is in the buffer.
+
+        Returns
+        -------
+        bool
+            True if the buffer's first item comes before every run's;
+            False otherwise.
+        """
+        nodes = self._buffer._nodes
+        if len(nodes) == 1:
+            return False
+        return not self._fronts or nodes[1][1] <= self._fronts[0][0]
+
+    def _spill(self) -> None:
+        """Writes the buffer to disk as a sorted run and empties it."""
+        nodes = sorted(self._buffer._nodes[1:], key=itemgetter(1))
+        self._buffer = ArrayHeapPQ(self._max)
+        pickled = not all(type(item) is int and -2 ** 63 <= item < 2 ** 63
+                          for item, _ in nodes)
+        self._add_run(((priority, item) for item, priority in nodes), pickled)
+        if len(self._fronts) >= _MAX_RUNS:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Merges the `_FAN_IN` smallest runs on disk into a single run."""
+        fronts = sorted(self._fronts, key=lambda front: front[2].remaining())
+        runs = [run for _, _, run in fronts[:_FAN_IN]]
+        self._fronts = fronts[_FAN_IN:]
+        heapify(self._fronts)
+        pickled = any(run.pickled for run in runs)
+        self._add_run(merge(*[run.records(True) for run in runs], key=itemgetter(0)),
+                      pickled)
+        for run in runs:
+            run.close()
+
+    def _add_run(self, records, pickled: bool) -> None:
+        """Writes a run to a temporary file and adds it to the merge.
+
+        Parameters
+        ----------
+        records : iterable
+            The `(priority, item)` records of the run, in sorted order,
+            with the priorities as stored in the buffer.
+
+        pickled : bool
+            Selects whether to pickle the items, rather than store them as
+            64-bit integers.
+        """
+        fh = tempfile.TemporaryFile(buffering=0, dir=self._directory)
+        records = iter(records)
+        chunk = list(islice(records, _CHUNK))
+        while chunk:
+            if pickled:
+                parts = []
+                for priority, item in chunk:
+                    data = pickle.dumps(item)
+                    parts.append(_PICKLED.pack(priority, len(data)))
+                    parts.append(data)
+            else:
+                parts = [_NUMERIC.pack(priority, item) for priority, item in chunk]
+            fh.write(b''.join(parts))
+            chunk = list(islice(records, _CHUNK))
+        fh.flush()
+        run = _Run(fh, pickled)
+        if run.advance():
+            heappush(self._fronts, (run.priority, next(self._counter), run))
+        else:
+            run.close()
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if self._size == 0:
+            raise RuntimeError('queue has size zero')
+
+
+class _Run:
+    """A sorted run on disk, read through a memory map.
+
+    Holds the record at the read position in `priority` and `item`.
+    """
+
+    __slots__ = ('file', 'map', 'offset', 'pickled', 'priority', 'item')
+
+    def __init__(self, fh, pickled: bool):
+        self.file = fh
+        self.map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) if fh.tell() else None
+        self.offset = 0
+        self.pickled = pickled
+        self.priority = None
+        self.item = None
+
+    def advance(self) -> bool:
+        """Reads the next record.
+
+        Returns
+        -------
+        bool
+            True if there was another record; False if the run is used up.
+        """
+        if self.map is None or self.offset >= len(self.map):
+            return False
+        self.priority, self.item, self.offset = self._read(self.offset)
+        return True
+
+    def remaining(self) -> int:
+        """Returns the number of bytes after the current record.
+
+        Returns
+        -------
+        int
+            The size of the unread part of the run.
+        """
+        if self.map is None:
+            return 0
+        return len(self.map) - self.offset
+
+    def records(self, consume: bool):
+        """Yields the records from the current one onwards.
+
+        Parameters
+        ----------
+        consume : bool
+            Selects whether to advance the run past the records yielded.
+
+        Yields
+        ------
+        tuple
+            The next `(priority, item)` record.
+        """
+        if self.map is None:
+            return
+        yield self.priority, self.item
+        offset = self.offset
+        while offset < len(self.map):
+            priority, item, offset = self._read(offset)
+            if consume:
+                self.offset = offset
+            yield priority, item
+
+    def close(self) -> None:
+        """Unmaps and deletes the run's file."""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def _read(self, offset: int) -> tuple:
+        """Reads the record at an offset.
+
+        Parameters
+        ----------
+        offset : int
+            The offset of the record.
+
+        Returns
+        -------
+        tuple
+            The record's priority and item, and the offset of the next
+            record.
+        """
+        if not self.pickled:
+            priority, item = _NUMERIC.unpack_from(self.map, offset)
+            return priority, item, offset + _NUMERIC.size
+        priority, length = _PICKLED.unpack_from(self.map, offset)
+        offset += _PICKLED.size
+        return priority, pickle.loads(self.map[offset:offset + length]), offset + length
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from time import perf_counter_ns
+
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+_TIMED = ['add', 'contains', 'get', 'peek_k', 'remove', 'change_priority',
+          'push_or_update', 'push_or_improve', 'decrease_key', 'increase_key',
+          'discard', 'add_many', 'change_priority_many', 'discard_many',
+          'merge', 'remove_many', 'pop_until']
+"""list: The methods whose calls are counted and timed."""
+
+
+class InstrumentedPQ(ArrayHeapPQ):
+    """Instrumented Array-Heap Priority Queue.
+
+    An `ArrayHeapPQ` that counts the work done by each of its operations,
+    for finding out why a workload is slow. `ArrayHeapPQ` itself is left
+    untouched, so there is no cost unless this class is used instead.
+
+    The following are recorded, and returned by `stats`:
+
+    - ``comparisons``: priority comparisons made while sifting.
+    - ``moves``: nodes moved up or down a level while sifting.
+    - ``sift_levels``: how many sifts moved the hole by each number of
+      levels.
+    - ``lookups`` and ``location_writes``: reads and writes of the
+      dictionary that maps items to their places in the heap.
+    - ``operations``: for each public method, the number of calls, the
+      total time, and a histogram of the time per call. The histogram maps
+      a power of two to the number of calls that took less than that many
+      nanoseconds (but at least half as many).
+
+    Calls made by one public method to another are only timed once, as
+    part of the outer call.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    callback : callable, optional
+        Called as ``callback(operation, elapsed_ns)`` after every timed
+        call, e.g. to export the timings to a metrics system.
+
+    Examples
+    --------
+    >>> from ssds import InstrumentedPQ
+    >>> pq = InstrumentedPQ()
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.stats()['moves']
+    1
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, callback=None):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        self.callback = callback
+        self._timing = False
+        self.reset_stats()
+        super().__init__(is_max)
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def stats(self) -> dict:
+        """Returns the counts recorded since the last reset.
+
+        Returns
+        -------
+        dict
+            A copy of the counts, as described in the class documentation.
+        """
+        counters = self._counters
+        return {
+            'comparisons': counters['comparisons'],
+            'moves': counters['moves'],
+            'sift_levels': dict(sorted(self._sift_levels.items())),
+            'lookups': counters['lookups'],
+            'location_writes': counters['location_writes'],
+            'operations': {name: {'count': op['count'],
+                                  'total_ns': op['total_ns'],
+                                  'histogram': dict(sorted(op['histogram'].items()))}
+                           for name, op in self._operations.items()},
+        }
+
+    def reset_stats(self) -> None:
+        """Sets every count back to zero.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        self._counters = {'comparisons': 0, 'moves': 0, 'lookups': 0,
+                          'location_writes': 0}
+        self._sift_levels = {}
+        self._operations = {}
+        if '_locations' in self.__dict__:
+            self._locations.counters = self._counters
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    @property
+    def _locations(self) -> '_CountingDict':
+        return self.__dict__['_locations']
+
+    @_locations.setter
+    def _locations(self, locations: dict) -> None:
+        # Every dictionary assigned by ArrayHeapPQ is replaced with one
+        # that counts its accesses
+        self.__dict__['_locations'] = _CountingDict(locations, self._counters)
+        self._counters['location_writes'] += len(locations)
+
+    def _sift(self, index: int, node: tuple) -> None:
+        if index > 1:
+            self._counters['comparisons'] += 1
+        super()._sift(index, node)
+
+    def _sift_up(self, index: int, node: tuple) -> None:
+        nodes = self._nodes
+        locations = self._locations
+        priority = node[1]
+        comparisons = 0
+        levels = 0
+        while index > 1:
+            parent = index >> 1
+            parentNode = nodes[parent]
+            comparisons += 1
+            if priority >= parentNode[1]:
+                break
+            nodes[index] = parentNode
+            locations[parentNode[0]] = index
+            index = parent
+            levels += 1
+        nodes[index] = node
+        locations[node[0]] = index
+        self._record_sift(comparisons, levels)
+
+    def _sift_down(self, index: int, node: tuple) -> None:
+        nodes = self._nodes
+        locations = self._locations
+        end = len(nodes)
+        priority = node[1]
+        child = index << 1
+        comparisons = 0
+        levels = 0
+        while child < end:
+            childNode = nodes[child]
+            if child + 1 < end:
+                rightNode = nodes[child + 1]
+                comparisons += 1
+                if rightNode[1] < childNode[1]:
+                    child += 1
+                    childNode = rightNode
+            comparisons += 1
+            if priority <= childNode[1]:
+                break
+            nodes[index] = childNode
+            locations[childNode[0]] = index
+            index = child
+            child = index << 1
+            levels += 1
+        nodes[index] = node
+        locations[node[0]] = index
+        self._record_sift(comparisons, levels)
+
+    # - - - - - - - - - - - - -
+    # Recording Methods
+    # - - - - - - - - - - - - -
+
+    def _record_sift(self, comparisons: int, levels: int) -> None:
+        """Records the work done by one sift.
+
+        Parameters
+        ----------
+        comparisons : int
+            The number of priority comparisons made.
+
+        levels : int
+            The number of levels the hole moved by.
+        """
+        counters = self._counters
+        counters['comparisons'] += comparisons
+        counters['moves'] += levels
+        self._sift_levels[levels] = self._sift_levels.get(levels, 0) + 1
+
+    def _record_call(self, name: str, elapsed: int) -> None:
+        """Records the time taken by one call of a public method.
+
+        Parameters
+        ----------
+        name : str
+            The name of the method.
+
+        elapsed : int
+            The time taken, in nanoseconds.
+        """
+        operation = self._operations.get(name)
+        if operation is None:
+            operation = {'count': 0, 'total_ns': 0, 'histogram': {}}
+            self._operations[name] = operation
+        operation['count'] += 1
+        operation['total_ns'] += elapsed
+        bound = 1 << elapsed.bit_length()
+        operation['histogram'][bound] = operation['histogram'].get(bound, 0) + 1
+        if self.callback is not None:
+            self.callback(name, elapsed)
+
+
+class _CountingDict(dict):
+    """A dictionary that counts how often it is read and written."""
+
+    __slots__ = ('counters',)
+
+    def __init__(self, contents, counters: dict):
+        super().__init__(contents)
+        self.counters = counters
+
+    def __getitem__(self, key):
+        self.counters['lookups'] += 1
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.counters['lookups'] += 1
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.counters['lookups'] += 1
+        return super().get(key, default)
+
+    def keys(self):
+        # ArrayHeapPQ.contains tests membership through the keys view
+        self.counters['lookups'] += 1
+        return super().keys()
+
+    def pop(self, key, *default):
+        self.counters['lookups'] += 1
+        return super().pop(key, *default)
+
+    def __setitem__(self, key, value):
+        self.counters['location_writes'] += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.counters['location_writes'] += 1
+        super().__delitem__(key)
+
+
+def _timed(name: str):
+    """Wraps a method of `ArrayHeapPQ` so that its calls are recorded.
+
+    Parameters
+    ----------
+    name : str
+        The name of the method.
+
+    Returns
+    -------
+    callable
+        The wrapped method.
+    """
+    method = getattr(ArrayHeapPQ, name)
+
+    @wraps(method)
+    def timed(self, *args, **kwargs):
+        if self._timing:
+            return method(self, *args, **kwargs)
+        self._timing = True
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            self._timing = False
+            self._record_call(name, elapsed)
+
+    return timed
+
+
+for _name in _TIMED:
+    setattr(InstrumentedPQ, _name, _timed(_name))
+del _name
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+from operator import gt, lt
+
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class MinMaxHeapPQ(PriorityQueue):
+    """Min-Max Heap Priority Queue.
+
+    A double-ended priority queue: both the item with the minimum priority
+    and the item with the maximum priority can be looked at in
+    :math:`\\mathcal{O}(1)` time and removed in :math:`\\mathcal{O}(\\log(n))`
+    time. Nodes on even levels of the heap are no larger than their
+    descendants, and nodes on odd levels are no smaller, so the minimum is
+    at the root and the maximum is one of its children.
+
+    `get` and `remove` act on the minimum, or on the maximum if the queue
+    was made with `is_max`.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether `get` and `remove` act on the item with the maximum
+        priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import MinMaxHeapPQ
+    >>> pq = MinMaxHeapPQ()
+    >>> for item, priority in [('a', 3), ('b', 1), ('c', 2)]:
+    ...     pq.add(item, priority)
+    >>> pq.remove_max()
+    'a'
+    >>> pq.change_priority('c', 0)
+    >>> pq.remove_min()
+    'c'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        super().__init__(is_max)
+        self._nodes = [None]
+        self._locations = {}
+        self._max = is_max
+
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False):
+        """Builds a priority queue from a collection of items.
+
+        Runs in :math:`\\mathcal{O}(n)` time by heapifying the items
+        bottom-up, rather than adding them one at a time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        is_max : bool, default=False
+            Selects whether `get` and `remove` act on the item with the
+            maximum priority (instead of the minimum priority).
+
+        Returns
+        -------
+        MinMaxHeapPQ
+            A new priority queue containing the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once, or if `items` and
+            `priorities` differ in length.
+        """
+        pq = cls(is_max)
+        nodes = pq._nodes
+        nodes.extend(cls._pairs(items, priorities))
+        pq._locations = {nodes[i][0]: i for i in range(1, len(nodes))}
+        if len(pq._locations) != len(nodes) - 1:
+            raise ValueError('item already present')
+        for index in range(len(nodes) // 2, 0, -1):
+            pq._push_down(index, nodes[index])
+        return pq
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if item in self._locations:
+            raise ValueError('item already present')
+        self._nodes.append(None)
+        self._place(len(self._nodes) - 1, (item, priority))
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return item in self._locations
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        The item with the minimum priority, or the maximum priority if the
+        queue was made with `is_max`. Does not remove the item from the
+        queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        return self.get_max() if self._max else self.get_min()
+
+    def get_min(self):
+        """Returns the item with the minimum priority.
+
+        Returns
+        -------
+        object
+            The item with the minimum priority.
+        """
+        self._validateSize()
+        return self._nodes[1][0]
+
+    def get_max(self):
+        """Returns the item with the maximum priority.
+
+        Returns
+        -------
+        object
+            The item with the maximum priority.
+        """
+        self._validateSize()
+        return self._nodes[self._max_index()][0]
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        The item with the minimum priority, or the maximum priority if the
+        queue was made with `is_max`.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        return self.remove_max() if self._max else self.remove_min()
+
+    def remove_min(self):
+        """Removes and returns the item with the minimum priority.
+
+        Returns
+        -------
+        object
+            The item with the minimum priority.
+        """
+        self._validateSize()
+        return self._remove_at(1)
+
+    def remove_max(self):
+        """Removes and returns the item with the maximum priority.
+
+        Returns
+        -------
+        object
+            The item with the maximum priority.
+        """
+        self._validateSize()
+        return self._remove_at(self._max_index())
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return len(self._locations)
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        index = self._locations.get(item, None)
+        if index is None:
+            raise ValueError('item %s does not exist' % str(item))
+        self._place(index, (item, priority))
+
+    def discard(self, item) -> bool:
+        """Removes the given item from the priority queue, if present.
+
+        Parameters
+        ----------
+        item
+            The item to remove.
+
+        Returns
+        -------
+        bool
+            True if `item` was in the priority queue; False otherwise.
+        """
+        index = self._locations.get(item, None)
+        if index is None:
+            return False
+        self._remove_at(index)
+        return True
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _place(self, index: int, node: tuple) -> None:
+        """Places a node into a hole, moving it up or down as needed.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        if index > 1:
+            parent = index >> 1
+            parentNode = nodes[parent]
+            # Nodes on min levels have an odd bit length
+            better = lt if index.bit_length() & 1 else gt
+            if better(parentNode[1], node[1]):
+                # The node belongs on the parent's side of the heap; the
+                # parent takes its place and is pushed down from there
+                self._push_down(index, parentNode)
+                self._push_up(parent, node)
+                return
+            if index > 3 and better(node[1], nodes[index >> 2][1]):
+                self._push_up(index, node)
+                return
+        self._push_down(index, node)
+
+    def _push_up(self, index: int, node: tuple) -> None:
+        """Moves a hole up its own kind of level until the node fits.
+
+        The node must already be on the correct side of its parent.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        better = lt if index.bit_length() & 1 else gt
+        priority = node[1]
+        while index > 3:
+            grandparent = index >> 2
+            grandparentNode = nodes[grandparent]
+            if not better(priority, grandparentNode[1]):
+                break
+            nodes[index] = grandparentNode
+            locations[grandparentNode[0]] = index
+            index = grandparent
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _push_down(self, index: int, node: tuple) -> None:
+        """Moves a hole down the heap until the node fits, then fills it.
+
+        On a min level, the smallest of the children and grandchildren is
+        moved up into the hole at each step; on a max level, the largest.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        node : tuple
+            The `(item, priority)` pair to place into the heap.
+        """
+        nodes = self._nodes
+        locations = self._locations
+        end = len(nodes)
+        better = lt if index.bit_length() & 1 else gt
+        while 2 * index < end:
+            # Find the best of the children and grandchildren
+            best = 2 * index
+            bestNode = nodes[best]
+            for other in (2 * index + 1, 4 * index, 4 * index + 1,
+                          4 * index + 2, 4 * index + 3):
+                if other >= end:
+                    break
+                if better(nodes[other][1], bestNode[1]):
+                    best = other
+                    bestNode = nodes[other]
+            if not better(bestNode[1], node[1]):
+                break
+            nodes[index] = bestNode
+            locations[bestNode[0]] = index
+            if best < 4 * index:
+                # A child has no grandchildren that beat it, so stop here
+                index = best
+                break
+            parent = best >> 1
+            parentNode = nodes[parent]
+            if better(parentNode[1], node[1]):
+                # Swap with the parent, which then continues downwards
+                nodes[parent] = node
+                locations[node[0]] = parent
+                node = parentNode
+            index = best
+        nodes[index] = node
+        locations[node[0]] = index
+
+    def _remove_at(self, index: int):
+        """Removes and returns the item at an index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the item to remove.
+
+        Returns
+        -------
+        object
+            The removed item.
+        """
+        nodes = self._nodes
+        removed = nodes[index][0]
+        last = nodes.pop()
+        del self._locations[removed]
+        if index < len(nodes):
+            self._place(index, last)
+        return removed
+
+    # - - - - - - - - - - - - -
+    # Miscellaneous Utility Methods
+    # - - - - - - - - - - - - -
+
+    def _max_index(self) -> int:
+        """Returns the index of the item with the maximum priority.
+
+        Returns
+        -------
+        int
+            The index of the larger child of the root, or of the root if it
+            has no children.
+        """
+        nodes = self._nodes
+        if len(nodes) <= 3:
+            return len(nodes) - 1
+        return 2 if nodes[2][1] >= nodes[3][1] else 3
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if len(self._nodes) == 1:
+            raise RuntimeError('queue has size zero')
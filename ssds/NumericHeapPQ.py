@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class NumericHeapPQ(PriorityQueue):
+    """Numeric Heap Priority Queue.
+
+    A binary heap for integer items in `range(capacity)` with float
+    priorities. Instead of a list of tuples and a dictionary, the heap
+    order, the priorities, and the position of each item are kept in
+    preallocated typed arrays, using about 16 bytes per item of capacity.
+    Has :math:`\\mathcal{O}(\\log(n))` adds, removes, and updates.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of distinct items the queue can hold. Items must be
+        integers in `range(capacity)`.
+
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import NumericHeapPQ
+    >>> pq = NumericHeapPQ(10)
+    >>> pq.add(3, 1.0)
+    >>> pq.add(7, 2.0)
+    >>> pq.change_priority(7, 0.0)
+    >>> pq.remove()
+    7
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, capacity: int, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if capacity < 0:
+            raise ValueError('capacity must be non-negative')
+        super().__init__(is_max)
+        self._capacity = capacity
+        self._max = is_max
+        self._allocate(capacity)
+
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False, capacity=None):
+        """Builds a priority queue from a collection of items.
+
+        Runs in :math:`\\mathcal{O}(n)` time by heapifying the items
+        bottom-up, rather than adding them one at a time.
+
+        Parameters
+        ----------
+        items : iterable
+            An iterable of `(item, priority)` pairs, or an iterable of
+            items if `priorities` is given.
+
+        priorities : iterable, optional
+            An iterable of priorities parallel to `items`.
+
+        is_max : bool, default=False
+            Selects whether the priority queue should dequeue the item with
+            the maximum priority (instead of the minimum priority).
+
+        capacity : int, optional
+            The capacity of the queue. Defaults to one more than the
+            largest item.
+
+        Returns
+        -------
+        NumericHeapPQ
+            A new priority queue containing the items.
+
+        Raises
+        ------
+        ValueError
+            If an item is present more than once or is out of range, or if
+            `items` and `priorities` differ in length.
+        """
+        pairs = cls._pairs(items, priorities)
+        if capacity is None:
+            capacity = max((item for item, _ in pairs), default=-1) + 1
+        pq = cls(capacity, is_max)
+        heap = pq._heap
+        positions = pq._positions
+        prio = pq._priorities
+        for index, (item, priority) in enumerate(pairs, 1):
+            pq._validateItem(item)
+            if positions[item] != 0:
+                raise ValueError('item already present')
+            heap[index] = item
+            positions[item] = index
+            prio[item] = -priority if is_max else priority
+        pq._size = len(pairs)
+        for index in range(pq._size // 2, 0, -1):
+            pq._sift_down(index, heap[index])
+        return pq
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item: int, priority: float) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item : int
+            An item to be inserted into the queue. Must be an integer in
+            `range(capacity)`.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        self._validateItem(item)
+        if self._positions[item] != 0:
+            raise ValueError('item already present')
+        if self._max:
+            priority *= -1
+        self._priorities[item] = priority
+        self._size += 1
+        self._sift_up(self._size, item)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return (isinstance(item, int) and 0 <= item < self._capacity
+                and self._positions[item] != 0)
+
+    def get(self) -> int:
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        return self._heap[1]
+
+    def remove(self) -> int:
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        heap = self._heap
+        smallest = heap[1]
+        last = heap[self._size]
+        self._size -= 1
+        self._positions[smallest] = 0
+        if self._size > 0:
+            self._sift_down(1, last)
+        return smallest
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return self._size
+
+    def change_priority(self, item: int, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : int
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if not self.contains(item):
+            raise ValueError('item %s does not exist' % str(item))
+        if self._max:
+            priority *= -1
+        index = self._positions[item]
+        self._priorities[item] = priority
+        if index > 1 and priority < self._priorities[self._heap[index >> 1]]:
+            self._sift_up(index, item)
+        else:
+            self._sift_down(index, item)
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Heap Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _allocate(self, capacity: int) -> None:
+        """Creates the empty arrays that hold the heap.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of distinct items the queue can hold.
+        """
+        index_type = 'i' if capacity < 2 ** 31 else 'q'
+        self._heap = array(index_type, bytes(array(index_type).itemsize * (capacity + 1)))
+        self._positions = array(index_type, bytes(array(index_type).itemsize * capacity))
+        self._priorities = array('d', bytes(8 * capacity))
+        self._size = 0
+
+    def _sift_up(self, index: int, item: int) -> None:
+        """Moves a hole up the heap until the item fits, then fills it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        item : int
+            The item to place into the heap. Its priority must already be
+            stored.
+        """
+        heap = self._heap
+        positions = self._positions
+        prio = self._priorities
+        priority = prio[item]
+        while index > 1:
+            parent = index >> 1
+            parentItem = heap[parent]
+            if priority >= prio[parentItem]:
+                break
+            heap[index] = parentItem
+            positions[parentItem] = index
+            index = parent
+        heap[index] = item
+        positions[item] = index
+
+    def _sift_down(self, index: int, item: int) -> None:
+        """Moves a hole down the heap until the item fits, then fills it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the hole to start from.
+
+        item : int
+            The item to place into the heap. Its priority must already be
+            stored.
+        """
+        heap = self._heap
+        positions = self._positions
+        prio = self._priorities
+        end = self._size + 1
+        priority = prio[item]
+        child = index << 1
+        while child < end:
+            childItem = heap[child]
+            childPriority = prio[childItem]
+            if child + 1 < end:
+                rightItem = heap[child + 1]
+                rightPriority = prio[rightItem]
+                if rightPriority < childPriority:
+                    child += 1
+                    childItem = rightItem
+                    childPriority = rightPriority
+            if priority <= childPriority:
+                break
+            heap[index] = childItem
+            positions[childItem] = index
+            index = child
+            child = index << 1
+        heap[index] = item
+        positions[item] = index
+
+    # - - - - - - - - - - - - -
+    # Miscellaneous Utility Methods
+    # - - - - - - - - - - - - -
+
+    def _validateItem(self, item) -> None:
+        """Checks to see if an item can be stored in the queue.
+
+        Notes
+        -----
+        Raises a ValueError if the item is not an integer in
+        `range(capacity)`.
+        """
+        if not isinstance(item, int) or not 0 <= item < self._capacity:
+            raise ValueError('item %s is not in range(%d)' % (str(item), self._capacity))
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if self._size == 0:
+            raise RuntimeError('queue has size zero')
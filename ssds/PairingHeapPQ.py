@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class _Node:
+    """A node of a pairing heap.
+
+    Children are kept in a doubly-linked list. `prev` points to the parent
+    for the leftmost child, and to the previous sibling otherwise.
+    """
+
+    __slots__ = ('item', 'priority', 'child', 'sibling', 'prev')
+
+    def __init__(self, item, priority: float):
+        self.item = item
+        self.priority = priority
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+
+class PairingHeapPQ(PriorityQueue):
+    """Pairing-Heap Priority Queue.
+
+    Uses a tree of linked nodes. Should have :math:`\\mathcal{O}(1)` adds
+    and melds, and amortized :math:`\\mathcal{O}(\\log(n))` removes. Priority
+    decreases (increases for a maximum priority queue) are cheap in
+    practice, with an amortized cost of at most :math:`\\mathcal{O}(\\log(n))`.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import PairingHeapPQ
+    >>> pq = PairingHeapPQ()
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.remove()
+    'b'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        super().__init__(is_max)
+        self._root = None
+        self._nodes = {}
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if item in self._nodes:
+            raise ValueError('item already present')
+        if self._max:
+            priority *= -1
+        node = _Node(item, priority)
+        self._nodes[item] = node
+        self._root = node if self._root is None else self._link(self._root, node)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return item in self._nodes
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        return self._root.item
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        root = self._root
+        del self._nodes[root.item]
+        self._root = self._merge_pairs(root.child)
+        return root.item
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return len(self._nodes)
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Moving an item towards the front of the queue cuts its subtree
+        and links it to the root. Moving it towards the back also merges
+        its children back into the heap.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        node = self._nodes.get(item, None)
+        if node is None:
+            raise ValueError('item %s does not exist' % str(item))
+        if self._max:
+            priority *= -1
+
+        if priority <= node.priority:
+            node.priority = priority
+            if node is not self._root:
+                self._detach(node)
+                self._root = self._link(self._root, node)
+            return
+
+        if node is self._root:
+            rest = self._merge_pairs(node.child)
+        else:
+            self._detach(node)
+            rest = self._root
+            children = self._merge_pairs(node.child)
+            if children is not None:
+                rest = self._link(rest, children)
+        node.child = None
+        node.priority = priority
+        self._root = node if rest is None else self._link(rest, node)
+
+    def meld(self, other: 'PairingHeapPQ') -> None:
+        """Moves every item of another pairing heap into this one.
+
+        Linking the two heaps takes :math:`\\mathcal{O}(1)` time; merging
+        the item indices takes time proportional to the smaller queue.
+        `other` is left empty.
+
+        Parameters
+        ----------
+        other : ssds.PairingHeapPQ
+            The priority queue to take the items of. Must have the same
+            value of `is_max`.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the queues differ in `is_max`, or if they share an item.
+        """
+        if other is self:
+            return
+        if other._max != self._max:
+            raise ValueError('cannot meld a minimum and a maximum priority queue')
+        small, large = sorted((self._nodes, other._nodes), key=len)
+        if not large.keys().isdisjoint(small):
+            raise ValueError('item already present')
+        large.update(small)
+        self._nodes = large
+        if self._root is None:
+            self._root = other._root
+        elif other._root is not None:
+            self._root = self._link(self._root, other._root)
+        other._root = None
+        other._nodes = {}
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Tree Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    @staticmethod
+    def _link(a: _Node, b: _Node) -> _Node:
+        """Links two detached trees, returning the new root.
+
+        The root with the larger priority becomes the leftmost child of the
+        other.
+
+        Parameters
+        ----------
+        a : ssds.PairingHeapPQ._Node
+            The root of one tree.
+
+        b : ssds.PairingHeapPQ._Node
+            The root of the other tree.
+
+        Returns
+        -------
+        ssds.PairingHeapPQ._Node
+            The root of the linked tree.
+        """
+        if b.priority < a.priority:
+            a, b = b, a
+        child = a.child
+        b.sibling = child
+        if child is not None:
+            child.prev = b
+        b.prev = a
+        a.child = b
+        return a
+
+    def _merge_pairs(self, first: _Node) -> _Node:
+        """Merges a list of sibling trees into one tree.
+
+        Links the siblings in pairs from left to right, then links the
+        resulting trees from right to left.
+
+        Parameters
+        ----------
+        first : ssds.PairingHeapPQ._Node
+            The leftmost sibling. May be None.
+
+        Returns
+        -------
+        ssds.PairingHeapPQ._Node
+            The root of the merged tree, or None if there were no siblings.
+        """
+        if first is None:
+            return None
+        link = self._link
+        trees = []
+        a = first
+        while a is not None:
+            b = a.sibling
+            a.prev = a.sibling = None
+            if b is None:
+                trees.append(a)
+                break
+            following = b.sibling
+            b.prev = b.sibling = None
+            trees.append(link(a, b))
+            a = following
+
+        root = trees.pop()
+        while trees:
+            root = link(trees.pop(), root)
+        return root
+
+    @staticmethod
+    def _detach(node: _Node) -> None:
+        """Cuts a non-root node (and its subtree) out of the tree.
+
+        Parameters
+        ----------
+        node : ssds.PairingHeapPQ._Node
+            The node to detach.
+        """
+        prev = node.prev
+        sibling = node.sibling
+        if prev.child is node:
+            prev.child = sibling
+        else:
+            prev.sibling = sibling
+        if sibling is not None:
+            sibling.prev = prev
+        node.prev = node.sibling = None
+
+    # - - - - - - - - - - - - -
+    # Miscellaneous Utility Methods
+    # - - - - - - - - - - - - -
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if self._root is None:
+            raise RuntimeError('queue has size zero')
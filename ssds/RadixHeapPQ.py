@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+from ssds.abc.PriorityQueue import PriorityQueue
+
+
+class RadixHeapPQ(PriorityQueue):
+    """Radix-Heap Priority Queue.
+
+    A monotone priority queue for non-negative integer priorities. Items
+    are kept in buckets according to the highest bit in which their
+    priority differs from the priority at the front of the queue, so
+    removes cost amortized :math:`\\mathcal{O}(\\log(C))` for priorities
+    below :math:`C`, and adds and updates are :math:`\\mathcal{O}(1)`.
+
+    The queue is monotone: once an item has been returned by `get` or
+    `remove`, no priority may be set further forwards than that item's
+    priority. This holds for shortest-path searches and event
+    simulations, where the front of the queue never moves backwards.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    Examples
+    --------
+    >>> from ssds import RadixHeapPQ
+    >>> pq = RadixHeapPQ()
+    >>> pq.add('a', 3)
+    >>> pq.add('b', 5)
+    >>> pq.change_priority('b', 1)
+    >>> pq.remove()
+    'b'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        super().__init__(is_max)
+        self._buckets = [set()]
+        self._keys = {}
+        self._last = None
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: int) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : int
+            The extrinsic priority of the object. Must be a non-negative
+            integer no further forwards than the front of the queue.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        if item in self._keys:
+            raise ValueError('item already present')
+        key = self._key(priority)
+        self._keys[item] = key
+        self._bucket(key).add(item)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return item in self._keys
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        self._settle()
+        return next(iter(self._buckets[0]))
+
+    def remove(self):
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._validateSize()
+        self._settle()
+        item = self._buckets[0].pop()
+        del self._keys[item]
+        return item
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return len(self._keys)
+
+    def change_priority(self, item, priority: int) -> None:
+        """Moves the given item towards the front of the queue.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : int
+            The new priority to set the item to. Must not move the item
+            backwards, nor further forwards than the front of the queue.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        old = self._keys.get(item, None)
+        if old is None:
+            raise ValueError('item %s does not exist' % str(item))
+        key = self._key(priority)
+        if key > old:
+            raise ValueError('priority can only move towards the front of the queue')
+        self._bucket(old).remove(item)
+        self._keys[item] = key
+        self._bucket(key).add(item)
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    # - - - - - - - - - - - - -
+    # Bucket Manipulation Methods
+    # - - - - - - - - - - - - -
+
+    def _bucket(self, key: int) -> set:
+        """Returns the bucket a key belongs in, creating it if needed.
+
+        Until the front of the queue is first looked at, every item is kept
+        in bucket zero.
+
+        Parameters
+        ----------
+        key : int
+            The key to find the bucket of.
+
+        Returns
+        -------
+        set
+            The set of items in the bucket.
+        """
+        if self._last is None:
+            return self._buckets[0]
+        index = (key ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= index:
+            buckets.append(set())
+        return buckets[index]
+
+    def _settle(self) -> None:
+        """Makes bucket zero hold exactly the items at the front of the queue.
+
+        If bucket zero is empty, the first non-empty bucket is emptied and
+        its items are redistributed around the smallest key among them,
+        which all land in lower buckets.
+        """
+        buckets = self._buckets
+        if self._last is not None and buckets[0]:
+            return
+        index = 0
+        while not buckets[index]:
+            index += 1
+        bucket = buckets[index]
+        buckets[index] = set()
+        keys = self._keys
+        self._last = min(keys[item] for item in bucket)
+        for item in bucket:
+            self._bucket(keys[item]).add(item)
+
+    # - - - - - - - - - - - - -
+    # Miscellaneous Utility Methods
+    # - - - - - - - - - - - - -
+
+    def _key(self, priority: int) -> int:
+        """Converts a priority into the key used for ordering.
+
+        Parameters
+        ----------
+        priority : int
+            The priority to convert.
+
+        Returns
+        -------
+        int
+            The priority itself, or its bitwise complement for a maximum
+            priority queue, so that smaller keys always come first.
+        """
+        if not isinstance(priority, int) or priority < 0:
+            raise ValueError('priority must be a non-negative integer')
+        key = ~priority if self._max else priority
+        if self._last is not None and key < self._last:
+            raise ValueError('priority precedes the front of the queue')
+        return key
+
+    def _validateSize(self) -> None:
+        """Checks to see if the size of the queue is greater than zero.
+
+        Notes
+        -----
+        Raises a RuntimeError if the size of the queue <= 0.
+        """
+        if len(self._keys) == 0:
+            raise RuntimeError('queue has size zero')
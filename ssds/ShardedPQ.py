@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+from random import randrange
+from threading import Lock
+
+from ssds.abc.PriorityQueue import PriorityQueue
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+
+class ShardedPQ(PriorityQueue):
+    """Sharded Priority Queue (MultiQueue).
+
+    Spreads the items over several `ArrayHeapPQ` shards by their hash,
+    each with its own lock, so that threads working on different shards
+    do not contend. `contains` and `change_priority` only touch the shard
+    that owns the item.
+
+    By default, `remove` is relaxed: it looks at the front of two random
+    shards and removes from the better one, so it may return an item
+    slightly behind the true front of the queue. With `strict=True`,
+    `remove` always returns the true front, at the cost of locking every
+    shard.
+
+    Parameters
+    ----------
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    shards : int, default=4
+        The number of shards to spread the items over.
+
+    strict : bool, default=False
+        Selects whether `remove` must return the true front of the queue.
+
+    Examples
+    --------
+    >>> from ssds import ShardedPQ
+    >>> pq = ShardedPQ(strict=True)
+    >>> pq.add('a', 1)
+    >>> pq.add('b', 2)
+    >>> pq.change_priority('b', 0)
+    >>> pq.remove()
+    'b'
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, is_max=False, shards=4, strict=False):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if shards < 1:
+            raise ValueError('shards must be at least 1')
+        super().__init__(is_max)
+        self._shards = [ArrayHeapPQ(is_max) for _ in range(shards)]
+        self._locks = [Lock() for _ in range(shards)]
+        self._strict = strict
+        self._max = is_max
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def add(self, item, priority: float) -> None:
+        """Adds an item to the shard that owns it.
+
+        Parameters
+        ----------
+        item
+            An item to be inserted into the queue. Must be hashable.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        index = hash(item) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index].add(item, priority)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        return self._shards[hash(item) % len(self._shards)].contains(item)
+
+    def get(self):
+        """Returns the first item in the priority queue.
+
+        Always returns the true front of the queue, even when `remove` is
+        relaxed. Does not remove the item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The foremost item in the priority queue.
+        """
+        self._lock_all()
+        try:
+            return self._shards[self._best_shard()].get()
+        finally:
+            self._unlock_all()
+
+    def remove(self):
+        """Removes and returns an item at or near the front of the queue.
+
+        In relaxed mode, removes the front of the better of two random
+        shards. In strict mode, removes the true front of the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        object
+            The removed item.
+        """
+        if not self._strict:
+            shards = self._shards
+            first = randrange(len(shards))
+            second = randrange(len(shards))
+            # The chosen shard may have changed since the peek, so it is
+            # re-checked below
+            front = self._peek(first)
+            other = self._peek(second)
+            if other is not None and (front is None or other[1] < front[1]):
+                first = second
+            with self._locks[first]:
+                if shards[first].size() > 0:
+                    return shards[first].remove()
+
+        self._lock_all()
+        try:
+            return self._shards[self._best_shard()].remove()
+        finally:
+            self._unlock_all()
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        return sum(shard.size() for shard in self._shards)
+
+    def change_priority(self, item, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : any
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        index = hash(item) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index].change_priority(item, priority)
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    def _peek(self, index: int) -> tuple:
+        """Returns the front node of a shard, unless it is empty or busy.
+
+        Only waits for the shard's lock if nothing else holds it, as a
+        shard in use by another thread is a poor choice to remove from.
+
+        Parameters
+        ----------
+        index : int
+            The index of the shard.
+
+        Returns
+        -------
+        tuple
+            The `(item, priority)` pair at the front of the shard, with the
+            priority as stored by the shard, or None if the shard is empty
+            or its lock is held.
+        """
+        lock = self._locks[index]
+        if not lock.acquire(blocking=False):
+            return None
+        try:
+            return self._front(index)
+        finally:
+            lock.release()
+
+    def _front(self, index: int) -> tuple:
+        """Returns the front node of a shard, or None if it is empty.
+
+        Must be called with the shard's lock held.
+
+        Parameters
+        ----------
+        index : int
+            The index of the shard.
+
+        Returns
+        -------
+        tuple
+            The `(item, priority)` pair at the front of the shard, with the
+            priority as stored by the shard.
+        """
+        nodes = self._shards[index]._nodes
+        return nodes[1] if len(nodes) > 1 else None
+
+    def _best_shard(self) -> int:
+        """Returns the index of the shard holding the true front.
+
+        Must be called with every lock held.
+
+        Returns
+        -------
+        int
+            The index of the shard whose front comes first.
+
+        Notes
+        -----
+        Raises a RuntimeError if every shard is empty.
+        """
+        best = None
+        bestFront = None
+        for index in range(len(self._shards)):
+            front = self._front(index)
+            if front is not None and (bestFront is None or front[1] < bestFront[1]):
+                best = index
+                bestFront = front
+        if best is None:
+            raise RuntimeError('queue has size zero')
+        return best
+
+    def _lock_all(self) -> None:
+        """Acquires every shard's lock, in order."""
+        for lock in self._locks:
+            lock.acquire()
+
+    def _unlock_all(self) -> None:
+        """Releases every shard's lock."""
+        for lock in reversed(self._locks):
+            lock.release()
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+import sys
+from multiprocessing import RLock
+
+from ssds.NumericHeapPQ import NumericHeapPQ
+
+_HEADER_WORDS = 3
+"""int: The number of 64-bit words before the heap (size, capacity, is_max)."""
+
+
+class SharedHeapPQ(NumericHeapPQ):
+    """Shared-Memory Heap Priority Queue.
+
+    A `NumericHeapPQ` whose arrays live in a block of shared memory, so
+    that several processes on one machine can use the same queue directly.
+    Every method holds a lock that is shared between the processes.
+
+    Other processes get access to the queue by receiving it as an argument
+    to `multiprocessing.Process` (or via `attach`). The process that
+    created the queue should call `unlink` once every process is done, and
+    every process should call `close`.
+
+    Before Python 3.13, opening the block in another process (through
+    `attach` or by unpickling the queue) registers it with
+    `multiprocessing.resource_tracker`. Child processes share their
+    parent's resource tracker, so this is harmless for them. A process
+    that is not a child of the creator has a tracker of its own, which
+    unlinks the block when that process exits, with a warning about
+    leaked shared memory, even if other processes are still using the
+    queue. From Python 3.13, the block is opened without registering it.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of distinct items the queue can hold. Items must be
+        integers in `range(capacity)`.
+
+    is_max : bool, default=False
+        Selects whether the priority queue should dequeue the item with
+        the maximum priority (instead of the minimum priority).
+
+    lock : multiprocessing.RLock, optional
+        The lock that guards the queue. A new one is created if not given.
+
+    Examples
+    --------
+    >>> from multiprocessing import Process
+    >>> from ssds import SharedHeapPQ
+    >>> pq = SharedHeapPQ(10)
+    >>> worker = Process(target=pq.add, args=(3, 1.0))
+    >>> worker.start()
+    >>> worker.join()
+    >>> pq.remove()
+    3
+    >>> pq.close()
+    >>> pq.unlink()
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, capacity: int, is_max=False, lock=None):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        self._lock = RLock() if lock is None else lock
+        super().__init__(capacity, is_max)
+
+    @classmethod
+    def attach(cls, name: str, lock) -> 'SharedHeapPQ':
+        """Opens a queue that another process created.
+
+        Parameters
+        ----------
+        name : str
+            The name of the queue's shared memory block (see `name`).
+
+        lock : multiprocessing.RLock
+            The lock the queue was created with.
+
+        Returns
+        -------
+        SharedHeapPQ
+            A view of the existing queue.
+        """
+        pq = cls.__new__(cls)
+        pq._lock = lock
+        pq._open(_open_block(name))
+        return pq
+
+    def __getstate__(self):
+        return self._shm.name, self._lock
+
+    def __setstate__(self, state):
+        name, self._lock = state
+        self._open(_open_block(name))
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    @property
+    def name(self) -> str:
+        """str: The name of the queue's shared memory block."""
+        return self._shm.name
+
+    def add(self, item: int, priority: float) -> None:
+        """Adds an item to the priority queue.
+
+        Parameters
+        ----------
+        item : int
+            An item to be inserted into the queue. Must be an integer in
+            `range(capacity)`.
+
+        priority : float
+            The extrinsic priority of the object.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        with self._lock:
+            super().add(item, priority)
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is in the priority queue or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of in the priority queue.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is in the priority queue;
+            False otherwise.
+        """
+        with self._lock:
+            return super().contains(item)
+
+    def get(self) -> int:
+        """Returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue. Does not remove
+        the minimum/maximum item from the queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The foremost item in the priority queue.
+        """
+        with self._lock:
+            return super().get()
+
+    def remove(self) -> int:
+        """Removes and returns the first item in the priority queue.
+
+        Which (i.e. minimum or maximum) depends on if the priority queue was
+        initialized as a minimum or maximum priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The foremost item in the priority queue.
+        """
+        with self._lock:
+            return super().remove()
+
+    def size(self) -> int:
+        """Returns the number of items in the priority queue.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of items in the priority queue.
+        """
+        with self._lock:
+            return super().size()
+
+    def change_priority(self, item: int, priority: float) -> None:
+        """Changes the priority of the given item.
+
+        Parameters
+        ----------
+        item : int
+            The item in the priority queue to modify the priority of.
+
+        priority : double
+            The new priority to set the item to.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        with self._lock:
+            super().change_priority(item, priority)
+
+    def close(self) -> None:
+        """Closes this process's access to the queue.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the queue's shared memory block.
+
+        Should be called once, by the process that created the queue.
+
+        Returns
+        -------
+        None
+            Nothing.
+        """
+        self._shm.unlink()
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    @property
+    def _size(self) -> int:
+        return self._header[0]
+
+    @_size.setter
+    def _size(self, value: int) -> None:
+        self._header[0] = value
+
+    def _allocate(self, capacity: int) -> None:
+        """Creates a zeroed block of shared memory that holds the heap.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of distinct items the queue can hold.
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        # New shared memory is zero-filled, so every position starts empty
+        shm = SharedMemory(create=True, size=8 * (_HEADER_WORDS + 3 * capacity + 1))
+        header = shm.buf.cast('q')
+        header[1] = capacity
+        header[2] = int(self._max)
+        header.release()
+        self._open(shm)
+
+    def _open(self, shm) -> None:
+        """Points the heap arrays at a block of shared memory.
+
+        The block is laid out as the header, the heap, the positions (all
+        64-bit integers), and then the priorities (64-bit floats).
+
+        Parameters
+        ----------
+        shm : multiprocessing.shared_memory.SharedMemory
+            The block holding the queue.
+        """
+        words = shm.buf.cast('q')
+        capacity = words[1]
+        start = _HEADER_WORDS
+        heap = words[start:start + capacity + 1]
+        start += capacity + 1
+        positions = words[start:start + capacity]
+        start += capacity
+        floats = shm.buf[8 * start:8 * (start + capacity)]
+        priorities = floats.cast('d')
+
+        self._shm = shm
+        self._views = [words, heap, positions, floats, priorities]
+        self._header = words
+        self._heap = heap
+        self._positions = positions
+        self._priorities = priorities
+        self._capacity = capacity
+        self._max = bool(words[2])
+
+
+def _open_block(name: str):
+    """Opens an existing block of shared memory.
+
+    Parameters
+    ----------
+    name : str
+        The name of the block.
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The opened block, not registered with the resource tracker where
+        the Python version allows it.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+from operator import itemgetter
+
+from ssds.ArrayHeapPQ import ArrayHeapPQ
+
+
+class TimerWheel:
+    """Hierarchical Timer Wheel.
+
+    A scheduler for timeouts, where most deadlines are cancelled or moved
+    before they are reached. Time is divided into ticks of `resolution`,
+    and each item is kept in a slot of one of `levels` wheels: the first
+    wheel has one slot per tick, and each slot of the next wheel covers a
+    whole turn of the one below it. Deadlines beyond the last wheel are kept
+    in an `ArrayHeapPQ` until the wheels come within range of them.
+
+    Scheduling, cancelling and rescheduling take :math:`\\mathcal{O}(1)`
+    time (or :math:`\\mathcal{O}(\\log(n))` time for the far-future
+    deadlines held by the heap). An item is moved down at most once per
+    wheel on its way to expiring, and `pop_expired` skips over empty slots,
+    so advancing the time costs little more than the items that expire.
+
+    Deadlines and times are numbers in any unit, e.g. the values of
+    `time.monotonic`. The `resolution` does not affect which items expire,
+    only how many items share a slot.
+
+    Parameters
+    ----------
+    resolution : float, default=1.0
+        The length of one tick.
+
+    slots : int, default=256
+        The number of slots in each wheel. Must be a power of two.
+
+    levels : int, default=4
+        The number of wheels. Together, they cover ``slots ** levels``
+        ticks past the current time.
+
+    start : float, default=0.0
+        The time to start the wheels at. Deadlines before it are due from
+        the first call of `pop_expired`.
+
+    Examples
+    --------
+    >>> from ssds import TimerWheel
+    >>> wheel = TimerWheel()
+    >>> wheel.schedule('a', 5)
+    >>> wheel.schedule('b', 3)
+    >>> wheel.schedule('c', 10 ** 12)
+    >>> wheel.reschedule('a', 2.5)
+    >>> wheel.pop_expired(4)
+    ['a', 'b']
+    >>> wheel.cancel('c')
+    True
+    """
+
+    # = = = = = = = = = = = = =
+    # CONSTRUCTOR
+    # = = = = = = = = = = = = =
+
+    def __init__(self, resolution=1.0, slots=256, levels=4, start=0.0):
+        """Initialize self. See help(type(self)) for accurate signature."""
+
+        if resolution <= 0:
+            raise ValueError('resolution must be positive')
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError('slots must be a power of two')
+        if levels < 1:
+            raise ValueError('levels must be at least 1')
+        self._resolution = resolution
+        self._origin = start
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._wheels = [{} for _ in range(levels)]
+        self._overflow = ArrayHeapPQ()
+        self._locations = {}
+        self._current = 0
+
+    # = = = = = = = = = = = = =
+    # PUBLIC METHODS
+    # = = = = = = = = = = = = =
+
+    def schedule(self, item, deadline: float) -> None:
+        """Adds an item to expire at the given time.
+
+        Parameters
+        ----------
+        item
+            An item to be scheduled. Must be hashable.
+
+        deadline : float
+            The time at which the item expires.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item is already scheduled.
+        """
+        if item in self._locations:
+            raise ValueError('item already present')
+        self._place(item, deadline)
+
+    def cancel(self, item) -> bool:
+        """Removes the given item, if it is scheduled.
+
+        Parameters
+        ----------
+        item
+            The item to cancel.
+
+        Returns
+        -------
+        bool
+            True if `item` was scheduled; False otherwise.
+        """
+        location = self._locations.pop(item, None)
+        if location is None:
+            return False
+        level, index = location
+        if index is None:
+            self._overflow.discard(item)
+        else:
+            wheel = self._wheels[level]
+            slot = wheel[index]
+            del slot[item]
+            if not slot:
+                del wheel[index]
+        return True
+
+    def reschedule(self, item, deadline: float) -> None:
+        """Changes the time at which the given item expires.
+
+        Parameters
+        ----------
+        item
+            The scheduled item to move.
+
+        deadline : float
+            The new time at which the item expires.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ValueError
+            If the item isn't scheduled.
+        """
+        if not self.cancel(item):
+            raise ValueError('item %s does not exist' % str(item))
+        self._place(item, deadline)
+
+    def pop_expired(self, now: float) -> list:
+        """Removes and returns every item whose deadline has been reached.
+
+        Parameters
+        ----------
+        now : float
+            The current time. Items with a deadline at or before it expire.
+            If it is earlier than in a previous call, only items scheduled
+            since then can expire.
+
+        Returns
+        -------
+        list
+            The expired items, in order of deadline.
+        """
+        wheels = self._wheels
+        bits = self._bits
+        mask = self._mask
+        target = self._tick(now)
+        if target <= self._current:
+            # Still within the current tick, whose slot is all that can be due
+            if self._current & mask not in wheels[0]:
+                return []
+            target = self._current
+        expired = []
+
+        while True:
+            current = self._current
+            lowest = wheels[0]
+            sameTurn = target >> bits == current >> bits
+            if lowest:
+                # Every slot of the lowest wheel is at or after the current
+                # tick, and in the same turn
+                first = current & mask
+                last = target & mask if sameTurn else mask
+                if last - first < len(lowest):
+                    indices = [index for index in range(first, last + 1)
+                               if index in lowest]
+                else:
+                    indices = sorted(index for index in lowest if index <= last)
+                for index in indices:
+                    self._expire(lowest, index, index == last and sameTurn,
+                                 now, expired)
+            if sameTurn:
+                self._current = target
+                break
+
+            # The lowest wheel is empty up to the end of its turn, so jump
+            # straight to the next occupied slot of a higher wheel
+            level = 1
+            while level < len(wheels) and not wheels[level]:
+                level += 1
+            if level < len(wheels):
+                index = min(wheels[level])
+                shift = bits * level
+                start = (current >> (shift + bits) << bits | index) << shift
+                if start > target:
+                    self._current = target
+                    break
+                self._current = start
+                self._cascade(wheels[level].pop(index))
+            else:
+                if self._overflow.size() == 0:
+                    self._current = target
+                    break
+                self._current = min(self._tick(self._overflow.peek_k(
+                    1, with_priorities=True)[0][1]), target)
+                self._refill()
+
+        expired.sort(key=itemgetter(1))
+        return [item for item, _ in expired]
+
+    def contains(self, item) -> bool:
+        """Returns whether the item is scheduled or not.
+
+        Parameters
+        ----------
+        item
+            An item to test the membership of.
+
+        Returns
+        -------
+        bool
+            Returns True if `item` is scheduled; False otherwise.
+        """
+        return item in self._locations
+
+    def size(self) -> int:
+        """Returns the number of scheduled items.
+
+        Parameters
+        ----------
+        N/A
+
+        Returns
+        -------
+        int
+            The number of scheduled items.
+        """
+        return len(self._locations)
+
+    # = = = = = = = = = = = = =
+    # PRIVATE METHODS
+    # = = = = = = = = = = = = =
+
+    def _tick(self, time: float) -> int:
+        """Converts a time into the number of the tick containing it.
+
+        Parameters
+        ----------
+        time : float
+            The time to convert.
+
+        Returns
+        -------
+        int
+            The tick, counted from the start time.
+        """
+        return int((time - self._origin) // self._resolution)
+
+    def _place(self, item, deadline: float) -> None:
+        """Puts an item into the wheel that covers its deadline.
+
+        The item goes into the lowest wheel whose current turn includes the
+        deadline's tick, or into the overflow heap if there is none.
+        Deadlines before the current tick go into the current tick's slot.
+
+        Parameters
+        ----------
+        item
+            The item to place.
+
+        deadline : float
+            The time at which the item expires.
+        """
+        current = self._current
+        bits = self._bits
+        tick = int((deadline - self._origin) // self._resolution)
+        if tick <= current:
+            tick = current
+            level = 0
+        else:
+            level = ((tick ^ current).bit_length() - 1) // bits
+        if level >= len(self._wheels):
+            self._overflow.add(item, deadline)
+            self._locations[item] = (level, None)
+            return
+        index = tick >> bits * level & self._mask
+        wheel = self._wheels[level]
+        slot = wheel.get(index)
+        if slot is None:
+            slot = wheel[index] = {}
+        slot[item] = deadline
+        self._locations[item] = (level, index)
+
+    def _cascade(self, slot: dict) -> None:
+        """Moves the items of a slot that has been reached into lower wheels.
+
+        Parameters
+        ----------
+        slot : dict
+            The slot's items, mapped to their deadlines.
+        """
+        place = self._place
+        for item, deadline in slot.items():
+            place(item, deadline)
+
+    def _refill(self) -> None:
+        """Moves the items that the wheels now cover out of the overflow heap.
+
+        Called after the current tick has jumped ahead while the wheels
+        were empty.
+        """
+        overflow = self._overflow
+        shift = self._bits * len(self._wheels)
+        turn = self._current >> shift
+        while overflow.size() > 0:
+            item, deadline = overflow.peek_k(1, with_priorities=True)[0]
+            if self._tick(deadline) >> shift != turn:
+                break
+            overflow.remove()
+            self._place(item, deadline)
+
+    def _expire(self, wheel: dict, index: int, partial: bool, now: float,
+                expired: list) -> None:
+        """Takes the expired items out of a slot of the lowest wheel.
+
+        Parameters
+        ----------
+        wheel : dict
+            The lowest wheel.
+
+        index : int
+            The index of the slot.
+
+        partial : bool
+            Selects whether the slot is for the tick containing `now`, in
+            which case only the items with a deadline at or before `now` are
+            taken.
+
+        now : float
+            The current time.
+
+        expired : list
+            The list to append the `(item, deadline)` pairs to.
+        """
+        locations = self._locations
+        slot = wheel[index]
+        if partial:
+            due = [pair for pair in slot.items() if pair[1] <= now]
+            for item, _ in due:
+                del slot[item]
+            if not slot:
+                del wheel[index]
+        else:
+            due = list(slot.items())
+            del wheel[index]
+        for item, _ in due:
+            del locations[item]
+        expired.extend(due)
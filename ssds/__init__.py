@@ -1 +1,16 @@
 from ssds.ArrayHeapPQ import ArrayHeapPQ
+from ssds.DaryHeapPQ import DaryHeapPQ
+from ssds.NumericHeapPQ import NumericHeapPQ
+from ssds.PairingHeapPQ import PairingHeapPQ
+from ssds.RadixHeapPQ import RadixHeapPQ
+from ssds.BucketPQ import BucketPQ
+from ssds.ConcurrentPQ import ConcurrentPQ
+from ssds.AsyncPQ import AsyncPQ
+from ssds.SharedHeapPQ import SharedHeapPQ
+from ssds.ShardedPQ import ShardedPQ
+from ssds.ExternalPQ import ExternalPQ
+from ssds.InstrumentedPQ import InstrumentedPQ
+from ssds.CompactHeapPQ import CompactHeapPQ
+from ssds.MinMaxHeapPQ import MinMaxHeapPQ
+from ssds.TimerWheel import TimerWheel
+from ssds.BoundedPQ import BoundedPQ
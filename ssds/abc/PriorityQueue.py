@@ -14,6 +14,10 @@ class PriorityQueue(ABC):
     Priorities are independent of the objects being enqueued and must be
     supplied seperately.
     """
+
+    # Lets implementations use __slots__ to do without an instance dict
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, is_max=False):
         """Constructs a priority queue.
@@ -27,6 +31,35 @@ class PriorityQueue(ABC):
         """
         pass
 
+    @classmethod
+    def from_iterable(cls, items, priorities=None, is_max=False):
+        """Constructs a priority queue holding the given items.
+
+        The items can either be supplied as an iterable of
+        `(item, priority)` pairs, or as two parallel sequences of items
+        and priorities. Implementations may override this to build the
+        queue faster than repeated calls to `add`.
+
+        Args:
+            items: An iterable of `(item, priority)` pairs, or an iterable
+                of items if `priorities` is given.
+            priorities (optional): An iterable of priorities parallel to
+                `items`.
+            is_max (:obj:`bool`, optional): Whether to make a maximum
+                priority queue or not
+
+        Returns:
+            PriorityQueue: A new priority queue containing the items.
+
+        Raises:
+            ValueError: If an item is present more than once, or if
+                `items` and `priorities` differ in length.
+        """
+        pq = cls(is_max)
+        for item, priority in cls._pairs(items, priorities):
+            pq.add(item, priority)
+        return pq
+
     @abstractmethod
     def add(self, item, priority: float) -> None:
         """Adds an item with the given priority value.
@@ -107,3 +140,78 @@ class PriorityQueue(ABC):
             ValueError: If the item isn't in the queue.
         """
         pass
+
+    def add_many(self, items, priorities=None) -> None:
+        """Adds a collection of items.
+
+        Implementations may override this to add the items faster than
+        repeated calls to `add`.
+
+        Args:
+            items: An iterable of `(item, priority)` pairs, or an iterable
+                of items if `priorities` is given.
+            priorities (optional): An iterable of priorities parallel to
+                `items`.
+
+        Raises:
+            ValueError: If an item is already present, or if `items` and
+                `priorities` differ in length.
+        """
+        for item, priority in self._pairs(items, priorities):
+            self.add(item, priority)
+
+    def change_priority_many(self, items, priorities=None) -> None:
+        """Changes the priorities of a collection of items.
+
+        Implementations may override this to change the priorities faster
+        than repeated calls to `change_priority`.
+
+        Args:
+            items: An iterable of `(item, priority)` pairs, or an iterable
+                of items if `priorities` is given.
+            priorities (optional): An iterable of priorities parallel to
+                `items`.
+
+        Raises:
+            ValueError: If an item isn't in the queue, or if `items` and
+                `priorities` differ in length.
+        """
+        for item, priority in self._pairs(items, priorities):
+            self.change_priority(item, priority)
+
+    def remove_many(self, k: int) -> list:
+        """Removes and returns the first `k` items.
+
+        Args:
+            k (:obj:`int`): The number of items to remove. If the queue
+                holds fewer items, all of them are removed.
+
+        Returns:
+            list: The removed items, in the order `remove` would return
+            them.
+        """
+        return [self.remove() for _ in range(min(k, self.size()))]
+
+    @staticmethod
+    def _pairs(items, priorities=None) -> list:
+        """Normalizes the arguments of `from_iterable` into pairs.
+
+        Args:
+            items: An iterable of `(item, priority)` pairs, or an iterable
+                of items if `priorities` is given.
+            priorities (optional): An iterable of priorities parallel to
+                `items`.
+
+        Returns:
+            list: A list of `(item, priority)` pairs.
+
+        Raises:
+            ValueError: If `items` and `priorities` differ in length.
+        """
+        if priorities is None:
+            return [(item, priority) for item, priority in items]
+        items = list(items)
+        priorities = list(priorities)
+        if len(items) != len(priorities):
+            raise ValueError('items and priorities differ in length')
+        return list(zip(items, priorities))
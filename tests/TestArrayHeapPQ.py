@@ -5,13 +5,17 @@ Contains a mixture of non-randomized and randomized testing. In addition,
 some tests measure the performance of the data structure.
 """
 
+import os
+import pickle
+import tempfile
 import unittest
 from enum import Enum
+from functools import partial
 from math import floor, log2
 from random import choice, random, randrange
 from time import perf_counter
 
-from ssds import ArrayHeapPQ
+from ssds import ArrayHeapPQ, DaryHeapPQ, NumericHeapPQ, PairingHeapPQ
 from ssds.abc import PriorityQueue
 from ssds.reference import ReferencePQ
 
@@ -21,6 +25,15 @@ _MAX_VAL = 1000
 _MAX_PRIORITY = 1000
 """int: The maximum priority that can be assigned."""
 
+_STRUCTS = {
+    'ArrayHeapPQ': ArrayHeapPQ,
+    'DaryHeapPQ (arity=4)': partial(DaryHeapPQ, arity=4),
+    'DaryHeapPQ (arity=8)': partial(DaryHeapPQ, arity=8),
+    'NumericHeapPQ': partial(NumericHeapPQ, 100_000),
+    'PairingHeapPQ': PairingHeapPQ,
+}
+"""dict: The priority queue classes to time, keyed by display name."""
+
 
 class _Method(Enum):
     ADD = 0
@@ -105,6 +118,319 @@ class TestArrayHeapPQ(unittest.TestCase):
             else:
                 continue
 
+    def test_change_priority(self):
+        for is_max in [False, True]:
+            ahpq = ArrayHeapPQ(is_max)
+            npq = ReferencePQ(is_max)
+            for val in range(_MAX_VAL):
+                priority = random() * _MAX_PRIORITY
+                ahpq.add(val, priority)
+                npq.add(val, priority)
+
+            for _ in range(10_000):
+                val = randrange(_MAX_VAL)
+                if not npq.contains(val):
+                    with self.assertRaises(ValueError):
+                        ahpq.change_priority(val, 0)
+                    continue
+                priority = random() * _MAX_PRIORITY
+                ahpq.change_priority(val, priority)
+                npq.change_priority(val, priority)
+                self.assertEqual(npq.get(), ahpq.get())
+                if random() < 0.05:
+                    self.assertEqual(npq.remove(), ahpq.remove())
+
+            for val, index in ahpq._locations.items():
+                self.assertEqual(val, ahpq._nodes[index][0])
+            while npq.size() > 0:
+                self.assertEqual(npq.remove(), ahpq.remove())
+
+    def test_from_iterable(self):
+        for is_max in [False, True]:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            ahpq = ArrayHeapPQ.from_iterable(vals, priorities, is_max)
+            npq = ReferencePQ.from_iterable(zip(vals, priorities), is_max=is_max)
+
+            for val in vals:
+                self.assertEqual(val, ahpq._nodes[ahpq._locations[val]][0])
+            while npq.size() > 0:
+                self.assertEqual(npq.size(), ahpq.size())
+                self.assertEqual(npq.remove(), ahpq.remove())
+            self.assertEqual(0, ahpq.size())
+
+        with self.assertRaises(ValueError):
+            ArrayHeapPQ.from_iterable([('a', 1), ('b', 2), ('a', 3)])
+        with self.assertRaises(ValueError):
+            ArrayHeapPQ.from_iterable(['a', 'b'], [1])
+
+    def test_batch(self):
+        for is_max in [False, True]:
+            ahpq = ArrayHeapPQ(is_max)
+            npq = ReferencePQ(is_max)
+
+            # Small batches sift each item, large batches re-heapify
+            for size in [10, 5, 500, 20, 2000]:
+                vals = [npq.size() + i for i in range(size)]
+                priorities = [random() * _MAX_PRIORITY for _ in vals]
+                ahpq.add_many(vals, priorities)
+                npq.add_many(zip(vals, priorities))
+                self.assertEqual(npq.size(), ahpq.size())
+                self.assertEqual(npq.get(), ahpq.get())
+
+                changes = [(randrange(npq.size()), random() * _MAX_PRIORITY)
+                           for _ in range(size)]
+                ahpq.change_priority_many(changes)
+                npq.change_priority_many(changes)
+                self.assertEqual(npq.get(), ahpq.get())
+
+            for val, index in ahpq._locations.items():
+                self.assertEqual(val, ahpq._nodes[index][0])
+            self.assertEqual(npq.remove_many(100), ahpq.remove_many(100))
+            self.assertEqual(npq.remove_many(10_000), ahpq.remove_many(10_000))
+            self.assertEqual(0, ahpq.size())
+
+        # Invalid batches leave the queue untouched
+        ahpq = ArrayHeapPQ.from_iterable([('a', 1), ('b', 2)])
+        with self.assertRaises(ValueError):
+            ahpq.add_many([('c', 3), ('a', 4)])
+        with self.assertRaises(ValueError):
+            ahpq.add_many([('c', 3), ('c', 4)])
+        with self.assertRaises(ValueError):
+            ahpq.change_priority_many([('a', 3), ('c', 4)])
+        self.assertEqual(['a', 'b'], ahpq.remove_many(3))
+
+    def test_pop_until(self):
+        ahpq = ArrayHeapPQ.from_iterable(range(10), range(10))
+        self.assertEqual([], ahpq.pop_until(-1))
+        self.assertEqual([0, 1, 2, 3], ahpq.pop_until(3))
+        self.assertEqual([4], ahpq.pop_until(4.5))
+        self.assertEqual([5, 6, 7, 8, 9], ahpq.pop_until(100))
+        self.assertEqual([], ahpq.pop_until(100))
+
+        ahpq = ArrayHeapPQ.from_iterable(range(10), range(10), is_max=True)
+        self.assertEqual([9, 8, 7], ahpq.pop_until(7))
+        self.assertEqual(7, ahpq.size())
+
+    def test_peek_k(self):
+        for is_max in [False, True]:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            ahpq = ArrayHeapPQ.from_iterable(vals, priorities, is_max)
+            expected = sorted(zip(vals, priorities), key=lambda x: x[1],
+                              reverse=is_max)
+
+            for k in [0, 1, 2, 10, 100, _MAX_VAL + 1]:
+                self.assertEqual([val for val, _ in expected[:k]], ahpq.peek_k(k))
+                self.assertEqual(expected[:k], ahpq.peek_k(k, with_priorities=True))
+            self.assertEqual(_MAX_VAL, ahpq.size())
+        self.assertEqual([], ArrayHeapPQ().peek_k(3))
+
+    def test_drain(self):
+        for is_max in [False, True]:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            ahpq = ArrayHeapPQ.from_iterable(vals, priorities, is_max)
+            expected = sorted(zip(vals, priorities), key=lambda x: x[1],
+                              reverse=is_max)
+
+            self.assertEqual(expected, ahpq.sorted_items())
+            self.assertEqual(_MAX_VAL, ahpq.size())
+
+            drained = []
+            for pair in ahpq.drain():
+                drained.append(pair)
+                if len(drained) == 10:
+                    break
+            self.assertEqual(_MAX_VAL - 10, ahpq.size())
+            drained.extend(ahpq.drain())
+            self.assertEqual(expected, drained)
+            self.assertEqual(0, ahpq.size())
+
+    def test_upsert(self):
+        for is_max in [False, True]:
+            sign = -1 if is_max else 1
+            ahpq = ArrayHeapPQ(is_max)
+            npq = ReferencePQ(is_max)
+            priorities = {}
+
+            for _ in range(20_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # push_or_update
+                    ahpq.push_or_update(val, priority)
+                    if val in priorities:
+                        npq.change_priority(val, priority)
+                    else:
+                        npq.add(val, priority)
+                    priorities[val] = priority
+                elif j == 1:  # push_or_improve
+                    improves = val not in priorities or \
+                        (priority - priorities[val]) * sign < 0
+                    self.assertEqual(improves, ahpq.push_or_improve(val, priority))
+                    if val not in priorities:
+                        npq.add(val, priority)
+                        priorities[val] = priority
+                    elif improves:
+                        npq.change_priority(val, priority)
+                        priorities[val] = priority
+                elif j == 2:  # decrease_key and increase_key
+                    if val not in priorities:
+                        with self.assertRaises(ValueError):
+                            ahpq.decrease_key(val, priority)
+                        continue
+                    if priority < priorities[val]:
+                        ahpq.decrease_key(val, priority)
+                        with self.assertRaises(ValueError):
+                            ahpq.increase_key(val, priority - 1)
+                    else:
+                        ahpq.increase_key(val, priority)
+                        with self.assertRaises(ValueError):
+                            ahpq.decrease_key(val, priority + 1)
+                    npq.change_priority(val, priority)
+                    priorities[val] = priority
+                elif npq.size() > 0:  # remove
+                    val = npq.remove()
+                    self.assertEqual(val, ahpq.remove())
+                    del priorities[val]
+
+            self.assertEqual(npq.remove_many(_MAX_VAL), ahpq.remove_many(_MAX_VAL))
+
+    def test_discard(self):
+        for is_max in [False, True]:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            ahpq = ArrayHeapPQ.from_iterable(vals, priorities, is_max)
+            remaining = dict(zip(vals, priorities))
+
+            for _ in range(_MAX_VAL // 2):
+                val = randrange(_MAX_VAL)
+                self.assertEqual(val in remaining, ahpq.discard(val))
+                remaining.pop(val, None)
+            self.assertEqual(len(remaining), ahpq.size())
+
+            # Few discards go one at a time, many re-heapify
+            for size in [10, len(remaining) // 2]:
+                batch = [randrange(_MAX_VAL) for _ in range(size)]
+                present = {val for val in batch if val in remaining}
+                self.assertEqual(len(present), ahpq.discard_many(batch))
+                for val in present:
+                    del remaining[val]
+
+            for val, index in ahpq._locations.items():
+                self.assertEqual(val, ahpq._nodes[index][0])
+            npq = ReferencePQ.from_iterable(remaining.items(), is_max=is_max)
+            self.assertEqual(npq.remove_many(_MAX_VAL), ahpq.remove_many(_MAX_VAL))
+
+    def test_merge(self):
+        for is_max in [False, True]:
+            # Both small merges (sifting) and large ones (re-heapifying)
+            for size, otherSize in [(1000, 10), (10, 1000), (0, 100), (100, 0)]:
+                for duplicates in ['error', 'keep_best', 'keep_first']:
+                    first = {i: random() * _MAX_PRIORITY for i in range(size)}
+                    second = {i + size // 2: random() * _MAX_PRIORITY for i in range(otherSize)}
+                    ahpq = ArrayHeapPQ.from_iterable(first.items(), is_max=is_max)
+                    other = ArrayHeapPQ.from_iterable(second.items(), is_max=is_max)
+                    shared = first.keys() & second.keys()
+
+                    if duplicates == 'error' and shared:
+                        with self.assertRaises(ValueError):
+                            ahpq.merge(other)
+                        self.assertEqual(sorted(first.items(), key=lambda x: x[1], reverse=is_max),
+                                         ahpq.sorted_items())
+                        continue
+
+                    expected = dict(second)
+                    expected.update(first)
+                    if duplicates == 'keep_best':
+                        best = max if is_max else min
+                        for item in shared:
+                            expected[item] = best(first[item], second[item])
+                    union = ArrayHeapPQ.union(ahpq, other, duplicates=duplicates)
+                    ahpq.merge(other, duplicates)
+                    for pq in [ahpq, union]:
+                        for item, index in pq._locations.items():
+                            self.assertEqual(item, pq._nodes[index][0])
+                        self.assertEqual(sorted(expected.items(), key=lambda x: x[1], reverse=is_max),
+                                         list(pq.drain()))
+                    self.assertEqual(otherSize, other.size())
+
+        with self.assertRaises(ValueError):
+            ArrayHeapPQ().merge(ArrayHeapPQ(is_max=True))
+        with self.assertRaises(ValueError):
+            ArrayHeapPQ().merge(ArrayHeapPQ(), duplicates='keep_last')
+        self.assertEqual(0, ArrayHeapPQ.union().size())
+
+        # Merging a queue into itself shares every item
+        ahpq = ArrayHeapPQ.from_iterable(range(10), range(10))
+        with self.assertRaises(ValueError):
+            ahpq.merge(ahpq)
+        ahpq.merge(ahpq, duplicates='keep_best')
+        self.assertEqual(list(range(10)), ahpq.remove_many(10))
+        ahpq.merge(ahpq)
+
+        # A d-ary union keeps the arity of the first queue
+        dhpq = DaryHeapPQ.from_iterable(range(100), range(100, 0, -1), arity=8)
+        union = DaryHeapPQ.union(dhpq)
+        self.assertEqual(8, union._arity)
+        self.assertEqual(dhpq._nodes, union._nodes)
+
+        # A union of heaps of another arity is re-heapified
+        dhpq = DaryHeapPQ.from_iterable(range(100), range(100, 0, -1), arity=8)
+        union = ArrayHeapPQ.union(dhpq, ArrayHeapPQ.from_iterable([(100, 0.5)]))
+        self.assertEqual([100] + list(range(99, -1, -1)), union.remove_many(101))
+
+    def test_serialization(self):
+        for is_max in [False, True]:
+            for vals in [list(range(_MAX_VAL)), [str(i) for i in range(_MAX_VAL)]]:
+                priorities = [random() * _MAX_PRIORITY for _ in vals]
+                ahpq = ArrayHeapPQ.from_iterable(vals, priorities, is_max)
+                expected = ahpq.sorted_items()
+
+                for copy in [pickle.loads(pickle.dumps(ahpq)),
+                             ArrayHeapPQ.from_bytes(ahpq.to_bytes())]:
+                    self.assertEqual(ahpq._nodes, copy._nodes)
+                    self.assertEqual(ahpq._locations, copy._locations)
+                    self.assertEqual(expected, list(copy.drain()))
+
+        ahpq = ArrayHeapPQ.from_iterable(range(_MAX_VAL), range(_MAX_VAL))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pq.bin')
+            ahpq.save(path)
+            self.assertEqual(19 + 8 * 2 * _MAX_VAL, os.path.getsize(path))
+            copy = ArrayHeapPQ.load(path)
+        self.assertEqual(list(range(_MAX_VAL)), copy.remove_many(_MAX_VAL))
+
+        # A d-ary heap keeps its arity, and is re-heapified if restored
+        # into a binary heap
+        for arity in [8, 300]:
+            dhpq = DaryHeapPQ.from_iterable(range(_MAX_VAL), range(_MAX_VAL), arity=arity)
+            copy = DaryHeapPQ.from_bytes(dhpq.to_bytes())
+            self.assertEqual(arity, copy._arity)
+            self.assertEqual(dhpq._nodes, copy._nodes)
+            copy = ArrayHeapPQ.from_bytes(dhpq.to_bytes())
+            self.assertEqual(list(range(_MAX_VAL)), copy.remove_many(_MAX_VAL))
+
+        with self.assertRaises(ValueError):
+            ArrayHeapPQ.from_bytes(b'not a queue at all, really')
+        # Duplicate, unhashable or unpicklable items, and unknown item
+        # formats, are rejected
+        data = ArrayHeapPQ.from_iterable(['a', 'b'], [1, 2]).to_bytes()
+        for bad in [data.replace(pickle.dumps(['a', 'b']), pickle.dumps(['a', 'a'])),
+                    data.replace(pickle.dumps(['a', 'b']), pickle.dumps([['a'], 'b'])),
+                    data[:19 + 8 * 2] + b'cos\nnothing_here\n.',
+                    data[:19 + 8 * 2] + b'cno_such_module\nname\n.',
+                    data[:10] + b'x' + data[11:]]:
+            with self.assertRaises(ValueError):
+                ArrayHeapPQ.from_bytes(bad)
+        # Truncated data is rejected, wherever it is cut
+        for vals in [list(range(10)), [str(i) for i in range(10)]]:
+            data = ArrayHeapPQ.from_iterable(vals, range(10)).to_bytes()
+            for end in [19 + 8 * 10 + 8 * 5, 19 + 8 * 10 + 3, 19 + 7, len(data) - 1]:
+                with self.assertRaises(ValueError):
+                    ArrayHeapPQ.from_bytes(data[:end])
+
     def test_time(self):
         # Test parameters
         maxOps = 5000
@@ -113,24 +439,22 @@ class TestArrayHeapPQ(unittest.TestCase):
         # Other variables
         header = ' numOps   | add      | contains | size     | getSmall | removeSm | changePr '
         hline = '----------+----------+----------+----------+----------+----------+----------'
-        times = {}
-        times[_Method.GET_SMALLEST] = 0.0
-        times[_Method.REMOVE_SMALLEST] = 0.0
-        times[_Method.CHANGE_PRIORITY] = 0.0
 
         # Do the timing and print as well
-        print('', hline, header, hline, sep='\n')
-        for num_ops in [10 * (2 ** x) for x in range(floor(log2(maxOps // 10)))]:
-            num_ops_str = ''
-            self._time_part1(num_ops, numTrials, times, ArrayHeapPQ)
-            self._time_part2(num_ops, numTrials, times, ArrayHeapPQ)
-            num_ops_str += ' %8d ' % num_ops
-            for m in _Method:
-                num_ops_str += '| %8f ' % times[m]
-            print(num_ops_str)
+        for name, struct in _STRUCTS.items():
+            times = {_Method.GET_SMALLEST: 0.0, _Method.REMOVE_SMALLEST: 0.0, _Method.CHANGE_PRIORITY: 0.0}
+            print('', name, hline, header, hline, sep='\n')
+            for num_ops in [10 * (2 ** x) for x in range(floor(log2(maxOps // 10)))]:
+                num_ops_str = ''
+                self._time_part1(num_ops, numTrials, times, struct)
+                self._time_part2(num_ops, numTrials, times, struct)
+                num_ops_str += ' %8d ' % num_ops
+                for m in _Method:
+                    num_ops_str += '| %8f ' % times[m]
+                print(num_ops_str)
 
     def test_time_ratio(self):
-        """Displays the speedup the efficient solution provides."""
+        """Displays the speedup the efficient solutions provide."""
 
         # Test parameters
         maxOps = 5000
@@ -141,19 +465,66 @@ class TestArrayHeapPQ(unittest.TestCase):
         hline = '----------+----------+----------+----------+----------+----------+----------'
         times_ref = {_Method.GET_SMALLEST: 0.0, _Method.REMOVE_SMALLEST: 0.0, _Method.CHANGE_PRIORITY: 0.0}
         times = {_Method.GET_SMALLEST: 0.0, _Method.REMOVE_SMALLEST: 0.0, _Method.CHANGE_PRIORITY: 0.0}
+        rows = {name: [] for name in _STRUCTS}
 
-        # Do the timing and print as well
-        print('', hline, header, hline, sep='\n')
+        # Do the timing, timing the reference once per number of operations
         for num_ops in [10 * (2 ** x) for x in range(floor(log2(maxOps // 10)))]:
-            num_ops_str = ''
             self._time_part1(num_ops, numTrials, times_ref, ReferencePQ)
             self._time_part2(num_ops, numTrials, times_ref, ReferencePQ)
-            self._time_part1(num_ops, numTrials, times, ArrayHeapPQ)
-            self._time_part2(num_ops, numTrials, times, ArrayHeapPQ)
-            num_ops_str += ' %8d ' % num_ops
-            for m in _Method:
-                num_ops_str += '| %8f ' % (times_ref[m] / times[m])
-            print(num_ops_str)
+            for name, struct in _STRUCTS.items():
+                num_ops_str = ''
+                self._time_part1(num_ops, numTrials, times, struct)
+                self._time_part2(num_ops, numTrials, times, struct)
+                num_ops_str += ' %8d ' % num_ops
+                for m in _Method:
+                    num_ops_str += '| %8f ' % (times_ref[m] / times[m])
+                rows[name].append(num_ops_str)
+
+        # Print the results
+        for name in _STRUCTS:
+            print('', name, hline, header, hline, *rows[name], sep='\n')
+
+    def test_time_heap_size(self):
+        """Displays the time per operation as the heap grows.
+
+        Every item is added, has its priority changed once, and is then
+        removed, so the sifts run over the full height of the heap.
+        """
+
+        # Test parameters
+        maxSize = 100_000
+
+        # Other variables
+        header = ' heapSize | add (us) | rem (us) | chPr (us)'
+        hline = '----------+----------+----------+----------'
+
+        # Do the timing and print as well
+        print('', hline, header, hline, sep='\n')
+        heap_size = 100
+        while heap_size <= maxSize:
+            ahpq = ArrayHeapPQ()
+            priorities = [random() * _MAX_PRIORITY for _ in range(heap_size)]
+            changes = [random() * _MAX_PRIORITY for _ in range(heap_size)]
+
+            startTime = perf_counter()
+            for i in range(heap_size):
+                ahpq.add(i, priorities[i])
+            addTime = perf_counter() - startTime
+
+            startTime = perf_counter()
+            for i in range(heap_size):
+                ahpq.change_priority(i, changes[i])
+            cpTime = perf_counter() - startTime
+
+            startTime = perf_counter()
+            for _ in range(heap_size):
+                ahpq.remove()
+            removeTime = perf_counter() - startTime
+
+            print(' %8d | %8.3f | %8.3f | %8.3f ' % (
+                heap_size, addTime / heap_size * 1e6,
+                removeTime / heap_size * 1e6, cpTime / heap_size * 1e6))
+            heap_size *= 10
 
     # = = = = = = = = = = = = =
     # PRIVATE UTILITY METHODS
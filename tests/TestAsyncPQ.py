@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `AsyncPQ`.
+
+Contains tests of the waiting behaviour of removes and of bounded adds.
+"""
+
+import asyncio
+import unittest
+from random import random
+
+from ssds import AsyncPQ
+
+_NUM_TASKS = 4
+"""int: The number of producer (and of consumer) tasks."""
+
+_NUM_ITEMS = 1000
+"""int: The number of items each producer adds."""
+
+
+class TestAsyncPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        async def run():
+            apq = AsyncPQ(is_max=True)
+            for i in range(6):
+                await apq.add(i, i)
+            apq.change_priority(0, 10)
+            self.assertTrue(apq.discard(5))
+            self.assertFalse(apq.discard(5))
+            self.assertEqual(0, await apq.get())
+            self.assertEqual([0, 4, 3, 2, 1], [await apq.remove() for _ in range(5)])
+            with self.assertRaises(RuntimeError):
+                apq.remove_nowait()
+
+        asyncio.run(run())
+
+    def test_waiting_remove(self):
+        async def run():
+            apq = AsyncPQ()
+            removers = [asyncio.ensure_future(apq.remove()) for _ in range(2)]
+            getter = asyncio.ensure_future(apq.get())
+            await asyncio.sleep(0)
+            self.assertFalse(any(task.done() for task in removers + [getter]))
+
+            await apq.add('b', 2)
+            await apq.add('a', 1)
+            apq.change_priority('b', 0)
+            self.assertEqual({'a', 'b'}, set(await asyncio.gather(*removers)))
+            await apq.add('c', 3)
+            self.assertEqual('c', await asyncio.wait_for(getter, 1))
+
+            # A cancelled waiter does not swallow a wakeup
+            cancelled = asyncio.ensure_future(apq.remove())
+            apq.remove_nowait()
+            waiting = asyncio.ensure_future(apq.remove())
+            await asyncio.sleep(0)
+            await apq.add('d', 4)
+            cancelled.cancel()
+            self.assertEqual('d', await asyncio.wait_for(waiting, 1))
+
+        asyncio.run(run())
+
+    def test_bounded(self):
+        async def run():
+            apq = AsyncPQ(maxsize=2)
+            await apq.add('a', 1)
+            await apq.add('b', 2)
+            self.assertTrue(apq.full())
+            with self.assertRaises(RuntimeError):
+                apq.add_nowait('c', 3)
+
+            adder = asyncio.ensure_future(apq.add('c', 3))
+            await asyncio.sleep(0)
+            self.assertFalse(adder.done())
+            self.assertEqual('a', await apq.remove())
+            await asyncio.wait_for(adder, 1)
+
+            adder = asyncio.ensure_future(apq.add('d', 0))
+            await asyncio.sleep(0)
+            self.assertFalse(adder.done())
+            apq.discard('c')
+            await asyncio.wait_for(adder, 1)
+            self.assertEqual('d', await apq.remove())
+
+        asyncio.run(run())
+
+    def test_tasks(self):
+        async def run():
+            apq = AsyncPQ(maxsize=10)
+            removed = []
+
+            async def produce(start):
+                for item in range(start, start + _NUM_ITEMS):
+                    await apq.add(item, random())
+
+            async def consume():
+                for _ in range(_NUM_ITEMS):
+                    removed.append(await apq.remove())
+
+            await asyncio.gather(*[produce(i * _NUM_ITEMS) for i in range(_NUM_TASKS)],
+                                 *[consume() for _ in range(_NUM_TASKS)])
+            self.assertEqual(list(range(_NUM_TASKS * _NUM_ITEMS)), sorted(removed))
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `benchmarks` package.
+
+Runs every scenario at a small size, and checks the latency histogram
+and the regression check.
+"""
+
+import unittest
+from random import randrange
+
+from benchmarks.implementations import BASELINE, IMPLEMENTATIONS
+from benchmarks.runner import find_regressions, run_case
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.timing import Histogram
+
+_SIZE = 2000
+"""int: The size to run each scenario at."""
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_scenarios(self):
+        for scenario in SCENARIOS:
+            expected = run_case(scenario, BASELINE, _SIZE, 0)
+            self.assertEqual(_SIZE, expected['ops'])
+            for name in IMPLEMENTATIONS:
+                result = run_case(scenario, name, _SIZE, 0)
+                self.assertEqual(expected['checksum'], result['checksum'],
+                                 '%s on %s' % (name, scenario))
+                self.assertGreater(result['ops_per_sec'], 0)
+
+    def test_histogram(self):
+        histogram = Histogram()
+        values = sorted(randrange(1, 10 ** 7) for _ in range(10_000))
+        for value in values:
+            histogram.add(value)
+        for q in [50, 90, 99]:
+            exact = values[int(q / 100 * len(values)) - 1]
+            self.assertAlmostEqual(1, histogram.percentile(q) / exact, delta=0.07)
+        self.assertEqual(0, Histogram().percentile(50))
+
+    def test_regressions(self):
+        baseline = [{'scenario': 'top_k', 'implementation': 'ArrayHeapPQ',
+                     'size': 10, 'ops_per_sec': 100.0}]
+        results = [dict(baseline[0], ops_per_sec=95.0)]
+        self.assertEqual([], find_regressions(results, baseline, 'ops_per_sec', 0.1))
+        results[0]['ops_per_sec'] = 85.0
+        self.assertEqual(1, len(find_regressions(results, baseline, 'ops_per_sec', 0.1)))
+        results[0]['size'] = 20
+        self.assertEqual([], find_regressions(results, baseline, 'ops_per_sec', 0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `BoundedPQ`.
+
+Contains randomized testing against a dictionary of the items kept, and a
+comparison of timings against an `ArrayHeapPQ` trimmed after every add.
+"""
+
+import unittest
+from random import random, randrange
+from time import perf_counter
+
+from ssds import ArrayHeapPQ, BoundedPQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_CAPACITY = 50
+"""int: The capacity of the queues under test."""
+
+
+class TestBoundedPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        bpq = BoundedPQ(3)
+        self.assertEqual([None, None, None], [bpq.offer(i, i) for i in range(3)])
+        self.assertEqual(0, bpq.offer(3, 3))
+        self.assertEqual(-1, bpq.offer(-1, -1))
+        # Ties go to the items already kept
+        self.assertEqual(4, bpq.offer(4, 1))
+        # add follows the PriorityQueue interface
+        self.assertIsNone(bpq.add(5, 0))
+        self.assertFalse(bpq.contains(5))
+        self.assertEqual(1, bpq.get())
+        self.assertEqual([3, 2, 1], bpq.ranked())
+
+        bpq = BoundedPQ(2, keep='min')
+        self.assertEqual(['a', 'd'], bpq.add_many([('a', 3), ('b', 2), ('c', 1), ('d', 4)]))
+        self.assertEqual([('c', 1), ('b', 2)], bpq.ranked(with_priorities=True))
+        bpq.change_priority('c', 5)
+        self.assertEqual('c', bpq.remove())
+        self.assertTrue(bpq.discard('b'))
+        self.assertEqual(0, bpq.size())
+
+        with self.assertRaises(ValueError):
+            BoundedPQ(0)
+        with self.assertRaises(ValueError):
+            BoundedPQ(1, keep='best')
+        with self.assertRaises(RuntimeError):
+            bpq.get()
+        bpq.add('a', 1)
+        with self.assertRaises(ValueError):
+            bpq.add('a', 2)
+
+    def test_random(self):
+        """Checks the queue against a dictionary of the items kept."""
+        for keep in ['max', 'min']:
+            sign = 1 if keep == 'max' else -1
+            bpq = BoundedPQ(_CAPACITY, keep)
+            kept = {}
+
+            for _ in range(50_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random()
+                if j == 0:  # offer
+                    if val in kept:
+                        with self.assertRaises(ValueError):
+                            bpq.offer(val, priority)
+                        continue
+                    evicted = bpq.offer(val, priority)
+                    kept[val] = priority
+                    if len(kept) <= _CAPACITY:
+                        self.assertIsNone(evicted)
+                    else:
+                        worst = min(kept, key=lambda item: sign * kept[item])
+                        self.assertEqual(worst, evicted)
+                        del kept[evicted]
+                elif j == 1:  # remove
+                    if len(kept) == 0:
+                        with self.assertRaises(RuntimeError):
+                            bpq.remove()
+                    else:
+                        worst = min(kept.values(), key=lambda p: sign * p)
+                        self.assertEqual(worst, kept.pop(bpq.remove()))
+                elif j == 2:  # change_priority
+                    if val in kept:
+                        bpq.change_priority(val, priority)
+                        kept[val] = priority
+                    else:
+                        with self.assertRaises(ValueError):
+                            bpq.change_priority(val, priority)
+                else:  # contains and size
+                    self.assertEqual(val in kept, bpq.contains(val))
+                    self.assertEqual(len(kept), bpq.size())
+
+            self.assertEqual(sorted(kept, key=lambda item: -sign * kept[item]),
+                             bpq.ranked())
+
+    def test_from_iterable(self):
+        for keep in ['max', 'min']:
+            priorities = [random() for _ in range(_MAX_VAL)]
+            bpq = BoundedPQ.from_iterable(range(_MAX_VAL), priorities,
+                                          capacity=_CAPACITY, keep=keep)
+            ranked = sorted(range(_MAX_VAL), key=priorities.__getitem__,
+                            reverse=keep == 'max')
+            self.assertEqual(ranked[:_CAPACITY], bpq.ranked())
+
+            bpq = BoundedPQ.from_iterable(range(_MAX_VAL), priorities, keep=keep)
+            self.assertEqual(ranked, bpq.ranked())
+
+        with self.assertRaises(ValueError):
+            BoundedPQ.from_iterable([('a', 1), ('a', 2)], capacity=1)
+        # A positional is_max, as the PriorityQueue interface takes, fails
+        with self.assertRaises(TypeError):
+            BoundedPQ.from_iterable(range(3), range(3), True)
+
+    def test_time(self):
+        """Times keeping the best 100 of a stream of random priorities."""
+        numItems = 500_000
+        capacity = 100
+        priorities = [random() for _ in range(numItems)]
+
+        startTime = perf_counter()
+        bpq = BoundedPQ(capacity)
+        for item, priority in enumerate(priorities):
+            bpq.add(item, priority)
+        boundedTime = perf_counter() - startTime
+
+        startTime = perf_counter()
+        pq = ArrayHeapPQ()
+        for item, priority in enumerate(priorities):
+            pq.add(item, priority)
+            if pq.size() > capacity:
+                pq.remove()
+        heapTime = perf_counter() - startTime
+
+        self.assertEqual(sorted(item for item, _ in pq.drain()), sorted(bpq.ranked()))
+        print()
+        print('BoundedPQ:   %.3f s for %d items' % (boundedTime, numItems))
+        print('ArrayHeapPQ: %.3f s for %d items' % (heapTime, numItems))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `BucketPQ`.
+
+Contains randomized testing against a dictionary of priorities.
+"""
+
+import unittest
+from random import randrange
+
+from ssds import BucketPQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MIN_PRIORITY = -50
+"""int: The minimum priority that can be assigned."""
+
+_MAX_PRIORITY = 200
+"""int: The maximum priority that can be assigned."""
+
+
+class TestBucketPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        bpq = BucketPQ(0, 10)
+
+        for i in range(6):
+            bpq.add(i, 6 - i)
+        for i in range(6):
+            self.assertEqual(5 - i, bpq.remove())
+
+        with self.assertRaises(ValueError):
+            bpq.add('a', 11)
+        with self.assertRaises(ValueError):
+            bpq.add('a', -1)
+        with self.assertRaises(ValueError):
+            bpq.add('a', 0.5)
+        with self.assertRaises(RuntimeError):
+            bpq.get()
+        with self.assertRaises(ValueError):
+            BucketPQ(1, 0)
+
+    def test_random(self):
+        """Checks the queue against a dictionary of priorities.
+
+        Integer priorities tie often, so the removed priorities are compared
+        rather than the removed items.
+        """
+        for is_max in [False, True]:
+            best = max if is_max else min
+            bpq = BucketPQ(_MIN_PRIORITY, _MAX_PRIORITY, is_max)
+            priorities = {}
+
+            for _ in range(50_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = randrange(_MIN_PRIORITY, _MAX_PRIORITY + 1)
+                if j == 0:  # add
+                    if val in priorities:
+                        with self.assertRaises(ValueError):
+                            bpq.add(val, priority)
+                    else:
+                        bpq.add(val, priority)
+                        priorities[val] = priority
+                elif j == 1:  # remove
+                    if len(priorities) == 0:
+                        with self.assertRaises(RuntimeError):
+                            bpq.remove()
+                    else:
+                        front = best(priorities.values())
+                        self.assertEqual(front, priorities.pop(bpq.remove()))
+                elif j == 2:  # change_priority
+                    if val in priorities:
+                        bpq.change_priority(val, priority)
+                        priorities[val] = priority
+                    else:
+                        with self.assertRaises(ValueError):
+                            bpq.change_priority(val, priority)
+                else:  # contains and size
+                    self.assertEqual(val in priorities, bpq.contains(val))
+                    self.assertEqual(len(priorities), bpq.size())
+
+            while len(priorities) > 0:
+                front = best(priorities.values())
+                self.assertEqual(front, priorities[bpq.get()])
+                self.assertEqual(front, priorities.pop(bpq.remove()))
+
+
+if __name__ == '__main__':
+    unittest.main()
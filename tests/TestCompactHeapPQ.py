@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `CompactHeapPQ`.
+
+Contains randomized testing against the reference priority queue, and a
+test that reports the memory used per item next to `ArrayHeapPQ`.
+"""
+
+import pickle
+import tracemalloc
+import unittest
+from random import random, randrange
+
+from ssds import ArrayHeapPQ, CompactHeapPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestCompactHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        chpq = CompactHeapPQ()
+        for i in range(20):
+            chpq.add(i, 20 - i)
+        for i in range(20):
+            self.assertEqual(19 - i, chpq.remove())
+        with self.assertRaises(RuntimeError):
+            chpq.get()
+        self.assertFalse(hasattr(chpq, '__dict__'))
+
+    def test_random(self):
+        for is_max in [False, True]:
+            chpq = CompactHeapPQ(is_max)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(20_000):
+                j = randrange(0, 5)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            chpq.add(val, priority)
+                    else:
+                        chpq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            chpq.remove()
+                    else:
+                        self.assertEqual(npq.get(), chpq.get())
+                        self.assertEqual(npq.remove(), chpq.remove())
+                elif j == 2:  # change_priority
+                    if npq.contains(val):
+                        npq.change_priority(val, priority)
+                        chpq.change_priority(val, priority)
+                    else:
+                        with self.assertRaises(ValueError):
+                            chpq.change_priority(val, priority)
+                elif j == 3:  # discard
+                    present = npq.contains(val)
+                    if present:
+                        npq.change_priority(val, -1 if not is_max else _MAX_PRIORITY + 1)
+                        npq.remove()
+                    self.assertEqual(present, chpq.discard(val))
+                else:  # contains
+                    self.assertEqual(npq.contains(val), chpq.contains(val))
+                self.assertEqual(npq.size(), chpq.size())
+
+    def test_from_iterable(self):
+        for is_max in [False, True]:
+            priorities = [random() * _MAX_PRIORITY for _ in range(_MAX_VAL)]
+            chpq = CompactHeapPQ.from_iterable(range(_MAX_VAL), priorities, is_max)
+            expected = sorted(range(_MAX_VAL), key=priorities.__getitem__, reverse=is_max)
+            self.assertEqual(expected, [chpq.remove() for _ in range(_MAX_VAL)])
+
+        with self.assertRaises(ValueError):
+            CompactHeapPQ.from_iterable([('a', 1), ('a', 2)])
+
+    def test_pickle(self):
+        chpq = CompactHeapPQ.from_iterable(range(_MAX_VAL), range(_MAX_VAL), True)
+        copy = pickle.loads(pickle.dumps(chpq))
+        self.assertEqual(list(reversed(range(_MAX_VAL))),
+                         [copy.remove() for _ in range(_MAX_VAL)])
+
+    def test_memory(self):
+        size = 100_000
+        priorities = [random() for _ in range(size)]
+        usage = {}
+        for struct in [ArrayHeapPQ, CompactHeapPQ]:
+            tracemalloc.start()
+            pq = struct()
+            for i in range(size):
+                pq.add(i, priorities[i])
+            usage[struct.__name__] = tracemalloc.get_traced_memory()[0] / size
+            tracemalloc.stop()
+            del pq
+
+        print()
+        for name, perItem in usage.items():
+            print('%-14s %6.1f bytes per item' % (name, perItem))
+        self.assertLess(usage['CompactHeapPQ'], usage['ArrayHeapPQ'])
+
+
+if __name__ == '__main__':
+    unittest.main()
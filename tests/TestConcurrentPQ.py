@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `ConcurrentPQ`.
+
+Contains tests of the blocking behaviour, and a test that shares the
+queue between several producer and consumer threads.
+"""
+
+import unittest
+from random import random
+from threading import Thread
+from time import perf_counter, sleep
+
+from ssds import ConcurrentPQ, PairingHeapPQ
+
+_NUM_THREADS = 4
+"""int: The number of producer (and of consumer) threads."""
+
+_NUM_ITEMS = 5000
+"""int: The number of items each producer adds."""
+
+
+class TestConcurrentPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        cpq = ConcurrentPQ(is_max=True, backend=PairingHeapPQ)
+
+        cpq.add_many(range(6), range(6))
+        self.assertTrue(cpq.contains(5))
+        cpq.change_priority(0, 10)
+        self.assertEqual(0, cpq.get())
+        self.assertEqual([0, 5, 4], cpq.remove_many(3))
+        self.assertEqual(3, cpq.size())
+        self.assertEqual([3, 2, 1], cpq.remove_many(10))
+
+    def test_timeout(self):
+        cpq = ConcurrentPQ()
+
+        with self.assertRaises(RuntimeError):
+            cpq.remove(block=False)
+        with self.assertRaises(RuntimeError):
+            cpq.get()
+        startTime = perf_counter()
+        with self.assertRaises(RuntimeError):
+            cpq.remove(timeout=0.05)
+        self.assertGreaterEqual(perf_counter() - startTime, 0.05)
+
+    def test_blocking(self):
+        cpq = ConcurrentPQ()
+        results = []
+        consumer = Thread(target=lambda: results.append(cpq.remove(timeout=5)))
+        consumer.start()
+        sleep(0.05)
+        self.assertTrue(consumer.is_alive())
+
+        cpq.add('a', 1)
+        consumer.join()
+        self.assertEqual(['a'], results)
+
+    def test_threads(self):
+        cpq = ConcurrentPQ()
+        removed = [[] for _ in range(_NUM_THREADS)]
+
+        def produce(start):
+            for item in range(start, start + _NUM_ITEMS, 2):
+                cpq.add(item, random())
+                cpq.add_many([(item + 1, random())])
+
+        def consume(out):
+            while True:
+                try:
+                    out.extend(cpq.remove_many(10, timeout=0.5))
+                except RuntimeError:
+                    return
+
+        threads = [Thread(target=produce, args=(i * _NUM_ITEMS,))
+                   for i in range(_NUM_THREADS)]
+        threads += [Thread(target=consume, args=(out,)) for out in removed]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        items = sorted(item for out in removed for item in out)
+        self.assertEqual(list(range(_NUM_THREADS * _NUM_ITEMS)), items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `DaryHeapPQ`.
+
+Contains randomized testing against the reference priority queue for
+several arities. The timing of the data structure is reported alongside
+`ArrayHeapPQ` in `TestArrayHeapPQ`.
+"""
+
+import unittest
+from random import random, randrange
+
+from ssds import DaryHeapPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+_ARITIES = [2, 3, 4, 8]
+"""list: The arities to test the heap with."""
+
+
+class TestDaryHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        for arity in _ARITIES:
+            dhpq = DaryHeapPQ(arity=arity)
+
+            for i in range(20):
+                dhpq.add(i, 20 - i)
+            for i in range(20):
+                self.assertEqual(19 - i, dhpq.remove())
+
+        with self.assertRaises(ValueError):
+            DaryHeapPQ(arity=1)
+
+    def test_random(self):
+        for arity in _ARITIES:
+            for is_max in [False, True]:
+                dhpq = DaryHeapPQ(is_max, arity)
+                npq = ReferencePQ(is_max)
+
+                for _ in range(20_000):
+                    j = randrange(0, 4)
+                    val = randrange(_MAX_VAL)
+                    priority = random() * _MAX_PRIORITY
+                    if j == 0:  # add
+                        if npq.contains(val):
+                            with self.assertRaises(ValueError):
+                                dhpq.add(val, priority)
+                        else:
+                            dhpq.add(val, priority)
+                            npq.add(val, priority)
+                    elif j == 1:  # remove
+                        if npq.size() == 0:
+                            with self.assertRaises(RuntimeError):
+                                dhpq.remove()
+                        else:
+                            self.assertEqual(npq.remove(), dhpq.remove())
+                    elif j == 2:  # change_priority
+                        if npq.contains(val):
+                            npq.change_priority(val, priority)
+                            dhpq.change_priority(val, priority)
+                        else:
+                            with self.assertRaises(ValueError):
+                                dhpq.change_priority(val, priority)
+                    else:  # contains and size
+                        self.assertEqual(npq.contains(val), dhpq.contains(val))
+                        self.assertEqual(npq.size(), dhpq.size())
+
+                while npq.size() > 0:
+                    self.assertEqual(npq.remove(), dhpq.remove())
+
+    def test_from_iterable(self):
+        for arity in _ARITIES:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            dhpq = DaryHeapPQ.from_iterable(vals, priorities, arity=arity)
+            npq = ReferencePQ.from_iterable(vals, priorities)
+
+            for val in vals:
+                self.assertEqual(val, dhpq._nodes[dhpq._locations[val]][0])
+            while npq.size() > 0:
+                self.assertEqual(npq.remove(), dhpq.remove())
+
+    def test_batch(self):
+        for arity in _ARITIES:
+            dhpq = DaryHeapPQ(arity=arity)
+            npq = ReferencePQ()
+
+            for size in [10, 500]:
+                vals = [npq.size() + i for i in range(size)]
+                priorities = [random() * _MAX_PRIORITY for _ in vals]
+                dhpq.add_many(vals, priorities)
+                npq.add_many(vals, priorities)
+
+                changes = [(randrange(npq.size()), random() * _MAX_PRIORITY)
+                           for _ in range(size)]
+                dhpq.change_priority_many(changes)
+                npq.change_priority_many(changes)
+
+            self.assertEqual(npq.remove_many(100), dhpq.remove_many(100))
+            self.assertEqual(npq.remove_many(1000), dhpq.remove_many(1000))
+
+    def test_peek_k(self):
+        for arity in _ARITIES:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            dhpq = DaryHeapPQ.from_iterable(vals, priorities, arity=arity)
+            expected = sorted(vals, key=lambda val: priorities[val])
+            self.assertEqual(expected[:100], dhpq.peek_k(100))
+
+    def test_discard(self):
+        for arity in _ARITIES:
+            vals = list(range(_MAX_VAL))
+            priorities = [random() * _MAX_PRIORITY for _ in vals]
+            dhpq = DaryHeapPQ.from_iterable(vals, priorities, arity=arity)
+            remaining = dict(zip(vals, priorities))
+
+            for _ in range(_MAX_VAL // 2):
+                val = randrange(_MAX_VAL)
+                self.assertEqual(val in remaining, dhpq.discard(val))
+                remaining.pop(val, None)
+            dhpq.discard_many(range(0, _MAX_VAL, 2))
+            for val in range(0, _MAX_VAL, 2):
+                remaining.pop(val, None)
+
+            npq = ReferencePQ.from_iterable(remaining.items())
+            self.assertEqual(npq.remove_many(_MAX_VAL), dhpq.remove_many(_MAX_VAL))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `ExternalPQ`.
+
+Contains randomized testing against the reference priority queue, and a
+test that checks that memory use does not grow with the number of items.
+"""
+
+import tracemalloc
+import unittest
+from random import random, randrange
+
+from ssds import ExternalPQ
+from ssds.ExternalPQ import _MAX_RUNS
+from ssds.reference import ReferencePQ
+
+_BUFFER_SIZE = 50
+"""int: The buffer size of the queues under test."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestExternalPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_random(self):
+        for is_max in [False, True]:
+            for make_item in [int, str]:
+                epq = ExternalPQ(is_max, buffer_size=_BUFFER_SIZE)
+                npq = ReferencePQ(is_max)
+
+                for i in range(5000):
+                    if randrange(3) > 0:  # add
+                        item = make_item(i)
+                        priority = random() * _MAX_PRIORITY
+                        epq.add(item, priority)
+                        npq.add(item, priority)
+                    elif npq.size() == 0:  # remove
+                        with self.assertRaises(RuntimeError):
+                            epq.remove()
+                    else:
+                        self.assertEqual(npq.get(), epq.get())
+                        self.assertEqual(npq.remove(), epq.remove())
+                    self.assertEqual(npq.size(), epq.size())
+
+                item = make_item(randrange(5000))
+                self.assertEqual(npq.contains(item), epq.contains(item))
+                while npq.size() > 0:
+                    self.assertEqual(npq.remove(), epq.remove())
+                epq.close()
+
+    def test_compaction(self):
+        epq = ExternalPQ(buffer_size=10)
+        priorities = [random() for _ in range(10 * 3 * _MAX_RUNS)]
+        for item, priority in enumerate(priorities):
+            epq.add(item, priority)
+        self.assertLess(len(epq._fronts), _MAX_RUNS)
+
+        expected = sorted(range(len(priorities)), key=priorities.__getitem__)
+        self.assertEqual(expected, [epq.remove() for _ in range(epq.size())])
+        self.assertEqual([], epq._fronts)
+
+        # Only the smallest runs are merged, so each item is rewritten a
+        # logarithmic number of times rather than once per compaction
+        epq = _CountingPQ(buffer_size=10)
+        numItems = 10 * 20 * _MAX_RUNS
+        for item in range(numItems):
+            epq.add(item, random())
+        self.assertLess(epq.written, 5 * numItems)
+        self.assertEqual(numItems, len([epq.remove() for _ in range(numItems)]))
+        epq.close()
+
+    def test_unsupported(self):
+        epq = ExternalPQ()
+        epq.add('a', 1)
+        with self.assertRaises(NotImplementedError):
+            epq.change_priority('a', 0)
+        with self.assertRaises(ValueError):
+            ExternalPQ(buffer_size=0)
+
+    def test_memory(self):
+        peaks = []
+        # Both sizes spill enough runs to reach a compaction
+        for n in [10_000, 50_000]:
+            tracemalloc.start()
+            epq = ExternalPQ(buffer_size=100)
+            for item in range(n):
+                epq.add(item, random())
+            for _ in range(n):
+                epq.remove()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            epq.close()
+
+        print()
+        print('Peak memory for 10000 items: %d bytes' % peaks[0])
+        print('Peak memory for 50000 items: %d bytes' % peaks[1])
+        self.assertLess(peaks[1], 1.5 * peaks[0])
+
+
+class _CountingPQ(ExternalPQ):
+    """An `ExternalPQ` that counts the records it writes to disk."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.written = 0
+
+    def _add_run(self, records, pickled: bool) -> None:
+        super()._add_run(self._count(records), pickled)
+
+    def _count(self, records):
+        for record in records:
+            self.written += 1
+            yield record
+
+
+if __name__ == '__main__':
+    unittest.main()
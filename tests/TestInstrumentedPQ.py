@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `InstrumentedPQ`.
+
+Contains randomized testing against the reference priority queue, and
+tests of the recorded counts and timings.
+"""
+
+import pickle
+import unittest
+from random import random, randrange
+
+from ssds import InstrumentedPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestInstrumentedPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_random(self):
+        for is_max in [False, True]:
+            ipq = InstrumentedPQ(is_max)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(10_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            ipq.add(val, priority)
+                    else:
+                        ipq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            ipq.remove()
+                    else:
+                        self.assertEqual(npq.remove(), ipq.remove())
+                elif j == 2:  # change_priority
+                    if npq.contains(val):
+                        npq.change_priority(val, priority)
+                        ipq.change_priority(val, priority)
+                    else:
+                        with self.assertRaises(ValueError):
+                            ipq.change_priority(val, priority)
+                else:  # contains
+                    self.assertEqual(npq.contains(val), ipq.contains(val))
+                self.assertEqual(npq.size(), ipq.size())
+
+            stats = ipq.stats()
+            self.assertEqual(stats['moves'],
+                             sum(levels * count for levels, count in stats['sift_levels'].items()))
+            for name in ['add', 'remove', 'change_priority', 'contains']:
+                operation = stats['operations'][name]
+                self.assertEqual(operation['count'], sum(operation['histogram'].values()))
+
+    def test_counts(self):
+        ipq = InstrumentedPQ()
+        for i in range(100):
+            ipq.add(i, i)
+        stats = ipq.stats()
+        # Every add after the first compares with its parent and stays put
+        self.assertEqual(99, stats['comparisons'])
+        self.assertEqual(0, stats['moves'])
+        self.assertEqual({0: 100}, stats['sift_levels'])
+        self.assertEqual(100, stats['lookups'])
+        self.assertEqual(100, stats['location_writes'])
+
+        ipq.reset_stats()
+        ipq.change_priority(99, -1)
+        stats = ipq.stats()
+        # Item 99 sits at index 100, six levels below the root
+        self.assertEqual(6, stats['moves'])
+        self.assertEqual(1, stats['lookups'])
+        self.assertEqual(['change_priority'], list(stats['operations']))
+
+    def test_nested_calls(self):
+        ipq = InstrumentedPQ()
+        ipq.add_many(range(10), range(10))
+        ipq.discard_many([1])
+        operations = ipq.stats()['operations']
+        self.assertEqual({'add_many', 'discard_many'}, set(operations))
+        self.assertEqual(1, operations['discard_many']['count'])
+
+    def test_callback(self):
+        calls = []
+        ipq = InstrumentedPQ(callback=lambda name, elapsed: calls.append((name, elapsed)))
+        ipq.add('a', 1)
+        ipq.get()
+        ipq.remove()
+        with self.assertRaises(RuntimeError):
+            ipq.remove()
+        self.assertEqual(['add', 'get', 'remove', 'remove'], [name for name, _ in calls])
+        self.assertTrue(all(elapsed >= 0 for _, elapsed in calls))
+
+    def test_pickle(self):
+        ipq = InstrumentedPQ.from_iterable(range(100), range(100))
+        copy = pickle.loads(pickle.dumps(ipq))
+        copy.reset_stats()
+        self.assertEqual(list(range(100)), [copy.remove() for _ in range(100)])
+        self.assertGreater(copy.stats()['location_writes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
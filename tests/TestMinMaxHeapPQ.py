@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `MinMaxHeapPQ`.
+
+Contains randomized testing against a dictionary of priorities, checking
+both ends of the queue after every operation.
+"""
+
+import unittest
+from random import random, randrange
+
+from ssds import MinMaxHeapPQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestMinMaxHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        mmpq = MinMaxHeapPQ()
+        for i in range(20):
+            mmpq.add(i, i)
+        for i in range(10):
+            self.assertEqual(i, mmpq.remove_min())
+            self.assertEqual(19 - i, mmpq.remove_max())
+        with self.assertRaises(RuntimeError):
+            mmpq.get_max()
+        with self.assertRaises(RuntimeError):
+            mmpq.remove_min()
+
+        mmpq = MinMaxHeapPQ(is_max=True)
+        mmpq.add('a', 1)
+        mmpq.add('b', 2)
+        self.assertEqual('b', mmpq.get())
+        self.assertEqual('b', mmpq.remove())
+        self.assertEqual('a', mmpq.get_max())
+
+    def test_random(self):
+        for is_max in [False, True]:
+            mmpq = MinMaxHeapPQ(is_max)
+            expected = {}
+
+            for _ in range(20_000):
+                j = randrange(0, 6)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if val in expected:
+                        with self.assertRaises(ValueError):
+                            mmpq.add(val, priority)
+                    else:
+                        mmpq.add(val, priority)
+                        expected[val] = priority
+                elif j == 1:  # remove_min
+                    if not expected:
+                        with self.assertRaises(RuntimeError):
+                            mmpq.remove_min()
+                    else:
+                        item = min(expected, key=expected.get)
+                        self.assertEqual(item, mmpq.remove_min())
+                        del expected[item]
+                elif j == 2:  # remove_max
+                    if not expected:
+                        with self.assertRaises(RuntimeError):
+                            mmpq.remove_max()
+                    else:
+                        item = max(expected, key=expected.get)
+                        self.assertEqual(item, mmpq.remove_max())
+                        del expected[item]
+                elif j == 3:  # change_priority
+                    if val in expected:
+                        mmpq.change_priority(val, priority)
+                        expected[val] = priority
+                    else:
+                        with self.assertRaises(ValueError):
+                            mmpq.change_priority(val, priority)
+                elif j == 4:  # discard
+                    self.assertEqual(val in expected, mmpq.discard(val))
+                    expected.pop(val, None)
+                else:  # contains
+                    self.assertEqual(val in expected, mmpq.contains(val))
+
+                self.assertEqual(len(expected), mmpq.size())
+                if expected:
+                    self.assertEqual(min(expected, key=expected.get), mmpq.get_min())
+                    self.assertEqual(max(expected, key=expected.get), mmpq.get_max())
+                    front = (max if is_max else min)(expected, key=expected.get)
+                    self.assertEqual(front, mmpq.get())
+            self._check_heap(mmpq)
+
+    def test_from_iterable(self):
+        for size in [0, 1, 2, 3, 10, 100, 1000]:
+            priorities = [random() * _MAX_PRIORITY for _ in range(size)]
+            mmpq = MinMaxHeapPQ.from_iterable(range(size), priorities)
+            self._check_heap(mmpq)
+            order = sorted(range(size), key=priorities.__getitem__)
+            for i in range(size // 2):
+                self.assertEqual(order[i], mmpq.remove_min())
+                self.assertEqual(order[-1 - i], mmpq.remove_max())
+
+        with self.assertRaises(ValueError):
+            MinMaxHeapPQ.from_iterable([('a', 1), ('a', 2)])
+
+    # = = = = = = = = = = = = =
+    # PRIVATE UTILITY METHODS
+    # = = = = = = = = = = = = =
+
+    def _check_heap(self, mmpq):
+        """Checks the min-max property and the locations of every node."""
+        nodes = mmpq._nodes
+        for index in range(2, len(nodes)):
+            self.assertEqual(index, mmpq._locations[nodes[index][0]])
+            ancestor = index >> 1
+            while ancestor >= 1:
+                if ancestor.bit_length() & 1:
+                    self.assertLessEqual(nodes[ancestor][1], nodes[index][1])
+                else:
+                    self.assertGreaterEqual(nodes[ancestor][1], nodes[index][1])
+                ancestor >>= 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `NumericHeapPQ`.
+
+Contains randomized testing against the reference priority queue. The
+timing of the data structure is reported alongside `ArrayHeapPQ` in
+`TestArrayHeapPQ`.
+"""
+
+import unittest
+from random import random, randrange, shuffle
+
+from ssds import NumericHeapPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestNumericHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        nhpq = NumericHeapPQ(6)
+
+        for i in range(6):
+            nhpq.add(i, float(6 - i))
+        for i in range(6):
+            self.assertEqual(5 - i, nhpq.remove())
+
+        with self.assertRaises(ValueError):
+            nhpq.add(6, 0.0)
+        with self.assertRaises(ValueError):
+            nhpq.add(-1, 0.0)
+        with self.assertRaises(ValueError):
+            nhpq.add('a', 0.0)
+        with self.assertRaises(RuntimeError):
+            nhpq.get()
+        self.assertFalse(nhpq.contains(6))
+        self.assertFalse(nhpq.contains('a'))
+
+    def test_random(self):
+        for is_max in [False, True]:
+            nhpq = NumericHeapPQ(_MAX_VAL, is_max)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(50_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            nhpq.add(val, priority)
+                    else:
+                        nhpq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            nhpq.remove()
+                    else:
+                        self.assertEqual(npq.remove(), nhpq.remove())
+                elif j == 2:  # change_priority
+                    if npq.contains(val):
+                        npq.change_priority(val, priority)
+                        nhpq.change_priority(val, priority)
+                    else:
+                        with self.assertRaises(ValueError):
+                            nhpq.change_priority(val, priority)
+                else:  # contains and size
+                    self.assertEqual(npq.contains(val), nhpq.contains(val))
+                    self.assertEqual(npq.size(), nhpq.size())
+
+            while npq.size() > 0:
+                self.assertEqual(npq.get(), nhpq.get())
+                self.assertEqual(npq.remove(), nhpq.remove())
+
+    def test_from_iterable(self):
+        vals = list(range(_MAX_VAL))
+        shuffle(vals)
+        priorities = [random() * _MAX_PRIORITY for _ in vals]
+        nhpq = NumericHeapPQ.from_iterable(vals, priorities, is_max=True)
+        npq = ReferencePQ.from_iterable(vals, priorities, is_max=True)
+
+        self.assertEqual(_MAX_VAL, nhpq._capacity)
+        while npq.size() > 0:
+            self.assertEqual(npq.remove(), nhpq.remove())
+
+        with self.assertRaises(ValueError):
+            NumericHeapPQ.from_iterable([(0, 1.0), (1, 2.0), (0, 3.0)])
+        with self.assertRaises(ValueError):
+            NumericHeapPQ.from_iterable([(5, 1.0)], capacity=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `PairingHeapPQ`.
+
+Contains randomized testing against the reference priority queue. The
+timing of the data structure is reported alongside `ArrayHeapPQ` in
+`TestArrayHeapPQ`.
+"""
+
+import unittest
+from random import random, randrange
+
+from ssds import PairingHeapPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestPairingHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        phpq = PairingHeapPQ()
+
+        for i in range(6):
+            phpq.add(i, 6 - i)
+        for i in range(6):
+            self.assertEqual(5 - i, phpq.remove())
+        with self.assertRaises(RuntimeError):
+            phpq.remove()
+
+    def test_random(self):
+        for is_max in [False, True]:
+            phpq = PairingHeapPQ(is_max)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(50_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            phpq.add(val, priority)
+                    else:
+                        phpq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            phpq.remove()
+                    else:
+                        self.assertEqual(npq.remove(), phpq.remove())
+                elif j == 2:  # change_priority
+                    if npq.contains(val):
+                        npq.change_priority(val, priority)
+                        phpq.change_priority(val, priority)
+                    else:
+                        with self.assertRaises(ValueError):
+                            phpq.change_priority(val, priority)
+                else:  # contains and size
+                    self.assertEqual(npq.contains(val), phpq.contains(val))
+                    self.assertEqual(npq.size(), phpq.size())
+
+            while npq.size() > 0:
+                self.assertEqual(npq.get(), phpq.get())
+                self.assertEqual(npq.remove(), phpq.remove())
+
+    def test_meld(self):
+        phpq = PairingHeapPQ()
+        other = PairingHeapPQ()
+        npq = ReferencePQ()
+        for val in range(200):
+            priority = random() * _MAX_PRIORITY
+            (phpq if val % 3 else other).add(val, priority)
+            npq.add(val, priority)
+
+        phpq.meld(other)
+        self.assertEqual(0, other.size())
+        self.assertEqual(200, phpq.size())
+        for val in range(0, 200, 7):
+            priority = random() * _MAX_PRIORITY
+            phpq.change_priority(val, priority)
+            npq.change_priority(val, priority)
+        while npq.size() > 0:
+            self.assertEqual(npq.remove(), phpq.remove())
+
+        phpq.meld(PairingHeapPQ())
+        self.assertEqual(0, phpq.size())
+        other.add('a', 1)
+        phpq.meld(other)
+        self.assertEqual('a', phpq.get())
+
+        other.add('a', 2)
+        with self.assertRaises(ValueError):
+            phpq.meld(other)
+        with self.assertRaises(ValueError):
+            phpq.meld(PairingHeapPQ(is_max=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
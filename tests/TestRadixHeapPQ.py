@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `RadixHeapPQ`.
+
+Contains randomized testing on monotone workloads, and a test that times the data structure against
+`ArrayHeapPQ` on such a workload.
+"""
+
+import unittest
+from random import random, randrange
+from time import perf_counter
+
+from ssds import ArrayHeapPQ, RadixHeapPQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_STEP = 100
+"""int: The maximum distance of a priority from the front of the queue."""
+
+
+class TestRadixHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        rhpq = RadixHeapPQ()
+
+        for i in range(6):
+            rhpq.add(i, 6 - i)
+        for i in range(6):
+            self.assertEqual(5 - i, rhpq.remove())
+
+        rhpq.add('a', 10)
+        rhpq.add('b', 20)
+        self.assertEqual('a', rhpq.get())
+        with self.assertRaises(ValueError):
+            rhpq.add('c', 9)
+        with self.assertRaises(ValueError):
+            rhpq.change_priority('b', 9)
+        with self.assertRaises(ValueError):
+            rhpq.change_priority('b', 21)
+        with self.assertRaises(ValueError):
+            rhpq.add('c', 1.5)
+        with self.assertRaises(ValueError):
+            rhpq.add('c', -1)
+        rhpq.change_priority('b', 10)
+        self.assertEqual(2, rhpq.size())
+
+    def test_random(self):
+        """Checks the queue against a dictionary of priorities.
+
+        Integer priorities tie often, so the removed priorities are compared
+        rather than the removed items.
+        """
+        for is_max in [False, True]:
+            sign = -1 if is_max else 1
+            best = max if is_max else min
+            rhpq = RadixHeapPQ(is_max)
+            priorities = {}
+            front = 1_000_000 if is_max else 0
+
+            for _ in range(50_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = front + sign * randrange(_MAX_STEP)
+                if j == 0:  # add
+                    if val in priorities:
+                        with self.assertRaises(ValueError):
+                            rhpq.add(val, priority)
+                    else:
+                        rhpq.add(val, priority)
+                        priorities[val] = priority
+                elif j == 1:  # remove
+                    if len(priorities) == 0:
+                        with self.assertRaises(RuntimeError):
+                            rhpq.remove()
+                    else:
+                        front = best(priorities.values())
+                        self.assertEqual(front, priorities.pop(rhpq.remove()))
+                elif j == 2:  # change_priority
+                    if val not in priorities:
+                        with self.assertRaises(ValueError):
+                            rhpq.change_priority(val, priority)
+                    else:
+                        priority = priorities[val] - sign * randrange(_MAX_STEP)
+                        if (priority - front) * sign < 0:
+                            priority = front
+                        rhpq.change_priority(val, priority)
+                        priorities[val] = priority
+                else:  # contains and size
+                    self.assertEqual(val in priorities, rhpq.contains(val))
+                    self.assertEqual(len(priorities), rhpq.size())
+
+            while len(priorities) > 0:
+                front = best(priorities.values())
+                self.assertEqual(front, priorities[rhpq.get()])
+                self.assertEqual(front, priorities.pop(rhpq.remove()))
+
+    def test_time_monotone(self):
+        """Displays the speedup over `ArrayHeapPQ` on a monotone workload.
+
+        Every removed item is followed by two adds and two priority
+        decreases just behind the front of the queue, as in Dijkstra's
+        algorithm.
+        """
+
+        # Test parameters
+        maxSize = 100_000
+
+        # Other variables
+        header = ' numOps   | ArrayHeap | RadixHeap | ratio    '
+        hline = '----------+-----------+-----------+----------'
+
+        # Do the timing and print as well
+        print('', hline, header, hline, sep='\n')
+        num_ops = 1000
+        while num_ops <= maxSize:
+            times = [self._time_monotone(struct, num_ops)
+                     for struct in [ArrayHeapPQ, RadixHeapPQ]]
+            print(' %8d | %9.4f | %9.4f | %8.3f ' % (
+                num_ops, times[0], times[1], times[0] / times[1]))
+            num_ops *= 10
+
+    # = = = = = = = = = = = = =
+    # PRIVATE UTILITY METHODS
+    # = = = = = = = = = = = = =
+
+    @staticmethod
+    def _time_monotone(struct, numOps: int) -> float:
+        """Times a monotone workload on the given priority queue class.
+
+        Args:
+            struct: The class of data structure to be used.
+            numOps (:obj:`int`): The number of items to remove.
+
+        Returns:
+            float: The time taken, in seconds.
+        """
+        pq = struct()
+        priorities = {0: 0}
+        pq.add(0, 0)
+        next_item = 1
+        steps = [randrange(_MAX_STEP) for _ in range(4 * numOps)]
+        picks = [random() for _ in range(2 * numOps)]
+
+        startTime = perf_counter()
+        for i in range(numOps):
+            front = priorities.pop(pq.remove())
+            for j in range(2):
+                priority = front + steps[4 * i + j]
+                pq.add(next_item, priority)
+                priorities[next_item] = priority
+                next_item += 1
+            for j in range(2):
+                item = next_item - 1 - int(picks[2 * i + j] * len(priorities))
+                if item in priorities:
+                    priority = max(front, priorities[item] - steps[4 * i + 2 + j])
+                    pq.change_priority(item, priority)
+                    priorities[item] = priority
+        return perf_counter() - startTime
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `ShardedPQ`.
+
+Contains randomized testing against the reference priority queue, and
+tests that measure the throughput with several threads and the rank
+error of relaxed removes.
+"""
+
+import unittest
+from bisect import bisect_left
+from random import random, randrange
+from threading import Thread
+from time import perf_counter
+
+from ssds import ConcurrentPQ, ShardedPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+
+class TestShardedPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_strict(self):
+        for is_max in [False, True]:
+            spq = ShardedPQ(is_max, shards=5, strict=True)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(20_000):
+                j = randrange(0, 4)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            spq.add(val, priority)
+                    else:
+                        spq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            spq.remove()
+                    else:
+                        self.assertEqual(npq.get(), spq.get())
+                        self.assertEqual(npq.remove(), spq.remove())
+                elif j == 2:  # change_priority
+                    if npq.contains(val):
+                        npq.change_priority(val, priority)
+                        spq.change_priority(val, priority)
+                    else:
+                        with self.assertRaises(ValueError):
+                            spq.change_priority(val, priority)
+                else:  # contains and size
+                    self.assertEqual(npq.contains(val), spq.contains(val))
+                    self.assertEqual(npq.size(), spq.size())
+
+    def test_relaxed(self):
+        spq = ShardedPQ(shards=8)
+        for val in range(_MAX_VAL):
+            spq.add(val, random())
+        removed = [spq.remove() for _ in range(_MAX_VAL)]
+        self.assertEqual(list(range(_MAX_VAL)), sorted(removed))
+        with self.assertRaises(RuntimeError):
+            spq.remove()
+
+    def test_threads(self):
+        spq = ShardedPQ(shards=8)
+        numThreads = 4
+        removed = [[] for _ in range(numThreads)]
+
+        def work(start, out):
+            for item in range(start, start + _MAX_VAL):
+                spq.add(item, random())
+                if item % 2:
+                    try:
+                        spq.change_priority(item, random())
+                    except ValueError:
+                        # Another thread has already removed the item
+                        pass
+                    out.append(spq.remove())
+
+        threads = [Thread(target=work, args=(i * _MAX_VAL, removed[i]))
+                   for i in range(numThreads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        items = [item for out in removed for item in out]
+        while spq.size() > 0:
+            items.append(spq.remove())
+        self.assertEqual(list(range(numThreads * _MAX_VAL)), sorted(items))
+
+    def test_rank_error(self):
+        """Displays how far behind the true front relaxed removes are.
+
+        The rank of a removed item is the number of items in the queue
+        that were in front of it.
+        """
+        numItems = 20_000
+
+        header = ' shards   | mean     | max      '
+        hline = '----------+----------+----------'
+        print('', hline, header, hline, sep='\n')
+        for shards in [1, 2, 4, 8, 16]:
+            spq = ShardedPQ(shards=shards)
+            priorities = [random() for _ in range(numItems)]
+            for item, priority in enumerate(priorities):
+                spq.add(item, priority)
+            remaining = sorted(priorities)
+
+            ranks = []
+            for _ in range(numItems):
+                priority = priorities[spq.remove()]
+                rank = bisect_left(remaining, priority)
+                ranks.append(rank)
+                del remaining[rank]
+            print(' %8d | %8.3f | %8d ' % (shards, sum(ranks) / numItems, max(ranks)))
+
+    def test_time_threads(self):
+        """Displays the throughput of add/remove pairs with several threads.
+
+        Compares relaxed and strict sharded queues against a single
+        `ConcurrentPQ`. With the global interpreter lock, the threads do
+        not run Python code in parallel.
+        """
+        numOps = 20_000
+
+        structs = {
+            'Concurrent': lambda: ConcurrentPQ(),
+            'Sharded': lambda: ShardedPQ(shards=8),
+            'Strict': lambda: ShardedPQ(shards=8, strict=True),
+        }
+        header = ' threads  | ' + ' | '.join('%-10s' % name for name in structs) + ' '
+        hline = '----------+' + '+'.join(['------------'] * len(structs))
+        print('', hline, header.rstrip(), hline, sep='\n')
+        for numThreads in [1, 2, 4, 8]:
+            rates = []
+            for make in structs.values():
+                pq = make()
+                for item in range(1000):
+                    pq.add(-item - 1, random())
+                threads = [Thread(target=self._add_remove,
+                                  args=(pq, i * numOps, numOps // numThreads))
+                           for i in range(numThreads)]
+                startTime = perf_counter()
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                rates.append(numOps / (perf_counter() - startTime))
+            print(' %8d | ' % numThreads + ' | '.join('%10.0f' % rate for rate in rates))
+
+    # = = = = = = = = = = = = =
+    # PRIVATE UTILITY METHODS
+    # = = = = = = = = = = = = =
+
+    @staticmethod
+    def _add_remove(pq, start: int, numOps: int) -> None:
+        """Adds and then removes an item, `numOps` times.
+
+        Args:
+            pq: The priority queue to operate on.
+            start (:obj:`int`): The first item to add.
+            numOps (:obj:`int`): The number of add/remove pairs.
+        """
+        for item in range(start, start + numOps):
+            pq.add(item, random())
+            pq.remove()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `SharedHeapPQ`.
+
+Contains randomized testing against the reference priority queue, and a
+test that shares the queue between several processes.
+"""
+
+import unittest
+from multiprocessing import Process, Queue
+from random import random, randrange
+
+from ssds import SharedHeapPQ
+from ssds.reference import ReferencePQ
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be added."""
+
+_MAX_PRIORITY = 1000
+"""int: The maximum priority that can be assigned."""
+
+_NUM_PROCESSES = 4
+"""int: The number of worker processes."""
+
+
+def _produce(pq: SharedHeapPQ, start: int) -> None:
+    """Adds `_MAX_VAL` items, starting at `start`, to the queue."""
+    for item in range(start, start + _MAX_VAL):
+        pq.add(item, float(item % 997))
+    pq.close()
+
+
+def _consume(pq: SharedHeapPQ, results: Queue) -> None:
+    """Removes half of `_MAX_VAL` items from the queue."""
+    results.put([pq.remove() for _ in range(_MAX_VAL // 2)])
+    pq.close()
+
+
+class TestSharedHeapPQ(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_random(self):
+        for is_max in [False, True]:
+            shpq = SharedHeapPQ(_MAX_VAL, is_max)
+            npq = ReferencePQ(is_max)
+
+            for _ in range(20_000):
+                j = randrange(0, 3)
+                val = randrange(_MAX_VAL)
+                priority = random() * _MAX_PRIORITY
+                if j == 0:  # add
+                    if npq.contains(val):
+                        with self.assertRaises(ValueError):
+                            shpq.add(val, priority)
+                    else:
+                        shpq.add(val, priority)
+                        npq.add(val, priority)
+                elif j == 1:  # remove
+                    if npq.size() == 0:
+                        with self.assertRaises(RuntimeError):
+                            shpq.remove()
+                    else:
+                        self.assertEqual(npq.remove(), shpq.remove())
+                elif npq.contains(val):  # change_priority
+                    npq.change_priority(val, priority)
+                    shpq.change_priority(val, priority)
+
+            # A second view of the same memory sees the same queue
+            other = SharedHeapPQ.attach(shpq.name, shpq._lock)
+            self.assertEqual(npq.size(), other.size())
+            while npq.size() > 0:
+                self.assertEqual(npq.remove(), other.remove())
+            self.assertEqual(0, shpq.size())
+
+            other.close()
+            shpq.close()
+            shpq.unlink()
+
+    def test_processes(self):
+        shpq = SharedHeapPQ(_NUM_PROCESSES * _MAX_VAL)
+        results = Queue()
+
+        producers = [Process(target=_produce, args=(shpq, i * _MAX_VAL))
+                     for i in range(_NUM_PROCESSES)]
+        for process in producers:
+            process.start()
+        for process in producers:
+            process.join()
+        self.assertEqual(_NUM_PROCESSES * _MAX_VAL, shpq.size())
+
+        consumers = [Process(target=_consume, args=(shpq, results))
+                     for _ in range(_NUM_PROCESSES)]
+        for process in consumers:
+            process.start()
+        removed = [results.get(timeout=30) for _ in consumers]
+        for process in consumers:
+            process.join()
+
+        # Every process removes items in priority order
+        for items in removed:
+            priorities = [item % 997 for item in items]
+            self.assertEqual(sorted(priorities), priorities)
+        removed = [item for items in removed for item in items]
+        while shpq.size() > 0:
+            removed.append(shpq.remove())
+        self.assertEqual(list(range(_NUM_PROCESSES * _MAX_VAL)), sorted(removed))
+
+        shpq.close()
+        shpq.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Used to test the `TimerWheel`.
+
+Contains randomized testing against a dictionary of deadlines, with small
+wheels so that items move between wheels and through the overflow heap, and
+a comparison of timings against an `ArrayHeapPQ` used as a timer queue.
+"""
+
+import unittest
+from random import random, randrange
+from time import perf_counter
+
+from ssds import ArrayHeapPQ, TimerWheel
+
+_MAX_VAL = 1000
+"""int: Represents the maximum value that can be scheduled."""
+
+_MAX_DELAY = 200
+"""int: The maximum delay between the current time and a deadline."""
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    # = = = = = = = = = = = = =
+    # TESTS
+    # = = = = = = = = = = = = =
+
+    def test_basic(self):
+        wheel = TimerWheel(resolution=0.5, slots=4, levels=2)
+        for i in range(20):
+            wheel.schedule(i, 20 - i)
+        self.assertEqual(20, wheel.size())
+        self.assertEqual([19, 18], wheel.pop_expired(2))
+        self.assertEqual([], wheel.pop_expired(2.9))
+        self.assertEqual([17], wheel.pop_expired(3))
+        self.assertTrue(wheel.cancel(16))
+        self.assertFalse(wheel.cancel(16))
+        wheel.reschedule(0, 1)
+        self.assertEqual([0, 15, 14], wheel.pop_expired(6))
+        self.assertEqual(list(range(13, 0, -1)), wheel.pop_expired(100))
+        self.assertEqual(0, wheel.size())
+
+        with self.assertRaises(ValueError):
+            wheel.reschedule('a', 1)
+        wheel.schedule('a', 1)
+        with self.assertRaises(ValueError):
+            wheel.schedule('a', 2)
+        with self.assertRaises(ValueError):
+            TimerWheel(slots=6)
+        with self.assertRaises(ValueError):
+            TimerWheel(resolution=0)
+
+    def test_backwards(self):
+        wheel = TimerWheel(start=10)
+        wheel.schedule('a', 5)
+        wheel.schedule('b', 12.5)
+        self.assertEqual(['a'], wheel.pop_expired(12))
+        # Deadlines in the past are due straight away, even if time goes back
+        wheel.schedule('c', 3)
+        self.assertEqual(['c'], wheel.pop_expired(11))
+        self.assertEqual(['b'], wheel.pop_expired(13))
+
+    def test_random(self):
+        """Checks the wheel against a dictionary of deadlines.
+
+        The wheels only cover 64 ticks, so most deadlines start out in
+        the overflow heap or a higher wheel, and time sometimes jumps far
+        ahead.
+        """
+        for resolution in [0.25, 1, 7]:
+            wheel = TimerWheel(resolution, slots=4, levels=3, start=-3)
+            deadlines = {}
+            now = 0
+
+            for _ in range(50_000):
+                j = randrange(0, 5)
+                val = randrange(_MAX_VAL)
+                deadline = now + random() * _MAX_DELAY - 10
+                if j == 0:  # schedule
+                    if val in deadlines:
+                        with self.assertRaises(ValueError):
+                            wheel.schedule(val, deadline)
+                    else:
+                        wheel.schedule(val, deadline)
+                        deadlines[val] = deadline
+                elif j == 1:  # reschedule
+                    if val in deadlines:
+                        wheel.reschedule(val, deadline)
+                        deadlines[val] = deadline
+                    else:
+                        with self.assertRaises(ValueError):
+                            wheel.reschedule(val, deadline)
+                elif j == 2:  # cancel
+                    self.assertEqual(val in deadlines, wheel.cancel(val))
+                    deadlines.pop(val, None)
+                elif j == 3:  # pop_expired
+                    now += random() * (1000 if randrange(100) == 0 else 5)
+                    expected = sorted((item for item in deadlines
+                                       if deadlines[item] <= now),
+                                      key=deadlines.get)
+                    self.assertEqual(expected, wheel.pop_expired(now))
+                    for item in expected:
+                        del deadlines[item]
+                else:  # contains and size
+                    self.assertEqual(val in deadlines, wheel.contains(val))
+                    self.assertEqual(len(deadlines), wheel.size())
+
+            self.assertEqual(sorted(deadlines, key=deadlines.get),
+                             wheel.pop_expired(now + 10 ** 6))
+            self.assertEqual(0, wheel.size())
+
+    def test_time(self):
+        """Times a workload of timeouts that are mostly rescheduled.
+
+        Each step schedules a timeout, reschedules two earlier ones, and
+        expires whatever is due, as a connection timeout would be.
+        """
+        numSteps = 200_000
+        delays = [random() * 30 for _ in range(3 * numSteps)]
+
+        # The wheel, with millisecond ticks
+        startTime = perf_counter()
+        wheel = TimerWheel(resolution=0.001)
+        expiredWheel = 0
+        for step in range(numSteps):
+            now = step * 0.0001
+            wheel.schedule(step, now + delays[3 * step])
+            for other in (step >> 1, step >> 2):
+                if wheel.contains(other):
+                    wheel.reschedule(other, now + delays[3 * step + 1])
+            expiredWheel += len(wheel.pop_expired(now))
+        wheelTime = perf_counter() - startTime
+
+        # An ArrayHeapPQ used as a timer queue
+        startTime = perf_counter()
+        pq = ArrayHeapPQ()
+        expiredHeap = 0
+        for step in range(numSteps):
+            now = step * 0.0001
+            pq.add(step, now + delays[3 * step])
+            for other in (step >> 1, step >> 2):
+                if pq.contains(other):
+                    pq.change_priority(other, now + delays[3 * step + 1])
+            expiredHeap += len(pq.pop_until(now))
+        heapTime = perf_counter() - startTime
+
+        self.assertEqual(expiredHeap, expiredWheel)
+        print()
+        print('TimerWheel:  %.3f s for %d steps' % (wheelTime, numSteps))
+        print('ArrayHeapPQ: %.3f s for %d steps' % (heapTime, numSteps))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,17 @@
 from tests import TestArrayHeapPQ
+from tests import TestDaryHeapPQ
+from tests import TestNumericHeapPQ
+from tests import TestPairingHeapPQ
+from tests import TestRadixHeapPQ
+from tests import TestBucketPQ
+from tests import TestConcurrentPQ
+from tests import TestAsyncPQ
+from tests import TestSharedHeapPQ
+from tests import TestShardedPQ
+from tests import TestExternalPQ
+from tests import TestBenchmarks
+from tests import TestInstrumentedPQ
+from tests import TestCompactHeapPQ
+from tests import TestMinMaxHeapPQ
+from tests import TestTimerWheel
+from tests import TestBoundedPQ